@@ -0,0 +1,339 @@
+import argparse
+import random
+import threading
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from string import Template
+from types import TracebackType
+from typing import Self, cast, override
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Especificações de cada produto além das variáveis pelo índice
+_SPEC_NAMES = ("Material", "Cor", "Largura", "Altura", "Profundidade", "Peso")
+_COLORS = ("Branco", "Preto", "Natural", "Cinza", "Azul")
+_MATERIALS = ("Madeira", "Metal", "Plástico", "Vidro")
+
+
+@dataclass(frozen=True, slots=True)
+class FakeStoreConfig:
+    """
+    Parâmetros da loja simulada.
+
+    Atributos:
+        pages: Quantidade de páginas de busca com produtos.
+        products_per_page: Produtos por página de busca.
+        latency: Atraso, em segundos, antes de cada resposta.
+        error_rate: Fração das requisições respondidas com 503 (0 a 1).
+        reviews: Avaliações por página de produto, para controlar o tamanho.
+        seed: Semente do sorteio de erros, para execuções reprodutíveis.
+    """
+
+    pages: int = 10
+    products_per_page: int = 24
+    latency: float = 0.0
+    error_rate: float = 0.0
+    reviews: int = 50
+    seed: int = 0
+
+    @property
+    def product_count(self) -> int:
+        """
+        Retorna o total de produtos da loja.
+        """
+        return self.pages * self.products_per_page
+
+
+@cache
+def _template(name: str) -> Template:
+    """
+    Carrega um fixture de HTML como Template.
+
+    Args:
+        name: Nome do arquivo em fixtures/.
+    """
+    return Template((FIXTURES_DIR / name).read_text(encoding="utf-8"))
+
+
+def _money(value: float) -> str:
+    """
+    Formata um valor no padrão brasileiro (ex.: 1.234,56).
+
+    Args:
+        value: Valor a formatar.
+    """
+    return f"{value:,.2f}".replace(",", "_").replace(".", ",").replace("_", ".")
+
+
+def product_url(index: int) -> str:
+    """
+    Retorna o caminho da página do produto de índice informado.
+
+    Args:
+        index: Índice do produto, a partir de 0.
+    """
+    return f"/produto-{index}"
+
+
+def render_search_page(config: FakeStoreConfig, query: str, page: int) -> str:
+    """
+    Monta uma página de busca; após a última página, sem produtos.
+
+    Args:
+        config: Parâmetros da loja.
+        query: Termo de busca, apenas exibido na página.
+        page: Número da página, a partir de 1.
+    """
+    items: list[str] = []
+    if 1 <= page <= config.pages:
+        first: int = (page - 1) * config.products_per_page
+        for index in range(first, first + config.products_per_page):
+            price: float = 100 + (index % 900) + 0.9
+            installments: int = 2 + index % 11
+            items.append(
+                _template("search_item.html").substitute(
+                    sku=f"SKU{index:06d}",
+                    position=index - first + 1,
+                    url=product_url(index),
+                    title=f"Produto {index} de {_MATERIALS[index % len(_MATERIALS)]}",
+                    from_price=_money(price * 1.2),
+                    price=_money(price),
+                    price_pix=_money(price * 0.95),
+                    installments=installments,
+                    installment_amount=_money(price / installments),
+                )
+            )
+    pagination: str = "\n".join(
+        f'      <li><a href="/search?q={query}&amp;page={number}">{number}</a></li>'
+        for number in range(1, config.pages + 1)
+    )
+    return _template("search_page.html").substitute(
+        query=query, items="".join(items), pagination=pagination
+    )
+
+
+def render_product_page(config: FakeStoreConfig, index: int) -> str:
+    """
+    Monta a página de detalhe de um produto.
+
+    Args:
+        config: Parâmetros da loja.
+        index: Índice do produto, a partir de 0.
+    """
+    values: tuple[str, ...] = (
+        _MATERIALS[index % len(_MATERIALS)],
+        _COLORS[index % len(_COLORS)],
+        f"{40 + index % 60} cm",
+        f"{70 + index % 40} cm",
+        f"{30 + index % 20} cm",
+        f"{1 + index % 15} kg",
+    )
+    rows: str = "".join(
+        _template("spec_row.html").substitute(name=name, value=value)
+        for name, value in zip(_SPEC_NAMES, values, strict=True)
+    )
+    reviews: str = "".join(
+        _template("review.html").substitute(number=number)
+        for number in range(config.reviews)
+    )
+    return _template("product_page.html").substitute(
+        sku=f"SKU{index:06d}",
+        title=f"Produto {index} de {values[0]}",
+        price=_money(100 + (index % 900) + 0.9),
+        rows=rows,
+        reviews=reviews,
+    )
+
+
+class _FakeStoreHandler(BaseHTTPRequestHandler):
+    """
+    Responde às páginas de busca e de produto da loja simulada.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    @override
+    def log_message(self, format: str, *args: object) -> None:
+        """
+        Silencia o log de cada requisição.
+        """
+
+    def do_GET(self) -> None:
+        """
+        Atende uma requisição GET, com atraso e erros conforme a configuração.
+        """
+        store: _FakeStoreServer = cast("_FakeStoreServer", self.server)
+        if store.config.latency > 0:
+            time.sleep(store.config.latency)
+        if store.should_fail():
+            self._send(503, "")
+            return
+        url = urlparse(self.path)
+        if url.path == "/search":
+            parameters: dict[str, list[str]] = parse_qs(url.query)
+            page: int = int(parameters.get("page", ["1"])[0])
+            query: str = parameters.get("q", [""])[0]
+            self._send(200, render_search_page(store.config, query, page))
+        elif url.path.startswith("/produto-"):
+            index: int = int(url.path.removeprefix("/produto-"))
+            self._send(200, render_product_page(store.config, index))
+        else:
+            self._send(404, "")
+
+    def _send(self, status: int, body: str) -> None:
+        """
+        Envia a resposta com o corpo informado.
+
+        Args:
+            status: Código de status HTTP.
+            body: Corpo HTML da resposta.
+        """
+        data: bytes = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class _FakeStoreServer(ThreadingHTTPServer):
+    """
+    Servidor HTTP da loja simulada, com contadores de requisições.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], config: FakeStoreConfig) -> None:
+        """
+        Inicializa o servidor.
+
+        Args:
+            address: Endereço e porta de escuta.
+            config: Parâmetros da loja.
+        """
+        super().__init__(address, _FakeStoreHandler)
+        self.config: FakeStoreConfig = config
+        self.requests: int = 0
+        self.errors: int = 0
+        self._random: random.Random = random.Random(config.seed)  # noqa: S311
+        self._lock: threading.Lock = threading.Lock()
+
+    def should_fail(self) -> bool:
+        """
+        Conta a requisição e sorteia se ela deve falhar.
+        """
+        with self._lock:
+            self.requests += 1
+            failed: bool = self._random.random() < self.config.error_rate
+            if failed:
+                self.errors += 1
+            return failed
+
+
+class FakeStore:
+    """
+    Loja simulada servida localmente, com páginas no formato da lojamaeto.com.
+
+    As páginas são montadas a partir dos fixtures de HTML, de modo que os
+    benchmarks rodem sem acesso à rede. A latência, a quantidade de páginas e
+    a taxa de erro são configuráveis.
+    """
+
+    def __init__(
+        self, config: FakeStoreConfig, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        """
+        Cria o servidor; com porta 0, uma porta livre é escolhida.
+
+        Args:
+            config: Parâmetros da loja.
+            host: Endereço de escuta.
+            port: Porta de escuta.
+        """
+        self._server: _FakeStoreServer = _FakeStoreServer((host, port), config)
+        self._thread: threading.Thread = threading.Thread(
+            target=self._server.serve_forever, name="fake-store", daemon=True
+        )
+
+    @property
+    def base_url(self) -> str:
+        """
+        Retorna a URL base do servidor.
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @property
+    def requests(self) -> int:
+        """
+        Retorna a quantidade de requisições recebidas.
+        """
+        return self._server.requests
+
+    @property
+    def errors(self) -> int:
+        """
+        Retorna a quantidade de requisições respondidas com erro.
+        """
+        return self._server.errors
+
+    def start(self) -> None:
+        """
+        Começa a atender requisições em uma thread.
+        """
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """
+        Atende requisições na thread atual até o servidor ser parado.
+        """
+        self._server.serve_forever()
+
+    def close(self) -> None:
+        """
+        Para o servidor e libera a porta.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def main() -> None:
+    """Serve a loja simulada até Ctrl+C."""
+    parser = argparse.ArgumentParser(description="Loja simulada para benchmarks.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--products-per-page", type=int, default=24)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    arguments = parser.parse_args()
+    config = FakeStoreConfig(
+        pages=arguments.pages,
+        products_per_page=arguments.products_per_page,
+        latency=arguments.latency,
+        error_rate=arguments.error_rate,
+    )
+    store = FakeStore(config, port=arguments.port)
+    print(f"Loja simulada em {store.base_url}")
+    with suppress(KeyboardInterrupt):
+        store.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
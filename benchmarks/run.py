@@ -0,0 +1,371 @@
+import argparse
+import io
+import json
+import multiprocessing
+import sqlite3
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from application.services import ProcessScrappingService
+from domain.models import Product
+from infrastructure.repositories import SqliteProductRepository
+from infrastructure.scrapper import (
+    PARSER_BACKENDS,
+    LojaMaetoScraper,
+    PageParser,
+    RequestsHttpClient,
+    create_parser,
+)
+
+from benchmarks.fake_store import (
+    FakeStore,
+    FakeStoreConfig,
+    product_url,
+    render_product_page,
+    render_search_page,
+)
+
+STAGES: tuple[str, ...] = ("http", "parse", "persist", "end-to-end")
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    """
+    Resultado de um benchmark.
+
+    Atributos:
+        name: Nome do benchmark (etapa ou "end-to-end").
+        seconds: Tempo total medido.
+        peak_rss_mb: Pico de memória residente do processo do benchmark.
+        metrics: Métricas específicas (pages_per_s, products_per_s etc.).
+    """
+
+    name: str
+    seconds: float
+    peak_rss_mb: float
+    metrics: dict[str, float] = field(default_factory=dict[str, float])
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkOptions:
+    """
+    Configuração de uma execução dos benchmarks.
+
+    Atributos:
+        store: Parâmetros da loja simulada.
+        parser: Backend de parsing.
+        partial_parse: Se True, usa o parsing parcial.
+        detail_workers: Páginas de detalhe buscadas em paralelo por página.
+        fetch_workers: Threads da etapa de busca do pipeline.
+        pipeline_detail_workers: Threads da etapa de detalhes do pipeline.
+        parse_iterations: Repetições do benchmark de parsing.
+        persist_rows: Produtos gravados no benchmark de persistência.
+    """
+
+    store: FakeStoreConfig
+    parser: str = "auto"
+    partial_parse: bool = False
+    detail_workers: int = 8
+    fetch_workers: int = 2
+    pipeline_detail_workers: int = 2
+    parse_iterations: int = 50
+    persist_rows: int = 20_000
+
+
+def _peak_rss_mb() -> float:
+    """
+    Retorna o pico de memória residente do processo atual, em MB.
+
+    Em sistemas sem o módulo resource (Windows), retorna 0.
+    """
+    if sys.platform == "win32":
+        return 0.0
+    import resource
+
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KB; macOS, em bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _rate(count: float, seconds: float) -> float:
+    """
+    Calcula uma taxa por segundo, tolerando tempo zero.
+
+    Args:
+        count: Quantidade medida.
+        seconds: Tempo decorrido.
+    """
+    return count / seconds if seconds > 0 else 0.0
+
+
+def _create_parser(options: BenchmarkOptions) -> PageParser:
+    """
+    Cria o backend de parsing da execução.
+
+    Args:
+        options: Configuração da execução.
+    """
+    return create_parser(options.parser, partial=options.partial_parse)
+
+
+def bench_http(options: BenchmarkOptions) -> BenchmarkResult:
+    """
+    Mede apenas o download das páginas de busca e de produto.
+
+    Args:
+        options: Configuração da execução.
+    """
+    config: FakeStoreConfig = options.store
+    workers: int = options.detail_workers
+    with (
+        FakeStore(config) as store,
+        RequestsHttpClient(pool_size=workers, max_retries=0) as client,
+    ):
+        urls: list[str] = [
+            f"{store.base_url}/search?q=casa&page={page}"
+            for page in range(1, config.pages + 1)
+        ] + [
+            f"{store.base_url}{product_url(index)}"
+            for index in range(config.product_count)
+        ]
+        start: float = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            sizes: list[int] = [
+                len(response.text) for response in executor.map(client.fetch, urls)
+            ]
+        seconds: float = time.perf_counter() - start
+        errors: int = store.errors
+    return BenchmarkResult(
+        name="http",
+        seconds=seconds,
+        peak_rss_mb=_peak_rss_mb(),
+        metrics={
+            "pages": len(urls),
+            "pages_per_s": _rate(len(urls), seconds),
+            "errors": errors,
+            "mb_per_s": _rate(sum(sizes) / 1_000_000, seconds),
+        },
+    )
+
+
+def bench_parse(options: BenchmarkOptions) -> BenchmarkResult:
+    """
+    Mede apenas o parsing de páginas de busca e de produto já baixadas.
+
+    Args:
+        options: Configuração da execução.
+    """
+    config: FakeStoreConfig = options.store
+    parser: PageParser = _create_parser(options)
+    search_html: str = render_search_page(config, "casa", 1)
+    product_html: str = render_product_page(config, 0)
+    iterations: int = options.parse_iterations
+
+    start: float = time.perf_counter()
+    for _ in range(iterations):
+        parser.parse_listing(search_html, "http://localhost")
+    search_seconds: float = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        parser.parse_specifications(product_html)
+    product_seconds: float = time.perf_counter() - start
+
+    seconds: float = search_seconds + product_seconds
+    return BenchmarkResult(
+        name="parse",
+        seconds=seconds,
+        peak_rss_mb=_peak_rss_mb(),
+        metrics={
+            "search_ms_per_page": search_seconds * 1000 / iterations,
+            "product_ms_per_page": product_seconds * 1000 / iterations,
+            "pages_per_s": _rate(2 * iterations, seconds),
+            "products_per_s": _rate(
+                iterations * config.products_per_page, search_seconds
+            ),
+        },
+    )
+
+
+def bench_persist(options: BenchmarkOptions) -> BenchmarkResult:
+    """
+    Mede apenas a gravação de produtos no SQLite.
+
+    Args:
+        options: Configuração da execução.
+    """
+    products: list[Product] = [
+        Product(
+            sku=f"SKU{index:06d}",
+            product_title=f"Produto {index}",
+            price=100.0 + index,
+            price_pix=95.0 + index,
+            price_installments=10.0 + index,
+            installments_count=10,
+            specifications={"Material": "Madeira", "Cor": "Branco"},
+        )
+        for index in range(options.persist_rows)
+    ]
+    with (
+        tempfile.TemporaryDirectory() as directory,
+        SqliteProductRepository(str(Path(directory) / "bench.db")) as repository,
+    ):
+        start: float = time.perf_counter()
+        rows: int = repository.upsert_many(products)
+        seconds: float = time.perf_counter() - start
+    return BenchmarkResult(
+        name="persist",
+        seconds=seconds,
+        peak_rss_mb=_peak_rss_mb(),
+        metrics={"rows": rows, "rows_per_s": _rate(rows, seconds)},
+    )
+
+
+def bench_end_to_end(options: BenchmarkOptions) -> BenchmarkResult:
+    """
+    Mede o caminho completo de ProcessScrappingService.process.
+
+    Args:
+        options: Configuração da execução.
+    """
+    config: FakeStoreConfig = options.store
+    with (
+        tempfile.TemporaryDirectory() as directory,
+        FakeStore(config) as store,
+        RequestsHttpClient(
+            pool_size=options.detail_workers * options.pipeline_detail_workers
+            + options.fetch_workers
+        ) as client,
+        SqliteProductRepository(str(Path(directory) / "bench.db")) as repository,
+    ):
+        scraper = LojaMaetoScraper(
+            client,
+            max_workers=options.detail_workers,
+            parser=_create_parser(options),
+            base_url=store.base_url,
+        )
+        service = ProcessScrappingService(
+            repository,
+            scraper,
+            fetch_workers=options.fetch_workers,
+            detail_workers=options.pipeline_detail_workers,
+        )
+        start: float = time.perf_counter()
+        # O serviço informa cada produto processado; a saída não é medida
+        with redirect_stdout(io.StringIO()):
+            service.process("casa")
+        seconds: float = time.perf_counter() - start
+        pages: int = store.requests
+        with sqlite3.connect(Path(directory) / "bench.db") as conn:
+            rows: int = conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+    return BenchmarkResult(
+        name="end-to-end",
+        seconds=seconds,
+        peak_rss_mb=_peak_rss_mb(),
+        metrics={
+            "pages": pages,
+            "pages_per_s": _rate(pages, seconds),
+            "products": rows,
+            "products_per_s": _rate(rows, seconds),
+            "rows_per_s": _rate(rows, seconds),
+        },
+    )
+
+
+BENCHMARKS: dict[str, Callable[[BenchmarkOptions], BenchmarkResult]] = {
+    "http": bench_http,
+    "parse": bench_parse,
+    "persist": bench_persist,
+    "end-to-end": bench_end_to_end,
+}
+
+
+def run_isolated(stage: str, options: BenchmarkOptions) -> BenchmarkResult:
+    """
+    Executa um benchmark em um processo novo, para medir o pico de memória
+    apenas dele.
+
+    Args:
+        stage: Nome do benchmark (ver STAGES).
+        options: Configuração da execução.
+    """
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return executor.submit(BENCHMARKS[stage], options).result()
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Lê os argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Benchmarks offline do scraper contra uma loja simulada."
+    )
+    parser.add_argument(
+        "--stage",
+        choices=STAGES,
+        action="append",
+        help="Benchmark a executar (pode repetir; padrão: todos).",
+    )
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--products-per-page", type=int, default=24)
+    parser.add_argument("--latency", type=float, default=0.0, metavar="SEGUNDOS")
+    parser.add_argument("--error-rate", type=float, default=0.0, metavar="FRAÇÃO")
+    parser.add_argument("--parser", choices=PARSER_BACKENDS, default="auto")
+    parser.add_argument("--partial-parse", action="store_true")
+    parser.add_argument("--detail-workers", type=int, default=8)
+    parser.add_argument("--parse-iterations", type=int, default=50)
+    parser.add_argument("--persist-rows", type=int, default=20_000)
+    parser.add_argument(
+        "--json", metavar="ARQUIVO", help="Grava os resultados em JSON (ex.: no CI)."
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Executa os benchmarks selecionados e exibe o resumo."""
+    arguments: argparse.Namespace = parse_arguments()
+    options = BenchmarkOptions(
+        store=FakeStoreConfig(
+            pages=arguments.pages,
+            products_per_page=arguments.products_per_page,
+            latency=arguments.latency,
+            error_rate=arguments.error_rate,
+        ),
+        parser=arguments.parser,
+        partial_parse=arguments.partial_parse,
+        detail_workers=arguments.detail_workers,
+        parse_iterations=arguments.parse_iterations,
+        persist_rows=arguments.persist_rows,
+    )
+    results: list[BenchmarkResult] = []
+    for stage in arguments.stage or STAGES:
+        result: BenchmarkResult = run_isolated(stage, options)
+        results.append(result)
+        metrics: str = "  ".join(
+            f"{name}={value:,.2f}" for name, value in result.metrics.items()
+        )
+        print(
+            f"{result.name:<11} {result.seconds:8.3f}s  "
+            f"rss={result.peak_rss_mb:,.1f}MB  {metrics}"
+        )
+    if arguments.json:
+        Path(arguments.json).write_text(
+            json.dumps(
+                {
+                    "options": asdict(options),
+                    "results": [asdict(result) for result in results],
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,10 @@ def create_database(db_path: str = "products.db") -> None:
                 price_pix REAL NOT NULL,
                 price_installments REAL NOT NULL,
                 installments_count INTEGER NOT NULL,
-                specifications TEXT NOT NULL
+                specifications TEXT NOT NULL,
+                listing_fingerprint TEXT,
+                specs_updated_at TEXT,
+                updated_at TEXT
             )
         """)
         conn.commit()
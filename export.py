@@ -0,0 +1,119 @@
+import argparse
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from application.services import ExportProductsService
+from infrastructure.exporters import EXPORT_FORMATS, create_exporter
+from infrastructure.repositories import SqliteProductRepository
+from infrastructure.validations.exceptions import InfrastructureError
+
+if TYPE_CHECKING:
+    from application.interfaces import IExportProducts
+    from domain.interfaces import IProductExporter
+
+VERDE = "\033[32m"
+AMARELO = "\033[33m"
+VERMELHO = "\033[31m"
+RESET = "\033[0m"
+
+# Produtos lidos do banco e gravados no arquivo por vez
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def parse_moment(value: str) -> datetime:
+    """Converte uma data ou data e hora ISO (ex.: 2025-01-31) para UTC."""
+    moment: datetime = (
+        datetime.fromisoformat(value)
+        if "T" in value or " " in value
+        else datetime.combine(date.fromisoformat(value), datetime.min.time())
+    )
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=UTC)
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Lê os argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Exporta os produtos de products.db para JSONL, CSV ou Parquet."
+    )
+    parser.add_argument(
+        "output", help="Arquivo de destino (ex.: produtos.jsonl, produtos.csv)."
+    )
+    parser.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        help="Formato do arquivo (padrão: pela extensão do destino).",
+    )
+    parser.add_argument(
+        "--spec-column",
+        action="append",
+        default=[],
+        metavar="NOME",
+        help="Especificação exportada como coluna no CSV/Parquet (repetível).",
+    )
+    parser.add_argument(
+        "--query",
+        metavar="PALAVRAS",
+        help="Exporta só os produtos cujo título contém essas palavras.",
+    )
+    parser.add_argument(
+        "--updated-since",
+        type=parse_moment,
+        metavar="DATA",
+        help="Exporta só os produtos gravados a partir desta data (ISO, UTC).",
+    )
+    parser.add_argument(
+        "--updated-until",
+        type=parse_moment,
+        metavar="DATA",
+        help="Exporta só os produtos gravados antes desta data (ISO, UTC).",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        metavar="N",
+        help="Produtos lidos e gravados por vez.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Exporta os produtos gravados pela coleta."""
+    arguments: argparse.Namespace = parse_arguments()
+    export_format: str = arguments.format or Path(arguments.output).suffix.lstrip(".")
+    if export_format not in EXPORT_FORMATS:
+        print(
+            f"{VERMELHO}Informe --format ({', '.join(EXPORT_FORMATS)}): "
+            f"extensão desconhecida em {arguments.output}{RESET}"
+        )
+        return
+
+    try:
+        with SqliteProductRepository("products.db") as repository:
+            service: IExportProducts = ExportProductsService(
+                repository, chunk_size=arguments.chunk_size
+            )
+            exporter: IProductExporter = create_exporter(
+                export_format, arguments.output, arguments.spec_column
+            )
+            try:
+                total: int = service.export(
+                    exporter,
+                    search_text=arguments.query,
+                    updated_since=arguments.updated_since,
+                    updated_until=arguments.updated_until,
+                )
+            finally:
+                exporter.close()
+        print(f"{VERDE}{total} produtos exportados para {arguments.output}{RESET}")
+
+    except KeyboardInterrupt:
+        print(f"\n{AMARELO}  Exportação interrompida pelo usuário{RESET}")
+
+    except (InfrastructureError, OSError) as error:
+        print(f"{VERMELHO}Erro durante a exportação: {error}{RESET}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,48 @@
-import sys
+import argparse
+from collections.abc import Generator, Iterator
+from contextlib import AbstractContextManager, ExitStack, contextmanager, nullcontext
+from datetime import timedelta
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from application.services import ProcessScrappingService
 from domain.validations.exceptions import DomainValidationError
-from infrastructure.repositories import SqliteProductRepository
-from infrastructure.scrapper import LojaMaetoScraper, RequestsHttpClient
+from infrastructure.metrics import MetricsRegistry
+from infrastructure.repositories import (
+    SqliteCrawlCheckpointRepository,
+    SqliteProductRepository,
+    WriteBehindCheckpointRepository,
+    WriteBehindProductRepository,
+)
+from infrastructure.scrapper import (
+    ARCHIVE_CODECS,
+    PARSER_BACKENDS,
+    ArchiveReplayHttpClient,
+    ArchivingHttpClient,
+    BaseHttpClient,
+    CachingHttpClient,
+    CircuitBreakerHttpClient,
+    HedgedHttpClient,
+    InstrumentedHttpClient,
+    LojaMaetoScraper,
+    PageArchive,
+    PageParser,
+    ProcessPoolPageParser,
+    RateLimitedHttpClient,
+    RequestsHttpClient,
+    create_parser,
+)
 from infrastructure.validations.exceptions import InfrastructureError
 
 if TYPE_CHECKING:
     from application.interfaces import IProcessWebScrapping
-    from domain.interfaces import IHttpClient, IProductRepository, IWebScraper
+    from domain.interfaces import (
+        ICrawlCheckpointRepository,
+        IHttpClient,
+        IMetrics,
+        IProductRepository,
+        IWebScraper,
+    )
 
 VERDE = "\033[32m"
 AMARELO = "\033[33m"
@@ -17,44 +50,374 @@ VERMELHO = "\033[31m"
 RESET = "\033[0m"
 CINZA = "\033[2m"
 
+# Máximo de páginas de detalhe buscadas em paralelo por página de busca
+MAX_DETAIL_WORKERS = 8
+
+# Threads por etapa do pipeline (busca, parsing, detalhes e gravação) e
+# capacidade das filas entre elas
+PIPELINE_FETCH_WORKERS = 4
+PIPELINE_PARSE_WORKERS = 1
+PIPELINE_DETAIL_WORKERS = 2
+PIPELINE_PERSIST_WORKERS = 1
+PIPELINE_QUEUE_SIZE = 2
+
+# Gravação em segundo plano: produtos aguardando na fila, produtos por
+# transação e tempo máximo, em segundos, até a gravação de um lote
+WRITE_BEHIND_MAX_PENDING = 10_000
+WRITE_BEHIND_BATCH_SIZE = 1000
+WRITE_BEHIND_FLUSH_INTERVAL = 1.0
+
+# Limites por host ajustados automaticamente (AIMD): requisições simultâneas
+# e por segundo iniciais e máximas
+RATE_LIMIT_INITIAL_CONCURRENCY = 4
+RATE_LIMIT_MAX_CONCURRENCY = MAX_DETAIL_WORKERS * PIPELINE_DETAIL_WORKERS
+RATE_LIMIT_INITIAL_RATE = 10.0
+RATE_LIMIT_MAX_RATE = 100.0
+
+# Conexões mantidas por host e threads do hedging: o dobro das requisições
+# simultâneas do pipeline, com folga para as cópias e as requisições abandonadas
+HTTP_POOL_SIZE = 2 * (
+    MAX_DETAIL_WORKERS * PIPELINE_DETAIL_WORKERS + PIPELINE_FETCH_WORKERS
+)
+
+# Hedging: uma cópia da requisição é enviada quando ela passa do percentil das
+# latências recentes da sua classe de URL, em no máximo HEDGE_MAX_RATIO das
+# requisições; sem resposta dentro do prazo (em segundos) da classe, a
+# requisição falha e o item é ignorado. A espera por vaga no limitador não
+# conta para o percentil nem para o prazo
+HEDGE_PERCENTILE = 0.95
+HEDGE_MAX_RATIO = 0.1
+HTTP_DEADLINES = {"search": 60.0, "product": 30.0}
+
+# Circuit breaker: falhas seguidas de um host que pausam as requisições a ele
+# e a primeira pausa, em segundos (dobra a cada nova falha, até o máximo).
+# Durante a pausa as requisições aguardam, no máximo CIRCUIT_BREAKER_MAX_WAIT
+# segundos; depois disso falham e o item fica para o --resume
+CIRCUIT_BREAKER_FAILURES = 5
+CIRCUIT_BREAKER_RESET = 10.0
+CIRCUIT_BREAKER_MAX_RESET = 120.0
+CIRCUIT_BREAKER_MAX_WAIT = 60.0
+
+# Cache em disco das respostas HTTP e validade, em segundos, por classe de URL.
+# Com validade zero a página é sempre revalidada (If-None-Match/If-Modified-Since).
+HTTP_CACHE_DIR = ".http_cache"
+HTTP_CACHE_TTL = {"search": 0.0, "product": 6 * 60 * 60.0}
+
+# Idade máxima padrão, em dias, das especificações no modo incremental
+DEFAULT_SPECS_MAX_AGE_DAYS = 7.0
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Lê os argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Coleta produtos da Loja Maeto e os grava em products.db."
+    )
+    parser.add_argument(
+        "search_queries", nargs="*", metavar="search_query", help="Termos de busca."
+    )
+    parser.add_argument(
+        "--queries-file",
+        metavar="ARQUIVO",
+        help="Arquivo com um termo de busca por linha (# inicia comentários).",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Só busca a página de detalhe de produtos novos ou alterados.",
+    )
+    parser.add_argument(
+        "--specs-max-age",
+        type=float,
+        default=DEFAULT_SPECS_MAX_AGE_DAYS,
+        metavar="DIAS",
+        help="No modo incremental, recoleta especificações mais antigas que isso.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Retoma a coleta interrompida de cada termo a partir do checkpoint.",
+    )
+    parser.add_argument(
+        "--parser",
+        choices=PARSER_BACKENDS,
+        default="auto",
+        help="Backend de parsing do HTML (padrão: o mais rápido instalado).",
+    )
+    parser.add_argument(
+        "--partial-parse",
+        action="store_true",
+        help="Monta a árvore só dos cards de produto e da tabela de especificações.",
+    )
+    parser.add_argument(
+        "--parse-processes",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Faz o parsing do HTML em N processos (0: nas próprias threads).",
+    )
+    parser.add_argument(
+        "--archive",
+        metavar="DIRETÓRIO",
+        help="Arquiva o HTML das páginas coletadas, comprimido, neste diretório.",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="DIRETÓRIO",
+        help=(
+            "Refaz a extração e a gravação a partir das páginas arquivadas, "
+            "sem acessar o site."
+        ),
+    )
+    parser.add_argument(
+        "--archive-codec",
+        choices=ARCHIVE_CODECS,
+        default="auto",
+        help="Compressão do arquivo de páginas (padrão: zstd, se instalado).",
+    )
+    parser.add_argument(
+        "--metrics-json",
+        metavar="ARQUIVO",
+        help="Ao final, grava um resumo JSON das métricas da execução.",
+    )
+    parser.add_argument(
+        "--metrics-prom",
+        metavar="ARQUIVO",
+        help="Ao final, grava as métricas no formato textfile do Prometheus.",
+    )
+    arguments: argparse.Namespace = parser.parse_args()
+    if arguments.archive and arguments.replay:
+        parser.error("--archive e --replay não podem ser usados juntos.")
+    return arguments
+
+
+def read_queries(arguments: argparse.Namespace) -> list[str]:
+    """Reúne os termos dos argumentos e do arquivo, sem repetições."""
+    queries: list[str] = list(arguments.search_queries)
+    if arguments.queries_file:
+        with Path(arguments.queries_file).open(encoding="utf-8") as file:
+            stripped: Iterator[str] = (line.strip() for line in file)
+            queries.extend(
+                query for query in stripped if query and not query.startswith("#")
+            )
+    return list(dict.fromkeys(queries))
+
+
+def export_metrics(
+    arguments: argparse.Namespace,
+    metrics_registry: MetricsRegistry,
+    caching_client: CachingHttpClient | None,
+) -> None:
+    """Grava as métricas nos arquivos solicitados, incluindo as do cache."""
+    if caching_client is not None:
+        stats = caching_client.stats
+        metrics_registry.set_gauge("http_cache_hits", stats.hits)
+        metrics_registry.set_gauge("http_cache_revalidations", stats.revalidations)
+        metrics_registry.set_gauge("http_cache_misses", stats.misses)
+        metrics_registry.set_gauge("http_cache_evictions", stats.evictions)
+        metrics_registry.set_gauge("http_cache_size_bytes", stats.size_bytes)
+    try:
+        if arguments.metrics_json:
+            metrics_registry.write_json(arguments.metrics_json)
+        if arguments.metrics_prom:
+            metrics_registry.write_prometheus_textfile(arguments.metrics_prom)
+    except OSError as error:
+        print(f"{VERMELHO}Erro ao gravar as métricas: {error}{RESET}")
+
+
+def build_parser(arguments: argparse.Namespace) -> AbstractContextManager[PageParser]:
+    """Cria o backend de parsing, em um pool de processos se solicitado."""
+    if arguments.parse_processes > 0:
+        return ProcessPoolPageParser(
+            arguments.parser,
+            partial=arguments.partial_parse,
+            max_workers=arguments.parse_processes,
+        )
+    return nullcontext(create_parser(arguments.parser, partial=arguments.partial_parse))
+
+
+@contextmanager
+def open_http_client(
+    arguments: argparse.Namespace, metrics: "IMetrics"
+) -> Generator[tuple[BaseHttpClient, CachingHttpClient | None]]:
+    """
+    Cria o cliente HTTP da coleta e o cache usado por ele, se houver.
+
+    Com --replay, as páginas vêm do arquivo, sem rede nem cache; com
+    --archive, as páginas coletadas são arquivadas.
+    """
+    with ExitStack() as stack:
+        if arguments.replay:
+            archive: PageArchive = stack.enter_context(PageArchive(arguments.replay))
+            replay_client = ArchiveReplayHttpClient(archive)
+            yield replay_client, None
+            if replay_client.misses:
+                print(
+                    f"{AMARELO}   {replay_client.misses} páginas não estavam "
+                    f"no arquivo{RESET}"
+                )
+            return
+
+        requests_client: RequestsHttpClient = stack.enter_context(
+            RequestsHttpClient(
+                pool_size=HTTP_POOL_SIZE,
+                # 429 e 503 ficam para o limitador, que respeita o Retry-After
+                retry_status_codes=(500, 502, 504),
+            )
+        )
+        caching_client: CachingHttpClient = stack.enter_context(
+            CachingHttpClient(
+                # O circuit breaker e o hedging ficam acima do limitador: as
+                # requisições em espera durante a pausa não ocupam vagas dele,
+                # e cada cópia do hedging ocupa a sua
+                CircuitBreakerHttpClient(
+                    HedgedHttpClient(
+                        RateLimitedHttpClient(
+                            InstrumentedHttpClient(
+                                requests_client,
+                                metrics,
+                                url_classifier=LojaMaetoScraper.classify_url,
+                            ),
+                            initial_concurrency=RATE_LIMIT_INITIAL_CONCURRENCY,
+                            max_concurrency=RATE_LIMIT_MAX_CONCURRENCY,
+                            initial_rate=RATE_LIMIT_INITIAL_RATE,
+                            max_rate=RATE_LIMIT_MAX_RATE,
+                            metrics=metrics,
+                        ),
+                        hedge_percentile=HEDGE_PERCENTILE,
+                        max_hedge_ratio=HEDGE_MAX_RATIO,
+                        deadline_by_class=HTTP_DEADLINES,
+                        url_classifier=LojaMaetoScraper.classify_url,
+                        max_workers=HTTP_POOL_SIZE,
+                        metrics=metrics,
+                    ),
+                    failure_threshold=CIRCUIT_BREAKER_FAILURES,
+                    reset_timeout=CIRCUIT_BREAKER_RESET,
+                    max_reset_timeout=CIRCUIT_BREAKER_MAX_RESET,
+                    max_wait=CIRCUIT_BREAKER_MAX_WAIT,
+                    metrics=metrics,
+                ),
+                HTTP_CACHE_DIR,
+                ttl_by_class=HTTP_CACHE_TTL,
+                url_classifier=LojaMaetoScraper.classify_url,
+            )
+        )
+        if not arguments.archive:
+            yield caching_client, caching_client
+            return
+
+        archive = stack.enter_context(
+            PageArchive(arguments.archive, codec=arguments.archive_codec)
+        )
+        yield (
+            ArchivingHttpClient(
+                caching_client, archive, url_classifier=LojaMaetoScraper.classify_url
+            ),
+            caching_client,
+        )
+
 
 def main() -> None:
     """Função principal usando camada de aplicação."""
 
     # Verificar argumentos da linha de comando
-    if len(sys.argv) > 1:
-        search_query: str = sys.argv[1]
-    else:
-        print(f"{VERMELHO}Erro de uso: python main.py <termo_de_busca>{RESET}")
-        print(f"{CINZA}   Exemplo: python main.py casa{RESET}")
+    arguments: argparse.Namespace = parse_arguments()
+    try:
+        search_queries: list[str] = read_queries(arguments)
+    except OSError as error:
+        print(f"{VERMELHO}Erro ao ler o arquivo de termos: {error}{RESET}")
+        return
+    if not search_queries:
+        print(f"{VERMELHO}Erro de uso: python main.py <termo_de_busca>...{RESET}")
+        print(f"{CINZA}   Exemplo: python main.py casa mesa cadeira{RESET}")
+        print(f"{CINZA}   Exemplo: python main.py --queries-file termos.txt{RESET}")
         return
 
-    print(f"{VERDE}Iniciando scraping da consulta: '{search_query}'{RESET}")
+    print(
+        f"{VERDE}Iniciando scraping da consulta: "
+        f"{', '.join(repr(query) for query in search_queries)}{RESET}"
+    )
     print("=" * 70)
 
+    # Métricas da execução, exportadas ao final mesmo em caso de erro
+    metrics_registry = MetricsRegistry()
+    metrics: IMetrics = metrics_registry
+    http_cache: CachingHttpClient | None = None
+
     try:
         # Inicialização das dependências (camada de infraestrutura)
-        http_client: IHttpClient = RequestsHttpClient()
-        scraper: IWebScraper = LojaMaetoScraper(http_client)
-        repository: IProductRepository = SqliteProductRepository("products.db")
+        with (
+            open_http_client(arguments, metrics) as (base_client, caching_client),
+            SqliteProductRepository(
+                "products.db", metrics=metrics
+            ) as sqlite_repository,
+            SqliteCrawlCheckpointRepository("products.db") as checkpoint_repository,
+            # Fechado antes dos repositórios acima, gravando o que estiver na
+            # fila mesmo em caso de erro ou interrupção
+            WriteBehindProductRepository(
+                sqlite_repository,
+                max_pending=WRITE_BEHIND_MAX_PENDING,
+                batch_size=WRITE_BEHIND_BATCH_SIZE,
+                flush_interval=WRITE_BEHIND_FLUSH_INTERVAL,
+                metrics=metrics,
+            ) as write_behind_repository,
+            build_parser(arguments) as page_parser,
+        ):
+            http_cache = caching_client
+            http_client: IHttpClient = base_client
+            repository: IProductRepository = write_behind_repository
+            # O progresso só é gravado após os produtos a que se refere
+            checkpoints: ICrawlCheckpointRepository = WriteBehindCheckpointRepository(
+                checkpoint_repository, write_behind_repository
+            )
+            scraper: IWebScraper = LojaMaetoScraper(
+                http_client,
+                max_workers=MAX_DETAIL_WORKERS,
+                repository=repository if arguments.incremental else None,
+                max_specs_age=timedelta(days=arguments.specs_max_age),
+                parser=page_parser,
+                metrics=metrics,
+            )
 
-        # Inicialização do serviço da camada de aplicação
-        scraping_service: IProcessWebScrapping = ProcessScrappingService(
-            repository=repository, scrapper=scraper
-        )
+            # Inicialização do serviço da camada de aplicação
+            scraping_service: IProcessWebScrapping = ProcessScrappingService(
+                repository=repository,
+                scrapper=scraper,
+                fetch_workers=PIPELINE_FETCH_WORKERS,
+                parse_workers=max(PIPELINE_PARSE_WORKERS, arguments.parse_processes),
+                detail_workers=PIPELINE_DETAIL_WORKERS,
+                persist_workers=PIPELINE_PERSIST_WORKERS,
+                queue_size=PIPELINE_QUEUE_SIZE,
+                metrics=metrics,
+                checkpoints=checkpoints,
+                resume=arguments.resume,
+            )
 
-        # Executar o processo de scraping
-        scraping_service.process(search_query)
+            # Executar o processo de scraping, com SKUs únicos entre os termos
+            skipped: int = (
+                scraping_service.process(search_queries[0])
+                if len(search_queries) == 1
+                else scraping_service.process_many(search_queries)
+            )
 
         print("=" * 70)
         print(f"{VERDE}Scraping concluído com sucesso!{RESET}")
+        if skipped:
+            print(
+                f"{AMARELO}   {skipped} produtos não coletados por falha na "
+                f"página de detalhe{RESET}"
+            )
+            print(f"{CINZA}   Para coletá-los: python main.py --resume ...{RESET}")
 
     except KeyboardInterrupt:
         print(f"\n{AMARELO}  Scraping interrompido pelo usuário{RESET}")
+        print(f"{CINZA}   Para continuar: python main.py --resume ...{RESET}")
 
     except (InfrastructureError, DomainValidationError) as error:
         print(f"{VERMELHO}Erro durante o scraping: {error}{RESET}")
 
+    finally:
+        export_metrics(arguments, metrics_registry, http_cache)
+
 
 if __name__ == "__main__":
     main()
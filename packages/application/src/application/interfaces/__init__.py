@@ -1,3 +1,5 @@
+from .export import IExportProducts
 from .process import IProcessWebScrapping
+from .worker import ICrawlWorker
 
-__all__ = ["IProcessWebScrapping"]
+__all__ = ["ICrawlWorker", "IExportProducts", "IProcessWebScrapping"]
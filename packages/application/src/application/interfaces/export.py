@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from domain.interfaces import IProductExporter
+
+
+class IExportProducts(ABC):
+    """
+    Interface para a exportação dos produtos gravados na camada de aplicação.
+    """
+
+    @abstractmethod
+    def export(
+        self,
+        exporter: "IProductExporter",
+        *,
+        search_text: str | None = None,
+        updated_since: datetime | None = None,
+        updated_until: datetime | None = None,
+    ) -> int:
+        """
+        Exporta os produtos gravados, ou os que atendem aos filtros.
+
+        Args:
+            exporter: Destino dos produtos.
+            search_text: Palavras que o título deve conter (opcional).
+            updated_since: Gravados a partir deste momento (opcional).
+            updated_until: Gravados antes deste momento (opcional).
+
+        Returns:
+            Quantidade de produtos exportados.
+        """
+        pass
@@ -1,20 +1,42 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 
 class IProcessWebScrapping(ABC):
     """
     Interface para o processo de web scraping na camada de aplicação.
 
-    Define o método process, responsável por orquestrar a busca de produtos
-    conforme o termo informado.
+    Define os métodos process e process_many, responsáveis por orquestrar a
+    busca de produtos conforme o termo (ou termos) informado.
     """
 
     @abstractmethod
-    def process(self, search_query: str) -> None:
+    def process(self, search_query: str) -> int:
         """
         Executa o processo de scraping para o termo de busca informado.
 
         Args:
             search_query: Termo de busca para coletar produtos.
+
+        Returns:
+            Quantidade de produtos ignorados porque a página de detalhe não
+            pôde ser lida; eles são coletados ao retomar a coleta.
+        """
+        pass
+
+    @abstractmethod
+    def process_many(self, search_queries: Iterable[str]) -> int:
+        """
+        Executa o scraping de vários termos de busca em sequência.
+
+        Produtos que aparecem em mais de um termo são coletados e gravados
+        apenas uma vez.
+
+        Args:
+            search_queries: Termos de busca para coletar produtos.
+
+        Returns:
+            Quantidade de produtos ignorados porque a página de detalhe não
+            pôde ser lida, somada entre os termos.
         """
         pass
@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+
+class ICrawlWorker(ABC):
+    """
+    Interface para um worker da coleta distribuída na camada de aplicação.
+
+    Vários workers, em processos ou máquinas diferentes, processam as tarefas
+    da mesma fila de trabalho.
+    """
+
+    @property
+    @abstractmethod
+    def skipped(self) -> int:
+        """
+        Retorna a quantidade de tarefas concluídas sem gravar o produto, por
+        dados insuficientes no card.
+        """
+        pass
+
+    @abstractmethod
+    def seed(self, search_queries: Iterable[str], *, new_crawl: bool = False) -> int:
+        """
+        Enfileira a primeira página de busca de cada termo.
+
+        Args:
+            search_queries: Termos de busca a coletar.
+            new_crawl: Se True, inicia uma nova coleta mesmo que a atual não
+                tenha terminado.
+
+        Returns:
+            Quantidade de tarefas novas.
+        """
+        pass
+
+    @abstractmethod
+    def run(self) -> int:
+        """
+        Processa tarefas da fila até que não reste nenhuma pendente ou
+        reservada.
+
+        Returns:
+            Quantidade de tarefas concluídas por este worker.
+        """
+        pass
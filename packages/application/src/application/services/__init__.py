@@ -1,3 +1,5 @@
+from .crawl_worker import CrawlWorkerService
+from .export_products import ExportProductsService
 from .process_scrapping import ProcessScrappingService
 
-__all__ = ["ProcessScrappingService"]
+__all__ = ["CrawlWorkerService", "ExportProductsService", "ProcessScrappingService"]
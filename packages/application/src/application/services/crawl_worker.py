@@ -0,0 +1,361 @@
+import threading
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import timedelta
+from typing import TYPE_CHECKING, override
+
+from domain.models import CrawlTask, ProductBatch, SpecKeyTable
+
+from application.interfaces import ICrawlWorker
+
+if TYPE_CHECKING:
+    from domain.interfaces import (
+        IMetrics,
+        IProductRepository,
+        IWebScraper,
+        IWorkQueue,
+    )
+    from domain.models import ProductListing
+
+
+class CrawlWorkerService(ICrawlWorker):
+    """
+    Worker da coleta distribuída: processa tarefas de uma fila compartilhada.
+
+    Uma tarefa de página de busca extrai os cards e enfileira uma tarefa por
+    página de detalhe e, conforme o caso, as páginas de busca seguintes: todas
+    as planejadas, quando a primeira página informa o total, ou apenas a
+    próxima. Uma tarefa de página de detalhe coleta as especificações e grava o
+    produto. Como cada URL entra uma única vez na coleta, um produto presente
+    em vários termos é coletado uma só vez.
+
+    O worker processa até `concurrency` tarefas ao mesmo tempo e renova
+    periodicamente o prazo das tarefas em andamento; se ele morrer, o prazo
+    expira e outro worker as retoma. Para aumentar a vazão, basta iniciar mais
+    workers sobre a mesma fila.
+    """
+
+    def __init__(
+        self,
+        queue: "IWorkQueue",
+        scrapper: "IWebScraper",
+        repository: "IProductRepository",
+        *,
+        worker_id: str,
+        concurrency: int = 8,
+        lease: timedelta = timedelta(seconds=60),
+        poll_interval: float = 1.0,
+        metrics: "IMetrics | None" = None,
+    ) -> None:
+        """
+        Inicializa o worker.
+
+        Args:
+            queue: Fila de trabalho compartilhada.
+            scrapper: Scraper que busca e extrai as páginas.
+            repository: Repositório onde os produtos são gravados.
+            worker_id: Identificador único do worker (ex.: máquina e PID).
+            concurrency: Tarefas processadas simultaneamente.
+            lease: Prazo de reserva das tarefas, renovado a cada terço.
+            poll_interval: Espera, em segundos, entre consultas à fila quando
+                não há tarefas disponíveis.
+            metrics: Destino da contagem de tarefas por tipo e resultado
+                (opcional).
+        """
+        if concurrency < 1:
+            msg = "O worker precisa processar ao menos uma tarefa por vez."
+            raise ValueError(msg)
+        self._queue: IWorkQueue = queue
+        self._scrapper: IWebScraper = scrapper
+        self._repository: IProductRepository = repository
+        self._worker_id: str = worker_id
+        self._concurrency: int = concurrency
+        self._lease: timedelta = lease
+        self._poll_interval: float = poll_interval
+        self._metrics: IMetrics | None = metrics
+        self._spec_keys: SpecKeyTable = SpecKeyTable()
+        self._lock: threading.Lock = threading.Lock()
+        self._in_flight: set[int] = set()
+        self._skipped: int = 0
+
+    @property
+    @override
+    def skipped(self) -> int:
+        """
+        Retorna a quantidade de tarefas de produto concluídas sem gravar o
+        produto, por falta de SKU ou título no card.
+        """
+        with self._lock:
+            return self._skipped
+
+    @override
+    def seed(self, search_queries: Iterable[str], *, new_crawl: bool = False) -> int:
+        """
+        Enfileira a primeira página de busca de cada termo.
+
+        Se a coleta atual já terminou, uma nova é iniciada, e todas as URLs
+        voltam a ser coletadas; senão, os termos entram na coleta em andamento,
+        e os já enfileirados nela, inclusive por outro worker, são ignorados.
+
+        Args:
+            search_queries: Termos de busca a coletar.
+            new_crawl: Se True, inicia uma nova coleta mesmo que a atual não
+                tenha terminado; as tarefas restantes dela são abandonadas.
+
+        Returns:
+            Quantidade de tarefas novas.
+        """
+        self._queue.start_crawl(force=new_crawl)
+        return self._queue.enqueue(
+            CrawlTask(
+                kind="search",
+                url=self._scrapper.search_page_url(search_query, 1),
+                search_query=search_query,
+                page=1,
+            )
+            for search_query in search_queries
+        )
+
+    @override
+    def run(self) -> int:
+        """
+        Processa tarefas da fila até que não reste nenhuma pendente ou
+        reservada, inclusive por outros workers.
+
+        Em caso de interrupção (Ctrl+C), as tarefas reservadas e ainda não
+        iniciadas são devolvidas à fila, e as em andamento são concluídas.
+
+        Returns:
+            Quantidade de tarefas concluídas por este worker.
+        """
+        completed: int = 0
+        futures: dict[Future[bool], CrawlTask] = {}
+        stop = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._send_heartbeats,
+            args=(stop,),
+            name=f"{self._worker_id}-heartbeat",
+            daemon=True,
+        )
+        heartbeat.start()
+        executor = ThreadPoolExecutor(
+            max_workers=self._concurrency, thread_name_prefix=self._worker_id
+        )
+        try:
+            while True:
+                self._submit(executor, futures)
+                if not futures:
+                    if self._drained():
+                        break
+                    stop.wait(self._poll_interval)
+                    continue
+                done, _ = wait(
+                    futures, timeout=self._poll_interval, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    del futures[future]
+                    completed += future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            stop.set()
+            self._release(
+                [task for future, task in futures.items() if future.cancelled()]
+            )
+        return completed
+
+    def _submit(
+        self, executor: ThreadPoolExecutor, futures: dict[Future[bool], CrawlTask]
+    ) -> None:
+        """
+        Reserva tarefas para as vagas livres e as envia ao executor.
+
+        Args:
+            executor: Executor das tarefas.
+            futures: Tarefas em andamento, atualizado com as novas.
+        """
+        free: int = self._concurrency - len(futures)
+        if free < 1:
+            return
+        for task in self._queue.claim(self._worker_id, lease=self._lease, limit=free):
+            with self._lock:
+                self._in_flight.add(task.task_id or 0)
+            futures[executor.submit(self._process_task, task)] = task
+
+    def _drained(self) -> bool:
+        """
+        Indica se a fila não tem tarefas pendentes nem reservadas.
+        """
+        counts: dict[str, int] = self._queue.counts()
+        return counts["pending"] == 0 and counts["leased"] == 0
+
+    def _release(self, tasks: list[CrawlTask]) -> None:
+        """
+        Devolve à fila as tarefas reservadas que não chegaram a ser iniciadas.
+
+        Args:
+            tasks: Tarefas canceladas.
+        """
+        if tasks:
+            self._queue.release(self._worker_id, [task.task_id or 0 for task in tasks])
+
+    def _send_heartbeats(self, stop: threading.Event) -> None:
+        """
+        Renova, a cada terço do prazo, a reserva das tarefas em andamento.
+
+        Args:
+            stop: Sinal de encerramento do worker.
+        """
+        while not stop.wait(self._lease.total_seconds() / 3):
+            with self._lock:
+                task_ids: list[int] = list(self._in_flight)
+            if not task_ids:
+                continue
+            try:
+                self._queue.heartbeat(self._worker_id, task_ids, lease=self._lease)
+            except Exception as error:  # noqa: BLE001
+                print(f"Erro ao renovar a reserva das tarefas: {error}")
+
+    def _process_task(self, task: CrawlTask) -> bool:
+        """
+        Processa uma tarefa e registra o resultado na fila.
+
+        Args:
+            task: Tarefa reservada.
+
+        Returns:
+            True se a tarefa foi concluída, inclusive como ignorada; False se
+            falhou.
+        """
+        task_id: int = task.task_id or 0
+        saved: bool = True
+        try:
+            if task.kind == "search":
+                self._process_search_page(task)
+            else:
+                saved = self._process_product(task)
+        except Exception as error:  # noqa: BLE001
+            print(f"Erro na tarefa {task.url} (tentativa {task.attempts}): {error}")
+            self._queue.fail(self._worker_id, task_id, str(error))
+            self._count(task, "failed")
+            return False
+        else:
+            self._queue.complete(self._worker_id, task_id)
+            if not saved:
+                with self._lock:
+                    self._skipped += 1
+            self._count(task, "done" if saved else "skipped")
+            return True
+        finally:
+            with self._lock:
+                self._in_flight.discard(task_id)
+
+    def _process_search_page(self, task: CrawlTask) -> None:
+        """
+        Extrai os cards da página de busca e enfileira as tarefas seguintes.
+
+        Cards sem URL de detalhe são gravados diretamente.
+
+        Args:
+            task: Tarefa da página de busca.
+        """
+        page: int = task.page or 1
+        html: str = self._scrapper.fetch_search_page(task.search_query, page)
+        listings: list[ProductListing] = self._scrapper.parse_search_page(html)
+        if not listings:
+            return
+        last_page: int | None = task.last_page
+        if page == 1:
+            last_page = self._scrapper.count_search_pages(html, len(listings))
+        next_pages: range
+        if last_page is None:
+            next_pages = range(page + 1, page + 2)
+        elif page == 1:
+            next_pages = range(2, last_page + 1)
+        else:
+            next_pages = range(0)
+        self._queue.enqueue(
+            [
+                *(
+                    CrawlTask(
+                        kind="search",
+                        url=self._scrapper.search_page_url(task.search_query, number),
+                        search_query=task.search_query,
+                        page=number,
+                        last_page=last_page,
+                    )
+                    for number in next_pages
+                ),
+                *(
+                    CrawlTask(
+                        kind="product",
+                        url=listing.product_url,
+                        search_query=task.search_query,
+                        listing=listing,
+                    )
+                    for listing in listings
+                    if listing.product_url
+                ),
+            ]
+        )
+        self._persist([listing for listing in listings if not listing.product_url])
+
+    def _process_product(self, task: CrawlTask) -> bool:
+        """
+        Coleta as especificações do produto e o grava.
+
+        Se a página de detalhe não pôde ser lida, a tarefa falha para ser
+        tentada de novo. Um card sem os dados mínimos (SKU e título) nunca
+        resulta em um produto; a tarefa é concluída sem gravar nada.
+
+        Args:
+            task: Tarefa da página de detalhe.
+
+        Returns:
+            True se o produto foi gravado; False se o card foi ignorado.
+        """
+        if task.listing is None:
+            return False
+        return self._persist([task.listing]) > 0
+
+    def _persist(self, listings: list["ProductListing"]) -> int:
+        """
+        Monta os produtos dos cards (buscando as páginas de detalhe) e os grava
+        em um só lote.
+
+        Args:
+            listings: Cards a coletar.
+
+        Returns:
+            Quantidade de produtos gravados.
+
+        Raises:
+            Exception: A falha da primeira página de detalhe que não pôde ser
+                lida; nesse caso, nenhum produto é gravado.
+        """
+        if not listings:
+            return 0
+        errors: list[Exception] = []
+        products = ProductBatch(self._spec_keys)
+        for product in self._scrapper.scrape_listing_details(
+            listings, on_fetch_error=lambda _, error: errors.append(error)
+        ):
+            print(f"Processando produto: {product.product_title} (SKU: {product.sku})")
+            products.append(product)
+        if errors:
+            raise errors[0]
+        if products:
+            self._repository.upsert_many(products)
+        return len(products)
+
+    def _count(self, task: CrawlTask, status: str) -> None:
+        """
+        Conta uma tarefa processada (worker_tasks_total).
+
+        Args:
+            task: Tarefa processada.
+            status: "done", "skipped" ou "failed".
+        """
+        if self._metrics is not None:
+            self._metrics.increment(
+                "worker_tasks_total", labels={"kind": task.kind, "status": status}
+            )
@@ -0,0 +1,74 @@
+from datetime import datetime
+from typing import TYPE_CHECKING, override
+
+from domain.models import ProductBatch, SpecKeyTable
+
+from application.interfaces import IExportProducts
+
+if TYPE_CHECKING:
+    from domain.interfaces import IProductExporter, IProductRepository
+
+
+class ExportProductsService(IExportProducts):
+    """
+    Exporta os produtos do repositório em lotes de tamanho fixo.
+
+    Os produtos são lidos do repositório à medida que são gravados no
+    exportador, de modo que apenas um lote fica em memória por vez,
+    independentemente da quantidade de produtos.
+    """
+
+    def __init__(
+        self, repository: "IProductRepository", chunk_size: int = 1000
+    ) -> None:
+        """
+        Inicializa o serviço de exportação.
+
+        Args:
+            repository: Repositório de onde os produtos são lidos.
+            chunk_size: Quantidade de produtos por lote entregue ao
+                exportador.
+        """
+        self.repository: IProductRepository = repository
+        self.chunk_size: int = chunk_size
+
+    @override
+    def export(
+        self,
+        exporter: "IProductExporter",
+        *,
+        search_text: str | None = None,
+        updated_since: datetime | None = None,
+        updated_until: datetime | None = None,
+    ) -> int:
+        """
+        Exporta os produtos gravados, ou os que atendem aos filtros.
+
+        O exportador não é fechado; isso cabe a quem o criou.
+
+        Args:
+            exporter: Destino dos produtos.
+            search_text: Palavras que o título deve conter (opcional).
+            updated_since: Gravados a partir deste momento (opcional).
+            updated_until: Gravados antes deste momento (opcional).
+
+        Returns:
+            Quantidade de produtos exportados.
+        """
+        # O mesmo lote é reaproveitado, e a tabela de nomes, compartilhada
+        batch = ProductBatch(SpecKeyTable())
+        total: int = 0
+        for product in self.repository.iter_products(
+            search_text=search_text,
+            updated_since=updated_since,
+            updated_until=updated_until,
+        ):
+            batch.append(product)
+            if len(batch) >= self.chunk_size:
+                exporter.write(batch)
+                total += len(batch)
+                batch.clear()
+        if batch:
+            exporter.write(batch)
+            total += len(batch)
+        return total
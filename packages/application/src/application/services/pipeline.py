@@ -0,0 +1,160 @@
+import threading
+from collections.abc import Callable, Iterable
+from queue import Queue
+from typing import Any, Final
+
+
+class _EndOfStream:
+    """
+    Marcador de fim de fluxo enviado às filas entre etapas.
+    """
+
+
+END_OF_STREAM: Final[_EndOfStream] = _EndOfStream()
+
+
+class PipelineStage[InT, OutT]:
+    """
+    Etapa de um pipeline com threads próprias e fila de entrada limitada.
+
+    Cada uma das `workers` threads consome itens da fila de entrada, aplica o
+    handler e envia os resultados para a fila da etapa seguinte. Como as filas
+    são limitadas, uma etapa lenta faz as anteriores aguardarem. Quando todas
+    as threads recebem o fim do fluxo, a etapa o repassa à seguinte.
+
+    Exceções lançadas pelo handler são repassadas a `on_error`, quando
+    informado; sem ele, a primeira é guardada em `error`, assim como as
+    exceções do próprio `on_error`. Em todos os casos o consumo da fila
+    continua, para que o pipeline sempre termine.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[InT], Iterable[OutT]],
+        workers: int = 1,
+        queue_size: int = 1,
+        on_error: Callable[[InT, Exception], None] | None = None,
+    ) -> None:
+        """
+        Inicializa a etapa.
+
+        Args:
+            name: Nome da etapa, usado no nome das threads.
+            handler: Função que processa um item e produz zero ou mais saídas.
+            workers: Quantidade de threads da etapa.
+            queue_size: Capacidade da fila de entrada.
+            on_error: Função chamada com o item e a exceção quando o handler
+                falha (opcional).
+        """
+        if workers < 1:
+            msg = f"A etapa '{name}' precisa de ao menos uma thread."
+            raise ValueError(msg)
+        self.name: str = name
+        self.workers: int = workers
+        self.inbox: Queue[InT | _EndOfStream] = Queue(maxsize=max(queue_size, 1))
+        self._handler: Callable[[InT], Iterable[OutT]] = handler
+        self._on_error: Callable[[InT, Exception], None] | None = on_error
+        self._downstream: PipelineStage[OutT, Any] | None = None
+        self._threads: list[threading.Thread] = []
+        self._lock: threading.Lock = threading.Lock()
+        self._active_workers: int = 0
+        self._error: BaseException | None = None
+
+    @property
+    def error(self) -> BaseException | None:
+        """
+        Retorna a primeira exceção lançada pelo handler, se houver.
+        """
+        return self._error
+
+    def connect[NextT](
+        self, downstream: "PipelineStage[OutT, NextT]"
+    ) -> "PipelineStage[OutT, NextT]":
+        """
+        Liga a saída desta etapa à entrada da etapa seguinte.
+
+        Args:
+            downstream: Etapa que consumirá as saídas desta.
+
+        Returns:
+            A etapa seguinte, para encadear chamadas.
+        """
+        self._downstream = downstream
+        return downstream
+
+    def start(self) -> None:
+        """
+        Inicia as threads da etapa.
+        """
+        self._active_workers = self.workers
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._work, name=f"{self.name}-{index}", daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def put(self, item: InT) -> None:
+        """
+        Envia um item para a etapa, aguardando se a fila estiver cheia.
+
+        Args:
+            item: Item a processar.
+        """
+        self.inbox.put(item)
+
+    def close(self) -> None:
+        """
+        Sinaliza o fim do fluxo de entrada para todas as threads da etapa.
+        """
+        for _ in range(self.workers):
+            self.inbox.put(END_OF_STREAM)
+
+    def join(self) -> None:
+        """
+        Aguarda o término de todas as threads da etapa.
+        """
+        for thread in self._threads:
+            thread.join()
+
+    def _record(self, error: BaseException) -> None:
+        """
+        Guarda a primeira exceção não tratada da etapa.
+
+        Args:
+            error: Exceção lançada pelo handler.
+        """
+        with self._lock:
+            if self._error is None:
+                self._error = error
+
+    def _work(self) -> None:
+        """
+        Laço de uma thread: consome a fila até receber o fim do fluxo.
+        """
+        try:
+            while True:
+                item: InT | _EndOfStream = self.inbox.get()
+                if isinstance(item, _EndOfStream):
+                    break
+                try:
+                    for output in self._handler(item):
+                        if self._downstream is not None:
+                            self._downstream.put(output)
+                except Exception as error:  # noqa: BLE001
+                    if self._on_error is None:
+                        self._record(error)
+                    else:
+                        try:
+                            self._on_error(item, error)
+                        except BaseException as callback_error:  # noqa: BLE001
+                            self._record(callback_error)
+                except BaseException as error:  # noqa: BLE001
+                    self._record(error)
+        finally:
+            with self._lock:
+                self._active_workers -= 1
+                last_worker: bool = self._active_workers == 0
+            if last_worker and self._downstream is not None:
+                self._downstream.close()
@@ -1,9 +1,409 @@
-from typing import TYPE_CHECKING
+import threading
+import time
+from collections.abc import Callable, Generator, Iterable, Iterator
+from contextlib import contextmanager
+from itertools import count
+from typing import TYPE_CHECKING, Any
+
+from domain.models import ProductBatch, SpecKeyTable
 
 from application.interfaces import IProcessWebScrapping
+from application.services.pipeline import PipelineStage
 
 if TYPE_CHECKING:
-    from domain.interfaces import IProductRepository, IWebScraper
+    from domain.interfaces import (
+        ICrawlCheckpointRepository,
+        IMetrics,
+        IProductRepository,
+        IWebScraper,
+    )
+    from domain.models import CrawlCheckpoint, ProductListing
+
+# Produtos de uma página prontos para gravação e se a página foi concluída
+type _PageProducts = tuple[int, ProductBatch, bool]
+
+
+class _SeenSkus:
+    """
+    Conjunto de SKUs já coletados, compartilhado entre as threads e os termos
+    de busca de uma execução.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicializa o conjunto vazio.
+        """
+        self._lock: threading.Lock = threading.Lock()
+        self._skus: set[str] = set()
+
+    def claim(self, listings: list["ProductListing"]) -> list["ProductListing"]:
+        """
+        Reserva os SKUs ainda não vistos e descarta os cards repetidos.
+
+        Cards sem SKU são mantidos, pois não há como identificá-los.
+
+        Args:
+            listings: Cards de uma página de busca.
+
+        Returns:
+            Cards cujos produtos ainda não foram coletados nesta execução.
+        """
+        claimed: list[ProductListing] = []
+        with self._lock:
+            for listing in listings:
+                if listing.sku is not None:
+                    if listing.sku in self._skus:
+                        continue
+                    self._skus.add(listing.sku)
+                claimed.append(listing)
+        return claimed
+
+
+class _ScrapingRun:
+    """
+    Estado e etapas de uma execução do pipeline para um termo de busca.
+
+    Guarda a última página válida, conhecida pelo total de páginas informado na
+    primeira página ou quando uma página vem vazia (ou falha, se o total não
+    foi informado), e o sinal de cancelamento. As etapas descartam as páginas
+    além da última e, após o cancelamento, deixam de buscar e processar novas
+    páginas.
+    Com um repositório de checkpoints, cada lote gravado registra o progresso
+    da página, e os SKUs gravados por uma execução anterior são ignorados. Uma
+    página com produtos cuja página de detalhe não pôde ser lida é registrada
+    como incompleta, para que a retomada colete apenas esses produtos.
+    """
+
+    def __init__(
+        self,
+        scrapper: "IWebScraper",
+        repository: "IProductRepository",
+        search_query: str,
+        seen_skus: _SeenSkus,
+        metrics: "IMetrics | None" = None,
+        checkpoints: "ICrawlCheckpointRepository | None" = None,
+        done_skus: frozenset[str] = frozenset(),
+    ) -> None:
+        """
+        Inicializa o estado da execução.
+
+        Args:
+            scrapper: Scraper que executa cada etapa da coleta.
+            repository: Repositório onde os produtos são gravados.
+            search_query: Termo de busca.
+            seen_skus: SKUs já coletados, a descartar nesta execução.
+            metrics: Destino das métricas de tempo por etapa (opcional).
+            checkpoints: Repositório onde o progresso é registrado (opcional).
+            done_skus: SKUs gravados por uma execução anterior interrompida.
+        """
+        self._scrapper = scrapper
+        self._repository = repository
+        self._search_query: str = search_query
+        self._seen_skus: _SeenSkus = seen_skus
+        self._metrics: IMetrics | None = metrics
+        self._checkpoints: ICrawlCheckpointRepository | None = checkpoints
+        self._done_skus: frozenset[str] = done_skus
+        # Nomes das especificações compartilhados pelos lotes de todas as páginas
+        self._spec_keys: SpecKeyTable = SpecKeyTable()
+        self._lock: threading.Lock = threading.Lock()
+        self._last_page: int | None = None
+        self._planned_pages: int | None = None
+        self._planned: threading.Event = threading.Event()
+        self._empty_page: int | None = None
+        self._failed_page: int | None = None
+        self._skipped: int = 0
+        self._cancelled: threading.Event = threading.Event()
+        self._error: BaseException | None = None
+
+    @property
+    def error(self) -> BaseException | None:
+        """
+        Retorna a primeira falha que interrompeu a execução, se houver.
+        """
+        return self._error
+
+    @property
+    def skipped(self) -> int:
+        """
+        Retorna a quantidade de produtos ignorados porque a página de detalhe
+        não pôde ser lida.
+        """
+        with self._lock:
+            return self._skipped
+
+    @property
+    def finished(self) -> bool:
+        """
+        Indica se a busca chegou à última página planejada ou a uma página
+        vazia sem falhas, produtos ignorados nem interrupções até ela.
+        """
+        with self._lock:
+            ends: list[int] = [
+                page
+                for page in (
+                    self._planned_pages,
+                    None if self._empty_page is None else self._empty_page - 1,
+                )
+                if page is not None
+            ]
+            return (
+                not self._cancelled.is_set()
+                and bool(ends)
+                and (self._failed_page is None or self._failed_page > min(ends))
+            )
+
+    def wait_for_plan(self) -> None:
+        """
+        Aguarda o processamento da primeira página, que pode informar o total
+        de páginas da busca, ou o cancelamento da execução.
+        """
+        self._planned.wait()
+
+    def should_skip(self, page: int) -> bool:
+        """
+        Indica se a página não deve mais ser processada.
+
+        Args:
+            page: Número da página.
+        """
+        if self._cancelled.is_set():
+            return True
+        with self._lock:
+            return self._last_page is not None and page > self._last_page
+
+    def end_at(self, page: int) -> None:
+        """
+        Registra a última página válida, mantendo o menor valor informado.
+
+        Args:
+            page: Número da última página válida.
+        """
+        with self._lock:
+            if self._last_page is None or page < self._last_page:
+                self._last_page = page
+
+    def cancel(self) -> None:
+        """
+        Interrompe a busca e o processamento de novas páginas.
+        """
+        self._cancelled.set()
+        self._planned.set()
+
+    def fail(self, error: BaseException) -> None:
+        """
+        Registra uma falha fatal e cancela a execução.
+
+        Args:
+            error: Exceção que interrompeu a execução.
+        """
+        with self._lock:
+            if self._error is None:
+                self._error = error
+        self.cancel()
+
+    @contextmanager
+    def _timed(self, stage: str) -> Generator[None]:
+        """
+        Registra o tempo gasto pela etapa no bloco (pipeline_stage_seconds).
+
+        Args:
+            stage: Nome da etapa.
+        """
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self._metrics is not None:
+                self._metrics.observe(
+                    "pipeline_stage_seconds",
+                    time.perf_counter() - start,
+                    {"stage": stage},
+                )
+
+    def _count(self, name: str, value: float = 1.0) -> None:
+        """
+        Soma um valor a um contador, se houver destino de métricas.
+
+        Args:
+            name: Nome da métrica.
+            value: Valor a somar.
+        """
+        if self._metrics is not None:
+            self._metrics.increment(name, value)
+
+    def fetch(self, page: int) -> Iterator[tuple[int, str]]:
+        """
+        Etapa de busca: baixa o HTML da página de resultados.
+
+        Args:
+            page: Número da página.
+        """
+        if self.should_skip(page):
+            return
+        with self._timed("fetch"):
+            html: str = self._scrapper.fetch_search_page(self._search_query, page)
+        yield page, html
+
+    def parse(
+        self, item: tuple[int, str]
+    ) -> Iterator[tuple[int, list["ProductListing"]]]:
+        """
+        Etapa de parsing: extrai os cards da página; uma página vazia encerra a
+        busca.
+
+        Args:
+            item: Número e HTML da página.
+        """
+        page, html = item
+        if self.should_skip(page):
+            return
+        with self._timed("parse"):
+            listings: list[ProductListing] = self._scrapper.parse_search_page(html)
+        if listings:
+            if page == 1:
+                self._plan(html, len(listings))
+            self._count("pipeline_pages_total")
+            yield page, listings
+        else:
+            with self._lock:
+                if self._empty_page is None or page < self._empty_page:
+                    self._empty_page = page
+            self.end_at(page - 1)
+        if page == 1:
+            self._planned.set()
+
+    def _plan(self, html: str, page_size: int) -> None:
+        """
+        Registra o total de páginas informado pela primeira página como a
+        última página válida e libera a busca das demais.
+
+        Args:
+            html: Conteúdo HTML da primeira página de busca.
+            page_size: Quantidade de cards da primeira página.
+        """
+        try:
+            page_count: int | None = self._scrapper.count_search_pages(html, page_size)
+            if page_count is not None:
+                with self._lock:
+                    self._planned_pages = page_count
+                self.end_at(page_count)
+        finally:
+            self._planned.set()
+
+    def details(
+        self, item: tuple[int, list["ProductListing"]]
+    ) -> Iterator[_PageProducts]:
+        """
+        Etapa de detalhes: coleta as especificações e monta os produtos,
+        exceto os de SKUs já coletados.
+
+        Após um cancelamento, a coleta da página é interrompida e os produtos
+        já montados seguem para gravação com a página marcada como incompleta.
+        O mesmo ocorre quando a página de detalhe de algum produto não pôde ser
+        lida.
+
+        Args:
+            item: Número da página e seus cards.
+        """
+        page, listings = item
+        if self.should_skip(page):
+            return
+        products = ProductBatch(self._spec_keys)
+        completed: bool = True
+        failed: list[ProductListing] = []
+        listings = self._seen_skus.claim(
+            [listing for listing in listings if listing.sku not in self._done_skus]
+        )
+        if listings:
+            with self._timed("details"):
+                for product in self._scrapper.scrape_listing_details(
+                    listings, on_fetch_error=lambda listing, _: failed.append(listing)
+                ):
+                    print(
+                        f"Processando produto: {product.product_title} "
+                        f"(SKU: {product.sku})"
+                    )
+                    products.append(product)
+                    if self._cancelled.is_set():
+                        completed = False
+                        break
+            self._count("pipeline_products_total", len(products))
+        if failed:
+            completed = False
+            self._skip(page, len(failed))
+        yield page, products, completed
+
+    def _skip(self, page: int, skipped: int) -> None:
+        """
+        Registra produtos ignorados de uma página, que deixa a busca
+        incompleta.
+
+        Args:
+            page: Número da página.
+            skipped: Quantidade de produtos ignorados.
+        """
+        self._count("pipeline_skipped_products_total", skipped)
+        with self._lock:
+            self._skipped += skipped
+            if self._failed_page is None or page < self._failed_page:
+                self._failed_page = page
+
+    def persist(self, item: _PageProducts) -> Iterator[None]:
+        """
+        Etapa de persistência: grava os produtos de uma página em um só lote
+        e registra o progresso da página.
+
+        Args:
+            item: Número da página, seus produtos e se ela foi concluída.
+        """
+        page, products, completed = item
+        if products:
+            with self._timed("persist"):
+                self._repository.upsert_many(products)
+        if self._checkpoints is not None:
+            self._checkpoints.save_progress(
+                self._search_query,
+                page,
+                products.skus,
+                page_completed=completed,
+            )
+        yield from ()
+
+    def on_page_error(self, item: int | tuple[int, object], error: Exception) -> None:
+        """
+        Informa a falha de uma página e a ignora.
+
+        Quando a primeira página informou o total, as demais páginas continuam
+        a ser coletadas; sem essa informação, a busca é encerrada na página
+        anterior, pois não há como saber se havia outras depois da que falhou.
+        Em ambos os casos o termo não é marcado como concluído, e a retomada
+        busca a página de novo.
+
+        Args:
+            item: Número da página ou tupla iniciada por ele.
+            error: Exceção lançada pela etapa.
+        """
+        page: int = item if isinstance(item, int) else item[0]
+        print(f"Erro na página {page}: {error}")
+        self._count("pipeline_page_errors_total")
+        with self._lock:
+            if self._failed_page is None or page < self._failed_page:
+                self._failed_page = page
+            planned: bool = self._planned_pages is not None
+        if not planned:
+            self.end_at(page - 1)
+        if page == 1:
+            self._planned.set()
+
+    def on_persist_error(self, _item: _PageProducts, error: Exception) -> None:
+        """
+        Trata uma falha de gravação como fatal.
+
+        Args:
+            _item: Página cujo lote não pôde ser gravado.
+            error: Exceção lançada pelo repositório.
+        """
+        self.fail(error)
 
 
 class ProcessScrappingService(IProcessWebScrapping):
@@ -11,10 +411,38 @@ class ProcessScrappingService(IProcessWebScrapping):
     Serviço responsável por orquestrar o processo de scraping de produtos.
 
     Utiliza um repositório para persistência e um scraper para coleta dos produtos.
+    A coleta é executada como um pipeline de etapas (busca da página, parsing,
+    coleta dos detalhes e persistência) ligadas por filas limitadas: enquanto a
+    página N é processada, a página N+1 já está sendo buscada e os produtos
+    anteriores gravados. Cada etapa tem sua própria quantidade de threads, e uma
+    fila cheia faz as etapas anteriores aguardarem.
+
+    A primeira página é processada antes das demais: se ela informa o total de
+    páginas, todas as páginas são planejadas e buscadas em paralelo pelas
+    threads de busca, sem a requisição da página vazia ao final; caso
+    contrário, as páginas seguintes são enviadas até que uma venha vazia.
+
+    Com um repositório de checkpoints, o progresso de cada termo é gravado a
+    cada lote. No modo de retomada, a coleta continua do checkpoint: as páginas
+    concluídas não são buscadas novamente, os produtos já gravados das páginas
+    em andamento são ignorados e os termos concluídos são pulados. Páginas com
+    produtos ignorados por falha na página de detalhe ficam em andamento, e o
+    termo não é concluído, de modo que a retomada busca apenas esses produtos.
     """
 
     def __init__(
-        self, repository: "IProductRepository", scrapper: "IWebScraper"
+        self,
+        repository: "IProductRepository",
+        scrapper: "IWebScraper",
+        *,
+        fetch_workers: int = 1,
+        parse_workers: int = 1,
+        detail_workers: int = 1,
+        persist_workers: int = 1,
+        queue_size: int = 2,
+        metrics: "IMetrics | None" = None,
+        checkpoints: "ICrawlCheckpointRepository | None" = None,
+        resume: bool = False,
     ) -> None:
         """
         Inicializa o serviço de scraping.
@@ -22,17 +450,235 @@ class ProcessScrappingService(IProcessWebScrapping):
         Args:
             repository: Instância que implementa IProductRepository para persistência.
             scrapper: Instância que implementa IWebScraper para coleta dos produtos.
+            fetch_workers: Páginas de busca baixadas simultaneamente.
+            parse_workers: Páginas de busca analisadas simultaneamente.
+            detail_workers: Páginas cujos detalhes são coletados simultaneamente.
+            persist_workers: Lotes de produtos gravados simultaneamente.
+            queue_size: Capacidade da fila de entrada de cada etapa.
+            metrics: Destino das métricas de tempo por etapa (opcional).
+            checkpoints: Repositório onde o progresso de cada termo é gravado
+                (opcional).
+            resume: Se True, retoma cada termo do checkpoint gravado; caso
+                contrário, o checkpoint é descartado e a coleta recomeça.
         """
         self._repository = repository
         self._scrapper = scrapper
+        self._fetch_workers: int = fetch_workers
+        self._parse_workers: int = parse_workers
+        self._detail_workers: int = detail_workers
+        self._persist_workers: int = persist_workers
+        self._queue_size: int = queue_size
+        self._metrics: IMetrics | None = metrics
+        self._checkpoints: ICrawlCheckpointRepository | None = checkpoints
+        self._resume: bool = resume
 
-    def process(self, search_query: str) -> None:
+    def process(self, search_query: str) -> int:
         """
         Executa o processo de scraping para o termo de busca informado.
 
+        As páginas são enviadas ao pipeline até a última informada pela
+        primeira página ou, sem essa informação, até que uma delas venha vazia
+        ou falhe. Com o total conhecido, páginas que falham são ignoradas e as
+        demais continuam a ser coletadas. Em caso de interrupção (Ctrl+C),
+        novas páginas deixam de ser buscadas, mas os produtos já coletados
+        ainda são gravados.
+
+        Args:
+            search_query: Termo de busca para coletar produtos.
+
+        Returns:
+            Quantidade de produtos ignorados porque a página de detalhe não
+            pôde ser lida.
+        """
+        return self._process(search_query, _SeenSkus())
+
+    def process_many(self, search_queries: Iterable[str]) -> int:
+        """
+        Executa o scraping de vários termos de busca em sequência.
+
+        Os termos compartilham o registro de SKUs coletados: um produto que
+        aparece em vários termos tem a página de detalhe buscada e é gravado
+        uma única vez.
+
+        Args:
+            search_queries: Termos de busca para coletar produtos.
+
+        Returns:
+            Quantidade de produtos ignorados porque a página de detalhe não
+            pôde ser lida, somada entre os termos.
+        """
+        seen_skus = _SeenSkus()
+        skipped: int = 0
+        for search_query in search_queries:
+            print(f"Processando termo de busca: '{search_query}'")
+            skipped += self._process(search_query, seen_skus)
+        return skipped
+
+    def _process(self, search_query: str, seen_skus: _SeenSkus) -> int:
+        """
+        Executa o pipeline de coleta de um termo de busca.
+
         Args:
             search_query: Termo de busca para coletar produtos.
+            seen_skus: SKUs já coletados nesta execução.
+
+        Returns:
+            Quantidade de produtos ignorados por falha na página de detalhe.
+        """
+        checkpoint: CrawlCheckpoint | None = self._load_checkpoint(search_query)
+        if checkpoint is not None and checkpoint.finished:
+            print(f"Termo '{search_query}' já concluído; nada a retomar.")
+            return 0
+        run = _ScrapingRun(
+            self._scrapper,
+            self._repository,
+            search_query,
+            seen_skus,
+            self._metrics,
+            self._checkpoints,
+            checkpoint.done_skus if checkpoint is not None else frozenset(),
+        )
+        stages: list[PipelineStage[Any, Any]] = self._build_stages(run)
+        fetch_stage: PipelineStage[int, tuple[int, str]] = stages[0]
+        for stage in stages:
+            stage.start()
+
+        try:
+            for page in count(1):
+                if run.should_skip(page):
+                    break
+                if checkpoint is None or not checkpoint.is_page_done(page):
+                    fetch_stage.put(page)
+                    if page == 1:
+                        run.wait_for_plan()
+        except KeyboardInterrupt:
+            run.cancel()
+            raise
+        finally:
+            self._join(run, stages)
+
+        self._finish(search_query, run, stages)
+        return run.skipped
+
+    def _finish(
+        self,
+        search_query: str,
+        run: _ScrapingRun,
+        stages: list[PipelineStage[Any, Any]],
+    ) -> None:
+        """
+        Relança a falha que interrompeu a execução, se houver, ou registra a
+        conclusão do termo quando a busca chegou ao fim.
+
+        Args:
+            search_query: Termo de busca.
+            run: Estado da execução.
+            stages: Etapas do pipeline, da primeira à última.
+        """
+        for stage in stages:
+            if stage.error is not None:
+                raise stage.error
+        if run.error is not None:
+            raise run.error
+        if self._checkpoints is not None and run.finished:
+            self._checkpoints.mark_finished(search_query)
+
+    def _build_stages(self, run: _ScrapingRun) -> list[PipelineStage[Any, Any]]:
+        """
+        Cria e conecta as etapas do pipeline de uma execução.
+
+        Args:
+            run: Estado da execução, cujos métodos tratam cada etapa.
+
+        Returns:
+            Etapas do pipeline, da primeira à última.
+        """
+        fetch_stage: PipelineStage[int, tuple[int, str]] = PipelineStage(
+            "fetch", run.fetch, self._fetch_workers, self._queue_size, run.on_page_error
+        )
+        parse_stage: PipelineStage[
+            tuple[int, str], tuple[int, list[ProductListing]]
+        ] = PipelineStage(
+            "parse", run.parse, self._parse_workers, self._queue_size, run.on_page_error
+        )
+        details_stage: PipelineStage[
+            tuple[int, list[ProductListing]], _PageProducts
+        ] = PipelineStage(
+            "details",
+            run.details,
+            self._detail_workers,
+            self._queue_size,
+            run.on_page_error,
+        )
+        persist_stage: PipelineStage[_PageProducts, None] = PipelineStage(
+            "persist",
+            run.persist,
+            self._persist_workers,
+            self._queue_size,
+            run.on_persist_error,
+        )
+        fetch_stage.connect(parse_stage).connect(details_stage).connect(persist_stage)
+        return [
+            fetch_stage,
+            parse_stage,
+            details_stage,
+            persist_stage,
+        ]
+
+    def _load_checkpoint(self, search_query: str) -> "CrawlCheckpoint | None":
+        """
+        Carrega o checkpoint do termo no modo de retomada ou o descarta nos
+        demais casos.
+
+        Args:
+            search_query: Termo de busca.
+
+        Returns:
+            Checkpoint a retomar, ou None para coletar desde a primeira página.
+        """
+        if self._checkpoints is None:
+            return None
+        if not self._resume:
+            self._checkpoints.reset_checkpoint(search_query)
+            return None
+        checkpoint: CrawlCheckpoint | None = self._checkpoints.load_checkpoint(
+            search_query
+        )
+        if checkpoint is not None and not checkpoint.finished:
+            print(
+                f"Retomando '{search_query}' após a página "
+                f"{checkpoint.last_completed_page} "
+                f"({len(checkpoint.done_skus)} produtos de páginas em andamento "
+                "já gravados)"
+            )
+        return checkpoint
+
+    @staticmethod
+    def _join(run: _ScrapingRun, stages: list[PipelineStage[Any, Any]]) -> None:
+        """
+        Encerra a entrada de páginas e aguarda o término das etapas, na ordem
+        do pipeline.
+
+        Uma interrupção durante a espera, inclusive um segundo Ctrl+C, cancela a
+        busca de novas páginas, mas continua aguardando para que os produtos já
+        coletados sejam gravados e o progresso registrado.
+
+        Args:
+            run: Estado da execução.
+            stages: Etapas do pipeline, da primeira à última.
         """
-        for product in self._scrapper.scrape_products(search_query):
-            print(f"Processando produto: {product.product_title} (SKU: {product.sku})")
-            self._repository.create(product)
+        interrupted: bool = False
+        steps: list[Callable[[], None]] = [
+            stages[0].close,
+            *(stage.join for stage in stages),
+        ]
+        for step in steps:
+            while True:
+                try:
+                    step()
+                    break
+                except KeyboardInterrupt:
+                    interrupted = True
+                    run.cancel()
+        if interrupted:
+            raise KeyboardInterrupt
@@ -1,4 +1,16 @@
+from .checkpoints import ICrawlCheckpointRepository
+from .exporters import IProductExporter
+from .metrics import IMetrics
 from .repositories import IProductRepository
 from .scrapers import IHttpClient, IWebScraper
+from .work_queue import IWorkQueue
 
-__all__ = ["IHttpClient", "IProductRepository", "IWebScraper"]
+__all__ = [
+    "ICrawlCheckpointRepository",
+    "IHttpClient",
+    "IMetrics",
+    "IProductExporter",
+    "IProductRepository",
+    "IWebScraper",
+    "IWorkQueue",
+]
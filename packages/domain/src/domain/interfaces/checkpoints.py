@@ -0,0 +1,70 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from domain.models import CrawlCheckpoint
+
+
+class ICrawlCheckpointRepository(ABC):
+    """
+    Interface para persistência do progresso das coletas.
+
+    Permite que uma coleta interrompida (Ctrl+C ou falha de uma página) seja
+    retomada do ponto em que parou, sem repetir as páginas e os produtos já
+    gravados.
+    """
+
+    @abstractmethod
+    def load_checkpoint(self, search_query: str) -> "CrawlCheckpoint | None":
+        """
+        Retorna o progresso gravado do termo de busca.
+
+        Args:
+            search_query: Termo de busca.
+
+        Returns:
+            CrawlCheckpoint do termo, ou None se não houver progresso gravado.
+        """
+        pass
+
+    @abstractmethod
+    def save_progress(
+        self,
+        search_query: str,
+        page: int,
+        skus: Iterable[str],
+        *,
+        page_completed: bool,
+    ) -> None:
+        """
+        Registra os produtos gravados de uma página e, se for o caso, a
+        conclusão dela.
+
+        Args:
+            search_query: Termo de busca.
+            page: Número da página.
+            skus: SKUs dos produtos da página já gravados.
+            page_completed: Se True, todos os produtos da página foram tratados.
+        """
+        pass
+
+    @abstractmethod
+    def mark_finished(self, search_query: str) -> None:
+        """
+        Registra que a coleta do termo de busca chegou ao fim.
+
+        Args:
+            search_query: Termo de busca.
+        """
+        pass
+
+    @abstractmethod
+    def reset_checkpoint(self, search_query: str) -> None:
+        """
+        Descarta o progresso gravado do termo, para uma coleta do início.
+
+        Args:
+            search_query: Termo de busca.
+        """
+        pass
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from domain.models import ProductBatch
+
+
+class IProductExporter(ABC):
+    """
+    Interface para exportação de produtos para um arquivo.
+
+    Os produtos são recebidos em lotes e gravados à medida que chegam, de modo
+    que a exportação não precisa manter todos os produtos em memória.
+    """
+
+    @abstractmethod
+    def write(self, batch: "ProductBatch") -> None:
+        """
+        Grava um lote de produtos no arquivo.
+
+        Args:
+            batch: Lote de produtos.
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Conclui o arquivo e libera os recursos da exportação.
+        """
+        pass
@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+
+
+class IMetrics(ABC):
+    """
+    Interface para coleta de métricas de execução.
+
+    Define contadores, histogramas e medidores identificados por nome e
+    rótulos (ex.: {"url_class": "product", "status": "200"}), para que as
+    camadas registrem medições sem depender de como elas são exportadas.
+    """
+
+    @abstractmethod
+    def increment(
+        self, name: str, value: float = 1.0, labels: Mapping[str, str] | None = None
+    ) -> None:
+        """
+        Soma um valor a um contador.
+
+        Args:
+            name: Nome da métrica.
+            value: Valor a somar.
+            labels: Rótulos da série (opcional).
+        """
+        pass
+
+    @abstractmethod
+    def observe(
+        self, name: str, value: float, labels: Mapping[str, str] | None = None
+    ) -> None:
+        """
+        Registra uma observação em um histograma (ex.: latência, tamanho).
+
+        Args:
+            name: Nome da métrica.
+            value: Valor observado.
+            labels: Rótulos da série (opcional).
+        """
+        pass
+
+    @abstractmethod
+    def set_gauge(
+        self, name: str, value: float, labels: Mapping[str, str] | None = None
+    ) -> None:
+        """
+        Define o valor atual de um medidor.
+
+        Args:
+            name: Nome da métrica.
+            value: Valor atual.
+            labels: Rótulos da série (opcional).
+        """
+        pass
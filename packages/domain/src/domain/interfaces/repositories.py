@@ -1,15 +1,20 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from domain.models import Product
+    from domain.models import ListingState, PriceRecord, Product
 
 
 class IProductRepository(ABC):
     """
     Interface para repositórios de produtos.
 
-    Define métodos para criar e atualizar objetos Product na camada de persistência.
+    Define métodos para criar e atualizar objetos Product na camada de persistência,
+    individualmente ou em lote, e para consultá-los por SKU, especificação, faixa
+    de preço e título. Mantém também o histórico das mudanças de preço. As
+    consultas retornam iteradores, consumidos aos poucos.
     """
 
     @abstractmethod
@@ -31,3 +36,168 @@ class IProductRepository(ABC):
             product: Instância de Product com dados atualizados.
         """
         pass
+
+    @abstractmethod
+    def upsert_many(self, products: Iterable["Product"]) -> int:
+        """
+        Cria ou atualiza, em lote, os produtos informados.
+
+        Args:
+            products: Iterável de instâncias de Product a serem persistidas.
+
+        Returns:
+            Quantidade de produtos persistidos.
+        """
+        pass
+
+    @abstractmethod
+    def get_listing_states(self, skus: Iterable[str]) -> dict[str, "ListingState"]:
+        """
+        Retorna o estado de listagem persistido dos produtos informados.
+
+        Args:
+            skus: SKUs dos produtos a consultar.
+
+        Returns:
+            Dicionário de SKU para ListingState, apenas para os SKUs existentes.
+        """
+        pass
+
+    @abstractmethod
+    def find_products(
+        self,
+        specifications: Mapping[str, str] | None = None,
+        *,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        limit: int | None = None,
+    ) -> Iterator["Product"]:
+        """
+        Busca os produtos com as especificações e a faixa de preço informadas.
+
+        Args:
+            specifications: Nome e valor exato de cada especificação exigida
+                (ex.: {"Material": "Madeira"}).
+            min_price: Preço padrão mínimo, inclusive (opcional).
+            max_price: Preço padrão máximo, inclusive (opcional).
+            limit: Quantidade máxima de produtos (opcional).
+
+        Returns:
+            Iterator de Product, em ordem crescente de preço.
+        """
+        pass
+
+    @abstractmethod
+    def get_by_skus(self, skus: Iterable[str]) -> Iterator["Product"]:
+        """
+        Busca os produtos dos SKUs informados.
+
+        Args:
+            skus: SKUs dos produtos.
+
+        Returns:
+            Iterator de Product, apenas para os SKUs existentes.
+        """
+        pass
+
+    @abstractmethod
+    def find_by_price(
+        self,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        *,
+        price_field: str = "price",
+        after: tuple[float, str] | None = None,
+        limit: int | None = None,
+    ) -> Iterator["Product"]:
+        """
+        Busca uma página de produtos por faixa de preço, em ordem de (preço, SKU).
+
+        Args:
+            min_price: Preço mínimo, inclusive (opcional).
+            max_price: Preço máximo, inclusive (opcional).
+            price_field: Campo de preço filtrado ("price" ou "price_pix").
+            after: Preço e SKU do último produto da página anterior, para
+                buscar a página seguinte (opcional).
+            limit: Tamanho da página (opcional).
+
+        Returns:
+            Iterator de Product, em ordem crescente de preço e SKU.
+        """
+        pass
+
+    @abstractmethod
+    def search_titles(
+        self, text: str, *, limit: int | None = None
+    ) -> Iterator["Product"]:
+        """
+        Busca os produtos cujo título contém todas as palavras informadas.
+
+        Args:
+            text: Palavras a buscar (ex.: "mesa madeira").
+            limit: Quantidade máxima de produtos (opcional).
+
+        Returns:
+            Iterator de Product, dos mais relevantes aos menos relevantes.
+        """
+        pass
+
+    @abstractmethod
+    def iter_products(
+        self,
+        *,
+        search_text: str | None = None,
+        updated_since: datetime | None = None,
+        updated_until: datetime | None = None,
+    ) -> Iterator["Product"]:
+        """
+        Percorre todos os produtos, ou os que atendem aos filtros, com uso de
+        memória independente da quantidade de produtos.
+
+        Args:
+            search_text: Palavras que o título deve conter (opcional).
+            updated_since: Gravados a partir deste momento, inclusive
+                (opcional).
+            updated_until: Gravados antes deste momento (opcional).
+
+        Returns:
+            Iterator de Product, sem ordem definida.
+        """
+        pass
+
+    @abstractmethod
+    def get_price_history(
+        self,
+        sku: str,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator["PriceRecord"]:
+        """
+        Retorna o histórico de preços de um produto.
+
+        Args:
+            sku: SKU do produto.
+            since: Início do período, inclusive (opcional).
+            until: Fim do período, exclusive (opcional).
+
+        Returns:
+            Iterator de PriceRecord, do mais antigo ao mais recente.
+        """
+        pass
+
+    @abstractmethod
+    def get_price_changes(
+        self, since: datetime, until: datetime | None = None
+    ) -> Iterator["PriceRecord"]:
+        """
+        Retorna as mudanças de preço de todos os produtos em um período.
+
+        Args:
+            since: Início do período, inclusive.
+            until: Fim do período, exclusive (opcional; por padrão, até agora).
+
+        Returns:
+            Iterator de PriceRecord, do mais antigo ao mais recente.
+        """
+        pass
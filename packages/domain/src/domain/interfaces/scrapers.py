@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Callable, Generator, Iterator
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from domain.models import Product
+    from domain.models import Product, ProductListing
 
 
 class IWebScraper(ABC):
@@ -11,7 +11,9 @@ class IWebScraper(ABC):
     Interface para scrapers de produtos.
 
     Define métodos para coletar produtos e detalhes de produtos a partir de
-    fontes externas.
+    fontes externas. Além da coleta completa (scrape_products), expõe cada
+    etapa separadamente (busca da página, parsing e coleta dos detalhes) para
+    que a camada de aplicação possa executá-las em paralelo.
     """
 
     @abstractmethod
@@ -27,6 +29,81 @@ class IWebScraper(ABC):
         """
         pass
 
+    @abstractmethod
+    def search_page_url(self, query: str, page: int) -> str:
+        """
+        Retorna a URL de uma página de resultados.
+
+        Args:
+            query: Termo de busca.
+            page: Número da página, a partir de 1.
+        """
+        pass
+
+    @abstractmethod
+    def fetch_search_page(self, query: str, page: int) -> str:
+        """
+        Busca o HTML de uma página de resultados.
+
+        Args:
+            query: Termo de busca.
+            page: Número da página, a partir de 1.
+
+        Returns:
+            Conteúdo HTML da página de busca.
+        """
+        pass
+
+    @abstractmethod
+    def parse_search_page(self, html: str) -> list["ProductListing"]:
+        """
+        Extrai os cards de produto de uma página de resultados.
+
+        Args:
+            html: Conteúdo HTML da página de busca.
+
+        Returns:
+            Lista de cards, na ordem da página. Vazia após a última página.
+        """
+        pass
+
+    @abstractmethod
+    def count_search_pages(self, html: str, page_size: int) -> int | None:
+        """
+        Obtém o total de páginas da busca a partir da primeira página, para
+        que as demais possam ser buscadas em paralelo.
+
+        Args:
+            html: Conteúdo HTML da primeira página de busca.
+            page_size: Quantidade de cards da primeira página.
+
+        Returns:
+            Quantidade de páginas, ou None se a página não a informar; nesse
+            caso, as páginas são buscadas até que uma venha vazia.
+        """
+        pass
+
+    @abstractmethod
+    def scrape_listing_details(
+        self,
+        listings: list["ProductListing"],
+        *,
+        on_fetch_error: Callable[["ProductListing", Exception], None] | None = None,
+    ) -> Iterator["Product"]:
+        """
+        Coleta os detalhes dos cards informados e monta os produtos.
+
+        Args:
+            listings: Cards de uma página de busca.
+            on_fetch_error: Função chamada com o card e a exceção quando a
+                página de detalhe não pôde ser lida; o produto não é retornado,
+                mas pode ser coletado em uma nova tentativa (opcional).
+
+        Returns:
+            Iterator de objetos Product, na ordem dos cards.
+        """
+        pass
+
     @abstractmethod
     def scrape_product_details(self, product_url: str) -> dict[str, str]:
         """
@@ -48,6 +125,24 @@ class IHttpClient(ABC):
     Define método para realizar requisições HTTP GET e retornar o conteúdo da resposta.
     """
 
+    def stream(self, url: str, headers: dict[str, str] | None = None) -> Generator[str]:
+        """
+        Realiza uma requisição HTTP GET e retorna o corpo em pedaços.
+
+        Quem só precisa do início da página pode parar de iterar (e fechar o
+        gerador) assim que tiver o necessário. Por padrão, o corpo inteiro de
+        get é retornado em um único pedaço; clientes capazes de ler a resposta
+        aos poucos sobrescrevem este método.
+
+        Args:
+            url: URL de destino da requisição.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Gerador com os pedaços do corpo, já decodificados.
+        """
+        yield self.get(url, headers)
+
     @abstractmethod
     def get(self, url: str, headers: dict[str, str] | None = None) -> str:
         """
@@ -0,0 +1,127 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from domain.models import CrawlTask
+
+
+class IWorkQueue(ABC):
+    """
+    Interface para a fila de trabalho compartilhada por vários workers.
+
+    As tarefas são reservadas por um prazo (lease), renovado pelo worker
+    enquanto ele as processa (heartbeat). Se o worker morrer, o prazo expira e
+    a tarefa volta a ficar disponível para os demais. As tarefas pertencem à
+    coleta atual; cada URL entra nela uma única vez, e uma tarefa que falha é
+    tentada de novo até um limite de tentativas. Uma nova coleta volta a
+    aceitar as URLs das anteriores.
+    """
+
+    @abstractmethod
+    def start_crawl(self, *, force: bool = False) -> bool:
+        """
+        Inicia uma nova coleta se a atual já terminou, isto é, se ela tem
+        tarefas e nenhuma está pendente ou reservada. Workers que entram em
+        uma coleta em andamento continuam nela.
+
+        Args:
+            force: Se True, inicia a nova coleta mesmo que a atual não tenha
+                terminado; as tarefas restantes dela são abandonadas.
+
+        Returns:
+            True se uma nova coleta foi iniciada.
+        """
+        pass
+
+    @abstractmethod
+    def enqueue(self, tasks: Iterable["CrawlTask"]) -> int:
+        """
+        Adiciona tarefas à coleta atual, descartando as de URL já enfileirada
+        nela.
+
+        Args:
+            tasks: Tarefas a adicionar.
+
+        Returns:
+            Quantidade de tarefas novas.
+        """
+        pass
+
+    @abstractmethod
+    def claim(
+        self, worker_id: str, *, lease: timedelta, limit: int = 1
+    ) -> list["CrawlTask"]:
+        """
+        Reserva tarefas disponíveis da coleta atual: pendentes ou com o prazo
+        expirado.
+
+        Args:
+            worker_id: Identificador do worker.
+            lease: Prazo da reserva.
+            limit: Quantidade máxima de tarefas.
+
+        Returns:
+            Tarefas reservadas, possivelmente nenhuma.
+        """
+        pass
+
+    @abstractmethod
+    def heartbeat(
+        self, worker_id: str, task_ids: Iterable[int], *, lease: timedelta
+    ) -> None:
+        """
+        Renova o prazo das tarefas ainda reservadas pelo worker.
+
+        Args:
+            worker_id: Identificador do worker.
+            task_ids: Tarefas em processamento.
+            lease: Novo prazo, a partir de agora.
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, worker_id: str, task_id: int) -> None:
+        """
+        Marca a tarefa como concluída.
+
+        Args:
+            worker_id: Identificador do worker.
+            task_id: Tarefa concluída.
+        """
+        pass
+
+    @abstractmethod
+    def fail(self, worker_id: str, task_id: int, error: str) -> None:
+        """
+        Registra a falha da tarefa, que volta à fila enquanto houver tentativas.
+
+        Args:
+            worker_id: Identificador do worker.
+            task_id: Tarefa que falhou.
+            error: Descrição da falha.
+        """
+        pass
+
+    @abstractmethod
+    def release(self, worker_id: str, task_ids: Iterable[int]) -> None:
+        """
+        Devolve à fila tarefas reservadas e não processadas, sem contar a
+        tentativa (ex.: ao interromper o worker).
+
+        Args:
+            worker_id: Identificador do worker.
+            task_ids: Tarefas a devolver.
+        """
+        pass
+
+    @abstractmethod
+    def counts(self) -> dict[str, int]:
+        """
+        Retorna a quantidade de tarefas da coleta atual por situação.
+
+        Returns:
+            Dicionário com as chaves "pending", "leased", "done" e "failed".
+        """
+        pass
@@ -1,5 +1,17 @@
-from .products import Product
+from .batches import ProductBatch, SpecKeyTable
+from .checkpoints import CrawlCheckpoint
+from .prices import PriceRecord
+from .products import ListingState, Product, ProductListing
+from .tasks import CrawlTask, TaskKind
 
 __all__ = [
+    "CrawlCheckpoint",
+    "CrawlTask",
+    "ListingState",
+    "PriceRecord",
     "Product",
+    "ProductBatch",
+    "ProductListing",
+    "SpecKeyTable",
+    "TaskKind",
 ]
@@ -0,0 +1,191 @@
+import sys
+import threading
+from array import array
+from collections.abc import Iterable, Iterator
+
+from domain.models.products import Product
+
+
+class SpecKeyTable:
+    """
+    Tabela de nomes de especificações ("Marca", "Cor", "Material" etc.).
+
+    Cada nome distinto é guardado uma única vez e identificado por um inteiro,
+    de modo que os lotes armazenam apenas o identificador de cada chave. Uma
+    mesma tabela pode ser compartilhada entre lotes e threads.
+    """
+
+    def __init__(self) -> None:
+        """
+        Inicializa a tabela vazia.
+        """
+        self._keys: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def id_for(self, key: str) -> int:
+        """
+        Retorna o identificador do nome, registrando-o se for novo.
+
+        Args:
+            key: Nome da especificação.
+        """
+        key_id: int | None = self._ids.get(key)
+        if key_id is None:
+            with self._lock:
+                key_id = self._ids.get(key)
+                if key_id is None:
+                    key_id = len(self._keys)
+                    self._keys.append(sys.intern(key))
+                    self._ids[self._keys[key_id]] = key_id
+        return key_id
+
+    def key(self, key_id: int) -> str:
+        """
+        Retorna o nome correspondente ao identificador.
+
+        Args:
+            key_id: Identificador retornado por id_for.
+        """
+        return self._keys[key_id]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class ProductBatch:
+    """
+    Lote de produtos armazenado em colunas.
+
+    Em vez de um objeto Product (com seu dicionário de especificações) por
+    produto, o lote guarda uma lista por coluna de texto, arrays compactos para
+    preços e parcelas e as especificações de todos os produtos em arrays
+    contíguos que referenciam uma tabela de nomes compartilhada. Os objetos
+    Product são montados apenas ao iterar ou indexar o lote, que pode ser
+    passado diretamente a IProductRepository.upsert_many.
+
+    Atributos:
+        skus: SKUs dos produtos, na ordem de inserção.
+        titles: Títulos dos produtos.
+        prices: Preços padrão (array de double).
+        prices_pix: Preços para pagamento via Pix (array de double).
+        prices_installments: Valores da parcela (array de double).
+        installments_counts: Números de parcelas (array de inteiros).
+        key_table: Tabela dos nomes das especificações.
+    """
+
+    def __init__(self, key_table: SpecKeyTable | None = None) -> None:
+        """
+        Inicializa o lote vazio.
+
+        Args:
+            key_table: Tabela de nomes a compartilhar com outros lotes
+                (opcional; por padrão, uma tabela própria).
+        """
+        self.skus: list[str] = []
+        self.titles: list[str] = []
+        self.prices: array[float] = array("d")
+        self.prices_pix: array[float] = array("d")
+        self.prices_installments: array[float] = array("d")
+        self.installments_counts: array[int] = array("l")
+        self.key_table: SpecKeyTable = key_table or SpecKeyTable()
+        # Especificações do produto i: posições spec_offsets[i] a
+        # spec_offsets[i + 1] de spec_key_ids e spec_values
+        self._spec_offsets: array[int] = array("L", [0])
+        self._spec_key_ids: array[int] = array("L")
+        self._spec_values: list[str] = []
+
+    @classmethod
+    def from_products(
+        cls, products: Iterable[Product], key_table: SpecKeyTable | None = None
+    ) -> "ProductBatch":
+        """
+        Cria um lote com os produtos informados.
+
+        Args:
+            products: Produtos a armazenar.
+            key_table: Tabela de nomes a compartilhar (opcional).
+        """
+        batch = cls(key_table)
+        batch.extend(products)
+        return batch
+
+    def append(self, product: Product) -> None:
+        """
+        Adiciona um produto ao final do lote.
+
+        Args:
+            product: Produto a armazenar.
+        """
+        self.skus.append(product.sku)
+        self.titles.append(product.product_title)
+        self.prices.append(product.price)
+        self.prices_pix.append(product.price_pix)
+        self.prices_installments.append(product.price_installments)
+        self.installments_counts.append(product.installments_count)
+        for key, value in product.specifications.items():
+            self._spec_key_ids.append(self.key_table.id_for(key))
+            self._spec_values.append(value)
+        self._spec_offsets.append(len(self._spec_values))
+
+    def extend(self, products: Iterable[Product]) -> None:
+        """
+        Adiciona vários produtos ao final do lote.
+
+        Args:
+            products: Produtos a armazenar.
+        """
+        for product in products:
+            self.append(product)
+
+    def specifications(self, index: int) -> dict[str, str]:
+        """
+        Monta o dicionário de especificações de um produto do lote.
+
+        Args:
+            index: Posição do produto no lote.
+        """
+        start: int = self._spec_offsets[index]
+        end: int = self._spec_offsets[index + 1]
+        table: SpecKeyTable = self.key_table
+        return {
+            table.key(self._spec_key_ids[position]): self._spec_values[position]
+            for position in range(start, end)
+        }
+
+    def clear(self) -> None:
+        """
+        Remove todos os produtos, mantendo a tabela de nomes.
+        """
+        self.skus.clear()
+        self.titles.clear()
+        del self.prices[:]
+        del self.prices_pix[:]
+        del self.prices_installments[:]
+        del self.installments_counts[:]
+        del self._spec_offsets[1:]
+        del self._spec_key_ids[:]
+        self._spec_values.clear()
+
+    def __len__(self) -> int:
+        return len(self.skus)
+
+    def __getitem__(self, index: int) -> Product:
+        if index < 0:
+            index += len(self.skus)
+        if not 0 <= index < len(self.skus):
+            msg = "Índice fora do lote."
+            raise IndexError(msg)
+        return Product(
+            sku=self.skus[index],
+            product_title=self.titles[index],
+            price=self.prices[index],
+            price_pix=self.prices_pix[index],
+            price_installments=self.prices_installments[index],
+            installments_count=self.installments_counts[index],
+            specifications=self.specifications(index),
+        )
+
+    def __iter__(self) -> Iterator[Product]:
+        for index in range(len(self.skus)):
+            yield self[index]
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True, slots=True)
+class CrawlCheckpoint:
+    """
+    Progresso persistido da coleta de um termo de busca, usado para retomá-la.
+
+    Como as páginas são processadas em paralelo, elas podem terminar fora de
+    ordem: além da última página concluída em sequência, o checkpoint guarda as
+    páginas seguintes já concluídas e os SKUs já gravados das páginas ainda em
+    andamento.
+
+    Atributos:
+        search_query: Termo de busca.
+        last_completed_page: Maior página N tal que as páginas 1 a N estão
+            concluídas (0 se nenhuma).
+        completed_pages: Páginas concluídas após last_completed_page.
+        done_skus: SKUs já gravados das páginas após last_completed_page.
+        finished: Se True, a coleta do termo chegou ao fim.
+        updated_at: Momento (UTC) da última atualização.
+    """
+
+    search_query: str
+    last_completed_page: int
+    completed_pages: frozenset[int]
+    done_skus: frozenset[str]
+    finished: bool
+    updated_at: datetime
+
+    def is_page_done(self, page: int) -> bool:
+        """
+        Indica se a página já foi concluída e não precisa ser buscada.
+
+        Args:
+            page: Número da página.
+        """
+        return page <= self.last_completed_page or page in self.completed_pages
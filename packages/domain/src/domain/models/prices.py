@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True, slots=True)
+class PriceRecord:
+    """
+    Preços de um produto a partir de um momento, no histórico de preços.
+
+    Um registro é gravado quando o produto é inserido e a cada mudança de um
+    dos campos de preço ou parcelamento; coletas sem mudança não geram
+    registros.
+
+    Atributos:
+        sku: Código identificador do produto.
+        price: Preço padrão do produto.
+        price_pix: Preço do produto para pagamento via Pix.
+        price_installments: Valor da parcela.
+        installments_count: Número de parcelas.
+        recorded_at: Momento (UTC) em que os preços passaram a valer.
+    """
+
+    sku: str
+    price: float
+    price_pix: float
+    price_installments: float
+    installments_count: int
+    recorded_at: datetime
@@ -1,11 +1,18 @@
+import hashlib
+import sys
 from dataclasses import dataclass
+from datetime import datetime
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Product:
     """
     Representa um produto coletado pelo sistema de scraping.
 
+    Imutável e sem __dict__ por instância. Os nomes das especificações são
+    internados (sys.intern), de modo que todos os produtos compartilham uma
+    única cópia de cada nome; para muitos produtos, veja ProductBatch.
+
     Atributos:
         sku: Código identificador único do produto.
         product_title: Título ou nome do produto.
@@ -23,3 +30,71 @@ class Product:
     price_installments: float
     installments_count: int
     specifications: dict[str, str]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "specifications",
+            {sys.intern(key): value for key, value in self.specifications.items()},
+        )
+
+    def listing_fingerprint(self) -> str:
+        """
+        Calcula a impressão digital dos dados exibidos na listagem de busca.
+
+        Considera apenas os campos disponíveis no card da busca (SKU, título,
+        preços e parcelas), permitindo detectar mudanças sem abrir a página de
+        detalhe do produto.
+
+        Returns:
+            Hash hexadecimal dos campos da listagem.
+        """
+        fields: tuple[str, ...] = (
+            self.sku,
+            self.product_title,
+            repr(self.price),
+            repr(self.price_pix),
+            repr(self.price_installments),
+            str(self.installments_count),
+        )
+        data: bytes = "\x1f".join(fields).encode("utf-8")
+        return hashlib.sha1(data, usedforsecurity=False).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class ProductListing:
+    """
+    Dados de um produto exibidos no card da página de busca.
+
+    Atributos:
+        sku: Código identificador do produto, se presente.
+        product_title: Título do produto, se presente.
+        price: Preço padrão do produto.
+        price_pix: Preço do produto para pagamento via Pix.
+        price_installments: Valor da parcela.
+        installments_count: Número de parcelas.
+        product_url: URL absoluta da página de detalhe, se presente.
+    """
+
+    sku: str | None
+    product_title: str | None
+    price: float
+    price_pix: float
+    price_installments: float
+    installments_count: int
+    product_url: str | None
+
+
+@dataclass(frozen=True)
+class ListingState:
+    """
+    Estado persistido de um produto usado na coleta incremental.
+
+    Atributos:
+        listing_fingerprint: Impressão digital da listagem gravada por último.
+        specs_updated_at: Momento (UTC) da última coleta das especificações, ou
+            None se elas nunca foram coletadas com sucesso.
+    """
+
+    listing_fingerprint: str | None
+    specs_updated_at: datetime | None
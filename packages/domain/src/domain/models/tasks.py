@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from typing import Literal
+
+from domain.models.products import ProductListing
+
+# Tipo de tarefa: página de busca ou página de detalhe de um produto
+type TaskKind = Literal["search", "product"]
+
+
+@dataclass(frozen=True, slots=True)
+class CrawlTask:
+    """
+    Tarefa da fila de trabalho de uma coleta distribuída.
+
+    Cada tarefa corresponde a uma URL, única na coleta: uma página de busca de
+    um termo ou a página de detalhe de um produto, que leva junto os dados do
+    card para montar o produto.
+
+    Atributos:
+        kind: "search" para páginas de busca e "product" para páginas de
+            detalhe.
+        url: URL da página, usada para descartar tarefas repetidas na mesma
+            coleta.
+        search_query: Termo de busca de origem.
+        page: Número da página de busca (apenas em tarefas "search").
+        last_page: Total de páginas da busca, quando informado pela primeira
+            página; sem ele, cada página com produtos enfileira a seguinte.
+        listing: Dados do card do produto (apenas em tarefas "product").
+        task_id: Identificador na fila, ou None antes de ser enfileirada.
+        attempts: Quantidade de vezes em que a tarefa já foi reservada.
+    """
+
+    kind: TaskKind
+    url: str
+    search_query: str
+    page: int | None = None
+    last_page: int | None = None
+    listing: ProductListing | None = None
+    task_id: int | None = None
+    attempts: int = 0
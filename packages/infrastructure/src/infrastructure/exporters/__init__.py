@@ -0,0 +1,17 @@
+from .file_exporters import (
+    BASE_COLUMNS,
+    EXPORT_FORMATS,
+    CsvExporter,
+    FileProductExporter,
+    JsonlExporter,
+    create_exporter,
+)
+
+__all__ = [
+    "BASE_COLUMNS",
+    "EXPORT_FORMATS",
+    "CsvExporter",
+    "FileProductExporter",
+    "JsonlExporter",
+    "create_exporter",
+]
@@ -0,0 +1,180 @@
+import csv
+import importlib.util
+import json
+from collections.abc import Sequence
+from types import TracebackType
+from typing import IO, Self, override
+
+from domain.interfaces import IProductExporter
+from domain.models import ProductBatch
+
+from infrastructure.validations import InfrastructureError
+
+# Colunas com os campos do produto, na ordem em que são exportadas
+BASE_COLUMNS: tuple[str, ...] = (
+    "sku",
+    "product_title",
+    "price",
+    "price_pix",
+    "price_installments",
+    "installments_count",
+)
+
+
+class FileProductExporter(IProductExporter):
+    """
+    Base dos exportadores que gravam os produtos em um arquivo de texto.
+
+    O arquivo é aberto na criação e cada lote é gravado assim que recebido.
+    Pode ser usado como gerenciador de contexto, que chama close ao sair.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Abre o arquivo de destino, substituindo-o se já existir.
+
+        Args:
+            path: Caminho do arquivo.
+        """
+        self._file: IO[str] = open(path, "w", encoding="utf-8", newline="")  # noqa: SIM115
+
+    @override
+    def close(self) -> None:
+        """
+        Fecha o arquivo.
+        """
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class JsonlExporter(FileProductExporter):
+    """
+    Exporta os produtos em JSON Lines: um objeto JSON por linha, com as
+    especificações em um objeto aninhado.
+    """
+
+    @override
+    def write(self, batch: ProductBatch) -> None:
+        """
+        Grava uma linha por produto do lote.
+
+        Args:
+            batch: Lote de produtos.
+        """
+        lines: list[str] = [
+            json.dumps(
+                {
+                    "sku": batch.skus[index],
+                    "product_title": batch.titles[index],
+                    "price": batch.prices[index],
+                    "price_pix": batch.prices_pix[index],
+                    "price_installments": batch.prices_installments[index],
+                    "installments_count": batch.installments_counts[index],
+                    "specifications": batch.specifications(index),
+                },
+                ensure_ascii=False,
+            )
+            + "\n"
+            for index in range(len(batch))
+        ]
+        self._file.writelines(lines)
+
+
+class CsvExporter(FileProductExporter):
+    """
+    Exporta os produtos em CSV, uma linha por produto.
+
+    As especificações são achatadas em uma coluna por nome escolhido (vazia
+    quando o produto não a tem); sem nomes escolhidos, vão em uma única coluna
+    "specifications" com o JSON do dicionário.
+    """
+
+    def __init__(self, path: str, spec_columns: Sequence[str] = ()) -> None:
+        """
+        Abre o arquivo de destino e grava o cabeçalho.
+
+        Args:
+            path: Caminho do arquivo.
+            spec_columns: Nomes das especificações exportadas como colunas
+                (ex.: ["Marca", "Cor"]).
+        """
+        super().__init__(path)
+        self._spec_columns: tuple[str, ...] = tuple(spec_columns)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(
+            BASE_COLUMNS + (self._spec_columns or ("specifications",))
+        )
+
+    @override
+    def write(self, batch: ProductBatch) -> None:
+        """
+        Grava uma linha por produto do lote.
+
+        Args:
+            batch: Lote de produtos.
+        """
+        rows: list[list[object]] = []
+        for index in range(len(batch)):
+            specifications: dict[str, str] = batch.specifications(index)
+            specs: list[object] = (
+                [specifications.get(column, "") for column in self._spec_columns]
+                if self._spec_columns
+                else [json.dumps(specifications, ensure_ascii=False)]
+            )
+            rows.append(
+                [
+                    batch.skus[index],
+                    batch.titles[index],
+                    batch.prices[index],
+                    batch.prices_pix[index],
+                    batch.prices_installments[index],
+                    batch.installments_counts[index],
+                    *specs,
+                ]
+            )
+        self._writer.writerows(rows)
+
+
+EXPORT_FORMATS: tuple[str, ...] = ("jsonl", "csv", "parquet")
+
+
+def create_exporter(
+    export_format: str, path: str, spec_columns: Sequence[str] = ()
+) -> IProductExporter:
+    """
+    Cria o exportador do formato solicitado.
+
+    Args:
+        export_format: Um dos nomes em EXPORT_FORMATS.
+        path: Caminho do arquivo de destino.
+        spec_columns: Nomes das especificações exportadas como colunas (usado
+            por CSV e Parquet).
+
+    Returns:
+        Exportador pronto para receber lotes.
+    """
+    InfrastructureError.when(
+        has_error=export_format not in EXPORT_FORMATS,
+        message=f"Formato de exportação desconhecido: {export_format}",
+    )
+    if export_format == "jsonl":
+        return JsonlExporter(path)
+    if export_format == "csv":
+        return CsvExporter(path, spec_columns)
+    InfrastructureError.when(
+        has_error=importlib.util.find_spec("pyarrow") is None,
+        message="A exportação em Parquet requer o pacote pyarrow.",
+    )
+    from infrastructure.exporters.parquet_exporter import ParquetExporter
+
+    return ParquetExporter(path, spec_columns)
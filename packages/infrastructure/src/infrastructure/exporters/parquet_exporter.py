@@ -0,0 +1,101 @@
+# pyarrow não tem anotações de tipo completas
+# pyright: reportMissingTypeStubs=false, reportUnknownMemberType=false
+# pyright: reportUnknownArgumentType=false, reportUnknownVariableType=false
+from collections.abc import Sequence
+from types import TracebackType
+from typing import Self, override
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from domain.interfaces import IProductExporter
+from domain.models import ProductBatch
+
+
+class ParquetExporter(IProductExporter):
+    """
+    Exporta os produtos em Parquet, gravando cada lote como um row group.
+
+    As especificações vão em uma coluna do tipo map<string, string> e, além
+    dela, em uma coluna por nome escolhido. As colunas de preço são montadas
+    diretamente dos arrays do lote.
+
+    Requer o pacote opcional pyarrow.
+    """
+
+    def __init__(self, path: str, spec_columns: Sequence[str] = ()) -> None:
+        """
+        Cria o arquivo de destino com o esquema fixo da exportação.
+
+        Args:
+            path: Caminho do arquivo.
+            spec_columns: Nomes das especificações exportadas como colunas
+                próprias (ex.: ["Marca", "Cor"]).
+        """
+        self._spec_columns: tuple[str, ...] = tuple(spec_columns)
+        self._schema: pa.Schema = pa.schema(
+            [
+                ("sku", pa.string()),
+                ("product_title", pa.string()),
+                ("price", pa.float64()),
+                ("price_pix", pa.float64()),
+                ("price_installments", pa.float64()),
+                ("installments_count", pa.int64()),
+                ("specifications", pa.map_(pa.string(), pa.string())),
+                *((column, pa.string()) for column in self._spec_columns),
+            ]
+        )
+        self._writer: pq.ParquetWriter = pq.ParquetWriter(path, self._schema)
+
+    @override
+    def write(self, batch: ProductBatch) -> None:
+        """
+        Grava o lote como um row group.
+
+        Args:
+            batch: Lote de produtos.
+        """
+        if not batch:
+            return
+        specifications: list[dict[str, str]] = [
+            batch.specifications(index) for index in range(len(batch))
+        ]
+        columns: list[object] = [
+            batch.skus,
+            batch.titles,
+            batch.prices,
+            batch.prices_pix,
+            batch.prices_installments,
+            batch.installments_counts,
+            [list(specs.items()) for specs in specifications],
+            *(
+                [specs.get(column) for specs in specifications]
+                for column in self._spec_columns
+            ),
+        ]
+        self._writer.write_table(
+            pa.Table.from_arrays(
+                [
+                    pa.array(values, type=field.type)
+                    for values, field in zip(columns, self._schema, strict=True)
+                ],
+                schema=self._schema,
+            )
+        )
+
+    @override
+    def close(self) -> None:
+        """
+        Grava o rodapé do arquivo e o fecha.
+        """
+        self._writer.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,3 @@
+from .registry import DEFAULT_BUCKETS, SIZE_BUCKETS, MetricsRegistry
+
+__all__ = ["DEFAULT_BUCKETS", "SIZE_BUCKETS", "MetricsRegistry"]
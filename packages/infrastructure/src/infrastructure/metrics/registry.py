@@ -0,0 +1,335 @@
+import bisect
+import json
+import math
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, override
+
+from domain.interfaces import IMetrics
+
+type _LabelKey = tuple[tuple[str, str], ...]
+
+# Limites, em segundos, dos buckets padrão dos histogramas de latência
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Limites dos buckets padrão dos demais histogramas (tamanhos e quantidades)
+SIZE_BUCKETS: tuple[float, ...] = tuple(
+    float(mantissa * 10**exponent) for exponent in range(7) for mantissa in (1, 2, 5)
+)
+
+
+@dataclass(slots=True)
+class _Histogram:
+    """
+    Histograma cumulativo no formato do Prometheus.
+    """
+
+    bounds: tuple[float, ...]
+    counts: list[int]
+    count: int = 0
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+
+    def observe(self, value: float) -> None:
+        """
+        Registra uma observação.
+
+        Args:
+            value: Valor observado.
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estima um quantil pelo limite superior do bucket que o contém.
+
+        Args:
+            q: Quantil entre 0 e 1.
+        """
+        if self.count == 0:
+            return 0.0
+        rank: float = q * self.count
+        seen: int = 0
+        for bound, bucket_count in zip(self.bounds, self.counts, strict=False):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bound, self.maximum)
+        return self.maximum
+
+
+@dataclass(slots=True)
+class _Family:
+    """
+    Séries de uma métrica, por combinação de rótulos.
+    """
+
+    kind: str
+    series: dict[_LabelKey, Any] = field(default_factory=dict[_LabelKey, Any])
+
+
+class MetricsRegistry(IMetrics):
+    """
+    Registro de métricas em memória, seguro para uso entre threads.
+
+    Ao final da execução, as métricas podem ser exportadas como um resumo JSON
+    (com contagem, soma, média, mínimo, máximo e quantis aproximados dos
+    histogramas) ou como um arquivo texto no formato do Prometheus, para o
+    coletor "textfile" do node_exporter.
+    """
+
+    def __init__(
+        self,
+        namespace: str = "scraper",
+        buckets: Mapping[str, tuple[float, ...]] | None = None,
+    ) -> None:
+        """
+        Inicializa o registro vazio.
+
+        Args:
+            namespace: Prefixo dos nomes das métricas na exportação.
+            buckets: Limites dos buckets por nome de histograma. Os ausentes
+                usam DEFAULT_BUCKETS se o nome terminar em "_seconds" e
+                SIZE_BUCKETS caso contrário.
+        """
+        self._namespace: str = namespace
+        self._buckets: dict[str, tuple[float, ...]] = dict(buckets or {})
+        self._families: dict[str, _Family] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def _label_key(labels: Mapping[str, str] | None) -> _LabelKey:
+        """
+        Normaliza os rótulos em uma chave ordenada.
+
+        Args:
+            labels: Rótulos da série.
+        """
+        return tuple(sorted((labels or {}).items()))
+
+    def _family(self, name: str, kind: str) -> _Family:
+        """
+        Retorna a família da métrica, criando-a se necessário.
+
+        Deve ser chamado com o lock adquirido.
+
+        Args:
+            name: Nome da métrica.
+            kind: Tipo da métrica ("counter", "gauge" ou "histogram").
+        """
+        family: _Family | None = self._families.get(name)
+        if family is None:
+            family = self._families[name] = _Family(kind)
+        elif family.kind != kind:
+            msg = f"A métrica '{name}' já foi registrada como {family.kind}."
+            raise ValueError(msg)
+        return family
+
+    @override
+    def increment(
+        self, name: str, value: float = 1.0, labels: Mapping[str, str] | None = None
+    ) -> None:
+        """
+        Soma um valor a um contador.
+
+        Args:
+            name: Nome da métrica.
+            value: Valor a somar.
+            labels: Rótulos da série (opcional).
+        """
+        key: _LabelKey = self._label_key(labels)
+        with self._lock:
+            series: dict[_LabelKey, Any] = self._family(name, "counter").series
+            series[key] = series.get(key, 0.0) + value
+
+    @override
+    def observe(
+        self, name: str, value: float, labels: Mapping[str, str] | None = None
+    ) -> None:
+        """
+        Registra uma observação em um histograma.
+
+        Args:
+            name: Nome da métrica.
+            value: Valor observado.
+            labels: Rótulos da série (opcional).
+        """
+        key: _LabelKey = self._label_key(labels)
+        with self._lock:
+            series: dict[_LabelKey, Any] = self._family(name, "histogram").series
+            histogram: _Histogram | None = series.get(key)
+            if histogram is None:
+                bounds: tuple[float, ...] = self._buckets.get(
+                    name,
+                    DEFAULT_BUCKETS if name.endswith("_seconds") else SIZE_BUCKETS,
+                )
+                histogram = series[key] = _Histogram(bounds, [0] * (len(bounds) + 1))
+            histogram.observe(value)
+
+    @override
+    def set_gauge(
+        self, name: str, value: float, labels: Mapping[str, str] | None = None
+    ) -> None:
+        """
+        Define o valor atual de um medidor.
+
+        Args:
+            name: Nome da métrica.
+            value: Valor atual.
+            labels: Rótulos da série (opcional).
+        """
+        key: _LabelKey = self._label_key(labels)
+        with self._lock:
+            self._family(name, "gauge").series[key] = value
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Retorna todas as métricas em um dicionário serializável em JSON.
+
+        Returns:
+            Dicionário de nome da métrica para tipo e lista de séries.
+        """
+        result: dict[str, Any] = {}
+        with self._lock:
+            for name, family in sorted(self._families.items()):
+                series: list[dict[str, Any]] = []
+                for key, value in sorted(family.series.items()):
+                    entry: dict[str, Any] = {"labels": dict(key)}
+                    if isinstance(value, _Histogram):
+                        entry.update(
+                            count=value.count,
+                            sum=value.total,
+                            mean=value.total / value.count if value.count else 0.0,
+                            min=value.minimum if value.count else 0.0,
+                            max=value.maximum if value.count else 0.0,
+                            p50=value.quantile(0.5),
+                            p90=value.quantile(0.9),
+                            p99=value.quantile(0.99),
+                        )
+                    else:
+                        entry["value"] = value
+                    series.append(entry)
+                result[name] = {"type": family.kind, "series": series}
+        return result
+
+    def to_prometheus(self) -> str:
+        """
+        Formata as métricas no formato texto de exposição do Prometheus.
+
+        Returns:
+            Conteúdo do arquivo, terminado por quebra de linha.
+        """
+        lines: list[str] = []
+        with self._lock:
+            for name, family in sorted(self._families.items()):
+                full_name: str = f"{self._namespace}_{name}"
+                lines.append(f"# TYPE {full_name} {family.kind}")
+                for key, value in sorted(family.series.items()):
+                    if isinstance(value, _Histogram):
+                        lines.extend(self._histogram_lines(full_name, key, value))
+                    else:
+                        lines.append(f"{full_name}{_format_labels(key)} {value!r}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _histogram_lines(
+        full_name: str, key: _LabelKey, histogram: _Histogram
+    ) -> list[str]:
+        """
+        Formata as linhas _bucket, _sum e _count de um histograma.
+
+        Args:
+            full_name: Nome da métrica com o prefixo.
+            key: Rótulos da série.
+            histogram: Histograma a formatar.
+        """
+        lines: list[str] = []
+        cumulative: int = 0
+        for bound, bucket_count in zip(
+            histogram.bounds, histogram.counts, strict=False
+        ):
+            cumulative += bucket_count
+            labels: str = _format_labels((*key, ("le", repr(bound))))
+            lines.append(f"{full_name}_bucket{labels} {cumulative}")
+        lines.append(
+            f"{full_name}_bucket{_format_labels((*key, ('le', '+Inf')))} "
+            f"{histogram.count}"
+        )
+        lines.append(f"{full_name}_sum{_format_labels(key)} {histogram.total!r}")
+        lines.append(f"{full_name}_count{_format_labels(key)} {histogram.count}")
+        return lines
+
+    def write_json(self, path: str | Path) -> None:
+        """
+        Grava o resumo das métricas em um arquivo JSON.
+
+        Args:
+            path: Caminho do arquivo.
+        """
+        _write_atomically(
+            Path(path), json.dumps(self.summary(), indent=2, ensure_ascii=False)
+        )
+
+    def write_prometheus_textfile(self, path: str | Path) -> None:
+        """
+        Grava as métricas no formato do Prometheus.
+
+        A escrita é atômica (arquivo temporário seguido de rename), como o
+        coletor "textfile" do node_exporter exige.
+
+        Args:
+            path: Caminho do arquivo (por convenção, com extensão .prom).
+        """
+        _write_atomically(Path(path), self.to_prometheus())
+
+
+def _format_labels(key: _LabelKey) -> str:
+    """
+    Formata os rótulos no padrão {nome="valor"}, com escapes do Prometheus.
+
+    Args:
+        key: Rótulos da série.
+    """
+    if not key:
+        return ""
+    escaped: list[str] = [
+        f'{name}="'
+        + value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        + '"'
+        for name, value in key
+    ]
+    return "{" + ",".join(escaped) + "}"
+
+
+def _write_atomically(path: Path, content: str) -> None:
+    """
+    Grava o conteúdo em um arquivo temporário e o move para o destino.
+
+    Args:
+        path: Caminho do arquivo de destino.
+        content: Conteúdo a gravar.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path: Path = path.with_name(f".{path.name}.tmp")
+    temporary_path.write_text(content, encoding="utf-8")
+    temporary_path.replace(path)
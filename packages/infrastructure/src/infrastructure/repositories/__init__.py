@@ -1,3 +1,15 @@
+from .sqlite_checkpoints import SqliteCrawlCheckpointRepository
 from .sqlite_local import SqliteProductRepository
+from .sqlite_work_queue import SqliteWorkQueue
+from .write_behind import (
+    WriteBehindCheckpointRepository,
+    WriteBehindProductRepository,
+)
 
-__all__ = ["SqliteProductRepository"]
+__all__ = [
+    "SqliteCrawlCheckpointRepository",
+    "SqliteProductRepository",
+    "SqliteWorkQueue",
+    "WriteBehindCheckpointRepository",
+    "WriteBehindProductRepository",
+]
@@ -0,0 +1,257 @@
+import sqlite3
+import threading
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from types import TracebackType
+from typing import Self, override
+
+from domain.interfaces import ICrawlCheckpointRepository
+from domain.models import CrawlCheckpoint
+
+
+class SqliteCrawlCheckpointRepository(ICrawlCheckpointRepository):
+    """
+    Implementação concreta do progresso das coletas usando SQLite.
+
+    Usa o mesmo arquivo do repositório de produtos, em tabelas próprias:
+    crawl_checkpoints guarda a última página concluída em sequência de cada
+    termo, e crawl_checkpoint_pages e crawl_checkpoint_skus guardam as páginas
+    concluídas fora de ordem e os SKUs já gravados das páginas em andamento.
+    Quando a sequência avança, essas linhas são descartadas.
+    """
+
+    def __init__(self, db_path: str = "products.db") -> None:
+        """
+        Inicializa o repositório e garante a existência das tabelas.
+
+        Args:
+            db_path: Caminho do arquivo do banco de dados SQLite.
+        """
+        self._db_path: str = db_path
+        self._lock: threading.Lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """
+        Cria as tabelas de progresso, se necessário.
+        """
+        conn: sqlite3.Connection = self._get_connection()
+        with self._lock, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS crawl_checkpoints (
+                    search_query TEXT PRIMARY KEY,
+                    last_completed_page INTEGER NOT NULL DEFAULT 0,
+                    finished INTEGER NOT NULL DEFAULT 0,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS crawl_checkpoint_pages (
+                    search_query TEXT NOT NULL,
+                    page INTEGER NOT NULL,
+                    PRIMARY KEY (search_query, page)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS crawl_checkpoint_skus (
+                    search_query TEXT NOT NULL,
+                    sku TEXT NOT NULL,
+                    page INTEGER NOT NULL,
+                    PRIMARY KEY (search_query, sku)
+                ) WITHOUT ROWID
+            """)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Retorna a conexão persistente com o banco de dados, abrindo-a se preciso.
+        """
+        if self._conn is None:
+            conn: sqlite3.Connection = sqlite3.connect(
+                self._db_path, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+        return self._conn
+
+    @override
+    def load_checkpoint(self, search_query: str) -> CrawlCheckpoint | None:
+        """
+        Retorna o progresso gravado do termo de busca.
+
+        Args:
+            search_query: Termo de busca.
+
+        Returns:
+            CrawlCheckpoint do termo, ou None se não houver progresso gravado.
+        """
+        conn: sqlite3.Connection = self._get_connection()
+        with self._lock:
+            row: tuple[int, int, str] | None = conn.execute(
+                "SELECT last_completed_page, finished, updated_at "
+                "FROM crawl_checkpoints WHERE search_query = ?",
+                (search_query,),
+            ).fetchone()
+            if row is None:
+                return None
+            pages: list[tuple[int]] = conn.execute(
+                "SELECT page FROM crawl_checkpoint_pages WHERE search_query = ?",
+                (search_query,),
+            ).fetchall()
+            skus: list[tuple[str]] = conn.execute(
+                "SELECT sku FROM crawl_checkpoint_skus WHERE search_query = ?",
+                (search_query,),
+            ).fetchall()
+        last_completed_page, finished, updated_at = row
+        return CrawlCheckpoint(
+            search_query=search_query,
+            last_completed_page=last_completed_page,
+            completed_pages=frozenset(page for (page,) in pages),
+            done_skus=frozenset(sku for (sku,) in skus),
+            finished=bool(finished),
+            updated_at=datetime.fromisoformat(updated_at),
+        )
+
+    @override
+    def save_progress(
+        self,
+        search_query: str,
+        page: int,
+        skus: Iterable[str],
+        *,
+        page_completed: bool,
+    ) -> None:
+        """
+        Registra os produtos gravados de uma página e, se for o caso, a
+        conclusão dela, avançando a última página concluída em sequência.
+
+        Args:
+            search_query: Termo de busca.
+            page: Número da página.
+            skus: SKUs dos produtos da página já gravados.
+            page_completed: Se True, todos os produtos da página foram tratados.
+        """
+        conn: sqlite3.Connection = self._get_connection()
+        with self._lock, conn:
+            conn.execute(
+                "INSERT INTO crawl_checkpoints (search_query, updated_at) "
+                "VALUES (?, ?) ON CONFLICT(search_query) DO UPDATE SET "
+                "updated_at = excluded.updated_at",
+                (search_query, datetime.now(UTC).isoformat()),
+            )
+            last_completed_page: int = conn.execute(
+                "SELECT last_completed_page FROM crawl_checkpoints "
+                "WHERE search_query = ?",
+                (search_query,),
+            ).fetchone()[0]
+            if page <= last_completed_page:
+                return
+            conn.executemany(
+                "INSERT OR IGNORE INTO crawl_checkpoint_skus (search_query, sku, page) "
+                "VALUES (?, ?, ?)",
+                ((search_query, sku, page) for sku in skus),
+            )
+            if page_completed:
+                conn.execute(
+                    "INSERT OR IGNORE INTO crawl_checkpoint_pages (search_query, page) "
+                    "VALUES (?, ?)",
+                    (search_query, page),
+                )
+                self._advance(conn, search_query, last_completed_page)
+
+    @staticmethod
+    def _advance(
+        conn: sqlite3.Connection, search_query: str, last_completed_page: int
+    ) -> None:
+        """
+        Avança a última página concluída sobre as páginas seguintes já
+        concluídas e descarta as linhas que deixaram de ser necessárias.
+
+        Args:
+            conn: Conexão com uma transação aberta.
+            search_query: Termo de busca.
+            last_completed_page: Última página concluída em sequência gravada.
+        """
+        pages: list[tuple[int]] = conn.execute(
+            "SELECT page FROM crawl_checkpoint_pages "
+            "WHERE search_query = ? ORDER BY page",
+            (search_query,),
+        ).fetchall()
+        last: int = last_completed_page
+        for (page,) in pages:
+            if page != last + 1:
+                break
+            last = page
+        if last == last_completed_page:
+            return
+        conn.execute(
+            "UPDATE crawl_checkpoints SET last_completed_page = ? "
+            "WHERE search_query = ?",
+            (last, search_query),
+        )
+        conn.execute(
+            "DELETE FROM crawl_checkpoint_pages WHERE search_query = ? AND page <= ?",
+            (search_query, last),
+        )
+        conn.execute(
+            "DELETE FROM crawl_checkpoint_skus WHERE search_query = ? AND page <= ?",
+            (search_query, last),
+        )
+
+    @override
+    def mark_finished(self, search_query: str) -> None:
+        """
+        Registra que a coleta do termo de busca chegou ao fim.
+
+        Args:
+            search_query: Termo de busca.
+        """
+        conn: sqlite3.Connection = self._get_connection()
+        with self._lock, conn:
+            conn.execute(
+                "INSERT INTO crawl_checkpoints (search_query, finished, updated_at) "
+                "VALUES (?, 1, ?) ON CONFLICT(search_query) DO UPDATE SET "
+                "finished = 1, updated_at = excluded.updated_at",
+                (search_query, datetime.now(UTC).isoformat()),
+            )
+
+    @override
+    def reset_checkpoint(self, search_query: str) -> None:
+        """
+        Descarta o progresso gravado do termo, para uma coleta do início.
+
+        Args:
+            search_query: Termo de busca.
+        """
+        conn: sqlite3.Connection = self._get_connection()
+        with self._lock, conn:
+            for table in (
+                "crawl_checkpoints",
+                "crawl_checkpoint_pages",
+                "crawl_checkpoint_skus",
+            ):
+                conn.execute(
+                    f"DELETE FROM {table} WHERE search_query = ?",  # noqa: S608
+                    (search_query,),
+                )
+
+    def close(self) -> None:
+        """
+        Fecha a conexão persistente com o banco de dados.
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -1,14 +1,22 @@
 import json
 import sqlite3
-from typing import TYPE_CHECKING, override
+import threading
+import time
+from collections.abc import Generator, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from itertools import batched
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self, override
 
-from domain.interfaces import IProductRepository
+from domain.interfaces import IMetrics, IProductRepository
+from domain.models import ListingState, PriceRecord, Product
 
-if TYPE_CHECKING:
-    from domain.models import Product
+from infrastructure.validations import InfrastructureError
 
-
-# ruff: noqa: W291
+type _ProductRow = tuple[str, str, float, float, float, int, str, str, str | None, str]
+type _SpecRows = list[tuple[str, dict[str, str]]]
 
 
 class SqliteProductRepository(IProductRepository):
@@ -16,25 +24,90 @@ class SqliteProductRepository(IProductRepository):
     Implementação concreta de repositório de produtos usando SQLite.
 
     Responsável por persistir, atualizar e consultar produtos no banco local.
+    Mantém uma única conexão aberta (em modo WAL) durante toda a vida do
+    repositório, compartilhada entre threads sob um lock. As consultas abrem
+    uma conexão somente leitura própria, de modo que não bloqueiam as gravações.
+    Vários processos podem gravar no mesmo arquivo; em um volume de rede, onde
+    o journal em WAL não funciona, use wal=False.
+
+    Além do JSON na coluna specifications, as especificações são gravadas de
+    forma normalizada: spec_keys guarda cada nome uma única vez e product_specs
+    uma linha por (produto, nome, valor), indexada por nome e valor, para que
+    filtros por atributo não precisem ler e decodificar todos os produtos.
+    """
+
+    UPSERT_SQL: str = """
+        INSERT INTO products (
+            sku, product_title, price, price_pix,
+            price_installments, installments_count, specifications,
+            listing_fingerprint, specs_updated_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(sku) DO UPDATE SET
+            product_title = excluded.product_title,
+            price = excluded.price,
+            price_pix = excluded.price_pix,
+            price_installments = excluded.price_installments,
+            installments_count = excluded.installments_count,
+            specifications = excluded.specifications,
+            listing_fingerprint = excluded.listing_fingerprint,
+            specs_updated_at = excluded.specs_updated_at,
+            updated_at = excluded.updated_at
     """
 
-    def __init__(self, db_path: str = "products.db") -> None:
+    # Colunas adicionadas após a primeira versão do esquema, com seus tipos
+    MIGRATED_COLUMNS: tuple[tuple[str, str], ...] = (
+        ("listing_fingerprint", "TEXT"),
+        ("specs_updated_at", "TEXT"),
+        ("updated_at", "TEXT"),
+    )
+
+    # Colunas de preço aceitas nas consultas por faixa, todas indexadas
+    PRICE_COLUMNS: tuple[str, ...] = ("price", "price_pix")
+
+    SELECT_COLUMNS: str = (
+        "p.sku, p.product_title, p.price, p.price_pix, p.price_installments, "
+        "p.installments_count, p.specifications"
+    )
+
+    def __init__(
+        self,
+        db_path: str = "products.db",
+        batch_size: int = 500,
+        metrics: IMetrics | None = None,
+        *,
+        wal: bool = True,
+        busy_timeout: float = 30.0,
+    ) -> None:
         """
         Inicializa o repositório e garante a existência da tabela de produtos.
 
         Args:
             db_path: Caminho do arquivo do banco de dados SQLite.
+            batch_size: Quantidade de produtos gravados por transação em lote.
+            metrics: Destino das métricas de latência e tamanho das gravações
+                (opcional).
+            wal: Se True, usa journal em WAL (recomendado em disco local).
+            busy_timeout: Tempo máximo, em segundos, de espera pelo lock de
+                escrita de outro processo.
         """
         self._db_path: str = db_path
+        self._batch_size: int = batch_size
+        self._metrics: IMetrics | None = metrics
+        self._wal: bool = wal
+        self._busy_timeout: float = busy_timeout
+        self._lock: threading.Lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        # Identificadores dos nomes de especificações já gravados em spec_keys
+        self._spec_key_ids: dict[str, int] = {}
         self._init_database()
 
     def _init_database(self) -> None:
         """
         Inicializa o banco de dados e cria as tabelas necessárias.
         """
-        with sqlite3.connect(self._db_path) as conn:
-            cursor: sqlite3.Cursor = conn.cursor()
-            cursor.execute("""
+        conn: sqlite3.Connection = self._get_connection()
+        with self._lock, conn:
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS products (
                     sku TEXT PRIMARY KEY,
                     product_title TEXT NOT NULL,
@@ -42,33 +115,239 @@ class SqliteProductRepository(IProductRepository):
                     price_pix REAL NOT NULL,
                     price_installments REAL NOT NULL,
                     installments_count INTEGER NOT NULL,
-                    specifications TEXT NOT NULL
+                    specifications TEXT NOT NULL,
+                    listing_fingerprint TEXT,
+                    specs_updated_at TEXT,
+                    updated_at TEXT
                 )
             """)
-            conn.commit()
+            self._migrate(conn)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_products_updated_at "
+                "ON products (updated_at)"
+            )
+            self._init_spec_tables(conn)
+            self._init_search_indexes(conn)
+            self._init_price_history(conn)
 
-    def _get_connection(self) -> sqlite3.Connection:
+    def _init_search_indexes(self, conn: sqlite3.Connection) -> None:
         """
-        Retorna uma conexão com o banco de dados configurado para UTF-8.
+        Cria os índices de preço e o índice de texto completo dos títulos.
+
+        Os índices de preço incluem o SKU, para a paginação por (preço, SKU).
+        O índice FTS5 products_fts usa products como conteúdo externo e é
+        mantido por triggers; em bancos anteriores a ele, é reconstruído a
+        partir dos produtos já gravados.
+
+        Args:
+            conn: Conexão com uma transação aberta.
         """
-        conn: sqlite3.Connection = sqlite3.connect(self._db_path)
-        conn.execute("PRAGMA encoding='UTF-8'")
-        return conn
+        conn.execute("DROP INDEX IF EXISTS idx_products_price")
+        for column in self.PRICE_COLUMNS:
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_products_{column}_sku "
+                f"ON products ({column}, sku)"
+            )
+        existed: bool = (
+            conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' "
+                "AND name = 'products_fts'"
+            ).fetchone()
+            is not None
+        )
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(
+                product_title,
+                content = 'products',
+                content_rowid = 'rowid',
+                tokenize = 'unicode61 remove_diacritics 2'
+            )
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS products_fts_insert
+            AFTER INSERT ON products BEGIN
+                INSERT INTO products_fts (rowid, product_title)
+                VALUES (new.rowid, new.product_title);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS products_fts_update
+            AFTER UPDATE OF product_title ON products
+            WHEN old.product_title IS NOT new.product_title BEGIN
+                INSERT INTO products_fts (products_fts, rowid, product_title)
+                VALUES ('delete', old.rowid, old.product_title);
+                INSERT INTO products_fts (rowid, product_title)
+                VALUES (new.rowid, new.product_title);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS products_fts_delete
+            AFTER DELETE ON products BEGIN
+                INSERT INTO products_fts (products_fts, rowid, product_title)
+                VALUES ('delete', old.rowid, old.product_title);
+            END
+        """)
+        if not existed:
+            conn.execute("INSERT INTO products_fts (products_fts) VALUES ('rebuild')")
 
-    def _exists(self, sku: str) -> bool:
+    def _init_price_history(self, conn: sqlite3.Connection) -> None:
         """
-        Verifica se um produto existe pelo SKU.
+        Cria o histórico de preços e os triggers que o alimentam.
+
+        O histórico só recebe uma linha quando o produto é inserido ou quando
+        um campo de preço ou parcelamento muda: o trigger de UPDATE compara os
+        valores antigos e novos da própria linha, sem consulta adicional por
+        produto. Em bancos anteriores ao histórico, os preços atuais são
+        gravados como ponto de partida.
 
         Args:
-            sku: Identificador único do produto.
+            conn: Conexão com uma transação aberta.
+        """
+        existed: bool = (
+            conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' "
+                "AND name = 'price_history'"
+            ).fetchone()
+            is not None
+        )
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS price_history (
+                id INTEGER PRIMARY KEY,
+                sku TEXT NOT NULL,
+                price REAL NOT NULL,
+                price_pix REAL NOT NULL,
+                price_installments REAL NOT NULL,
+                installments_count INTEGER NOT NULL,
+                recorded_at TEXT NOT NULL
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_price_history_sku_time "
+            "ON price_history (sku, recorded_at)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_price_history_time "
+            "ON price_history (recorded_at)"
+        )
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS price_history_insert
+            AFTER INSERT ON products BEGIN
+                INSERT INTO price_history (
+                    sku, price, price_pix, price_installments,
+                    installments_count, recorded_at
+                ) VALUES (
+                    new.sku, new.price, new.price_pix, new.price_installments,
+                    new.installments_count, strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')
+                );
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS price_history_update
+            AFTER UPDATE OF price, price_pix, price_installments, installments_count
+            ON products
+            WHEN old.price IS NOT new.price
+                OR old.price_pix IS NOT new.price_pix
+                OR old.price_installments IS NOT new.price_installments
+                OR old.installments_count IS NOT new.installments_count
+            BEGIN
+                INSERT INTO price_history (
+                    sku, price, price_pix, price_installments,
+                    installments_count, recorded_at
+                ) VALUES (
+                    new.sku, new.price, new.price_pix, new.price_installments,
+                    new.installments_count, strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')
+                );
+            END
+        """)
+        if not existed:
+            conn.execute("""
+                INSERT INTO price_history (
+                    sku, price, price_pix, price_installments,
+                    installments_count, recorded_at
+                )
+                SELECT sku, price, price_pix, price_installments,
+                    installments_count, strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')
+                FROM products
+            """)
 
-        Returns:
-            True se o produto existe, False caso contrário.
+    def _init_spec_tables(self, conn: sqlite3.Connection) -> None:
         """
-        with self._get_connection() as conn:
-            cursor: sqlite3.Cursor = conn.cursor()
-            cursor.execute("SELECT 1 FROM products WHERE sku = ?", (sku,))
-            return cursor.fetchone() is not None
+        Cria as tabelas normalizadas de especificações e, em bancos anteriores
+        a elas, preenche-as a partir do JSON já gravado.
+
+        Args:
+            conn: Conexão com uma transação aberta.
+        """
+        existed: bool = (
+            conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' "
+                "AND name = 'product_specs'"
+            ).fetchone()
+            is not None
+        )
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS spec_keys (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS product_specs (
+                sku TEXT NOT NULL,
+                key_id INTEGER NOT NULL REFERENCES spec_keys (id),
+                value TEXT NOT NULL,
+                PRIMARY KEY (sku, key_id)
+            ) WITHOUT ROWID
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_product_specs_key_value "
+            "ON product_specs (key_id, value)"
+        )
+        if not existed:
+            conn.execute("""
+                INSERT OR IGNORE INTO spec_keys (name)
+                SELECT DISTINCT spec.key
+                FROM products, json_each(products.specifications) AS spec
+            """)
+            conn.execute("""
+                INSERT OR IGNORE INTO product_specs (sku, key_id, value)
+                SELECT products.sku, spec_keys.id, spec.value
+                FROM products, json_each(products.specifications) AS spec
+                JOIN spec_keys ON spec_keys.name = spec.key
+            """)
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """
+        Adiciona a bancos criados por versões anteriores as colunas ausentes.
+
+        Args:
+            conn: Conexão com uma transação aberta.
+        """
+        existing: set[str] = {
+            row[1] for row in conn.execute("PRAGMA table_info(products)")
+        }
+        for column, column_type in self.MIGRATED_COLUMNS:
+            if column not in existing:
+                conn.execute(f"ALTER TABLE products ADD COLUMN {column} {column_type}")
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Retorna a conexão persistente com o banco de dados, abrindo-a se preciso.
+
+        A conexão é configurada para UTF-8, journal em WAL (ou DELETE, com
+        wal=False), sincronização NORMAL e cache de páginas ampliado.
+        """
+        if self._conn is None:
+            conn: sqlite3.Connection = sqlite3.connect(
+                self._db_path, timeout=self._busy_timeout, check_same_thread=False
+            )
+            conn.execute("PRAGMA encoding='UTF-8'")
+            conn.execute(f"PRAGMA journal_mode={'WAL' if self._wal else 'DELETE'}")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA cache_size=-65536")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn = conn
+        return self._conn
 
     def _serialize_specifications(self, specifications: dict[str, str]) -> str:
         """
@@ -82,6 +361,36 @@ class SqliteProductRepository(IProductRepository):
         """
         return json.dumps(specifications, ensure_ascii=False, separators=(",", ":"))
 
+    def _to_row(self, product: "Product") -> _ProductRow:
+        """
+        Converte um produto na tupla de parâmetros do comando de upsert.
+
+        Produtos só são gravados após a leitura da página de detalhe (as
+        falhas são ignoradas pelo scraper), então a data de coleta das
+        especificações é a da gravação mesmo quando a página não tem
+        especificações; assim, o modo incremental não a busca de novo a cada
+        execução.
+
+        Args:
+            product: Instância de Product a ser convertida.
+
+        Returns:
+            Tupla com os valores das colunas da tabela products.
+        """
+        now: str = datetime.now(UTC).isoformat()
+        return (
+            product.sku,
+            product.product_title,
+            product.price,
+            product.price_pix,
+            product.price_installments,
+            product.installments_count,
+            self._serialize_specifications(product.specifications),
+            product.listing_fingerprint(),
+            now,
+            now,
+        )
+
     @override
     def create(self, product: "Product") -> None:
         """
@@ -90,39 +399,122 @@ class SqliteProductRepository(IProductRepository):
         Args:
             product: Instância de Product a ser persistida.
         """
-        if self._exists(product.sku):
-            self.update(product)
-        else:
-            self._insert_new_product(product)
+        self.upsert_many([product])
 
-    def _insert_new_product(self, product: "Product") -> None:
+    @override
+    def upsert_many(self, products: Iterable["Product"]) -> int:
         """
-        Insere um novo produto no banco de dados.
+        Cria ou atualiza os produtos em lotes, um por transação.
+
+        Os produtos são agrupados em lotes de batch_size e gravados com um único
+        executemany por lote. Se a iteração for interrompida, o lote parcial já
+        acumulado é gravado antes de propagar a exceção.
 
         Args:
-            product: Instância de Product a ser inserida.
+            products: Iterável de instâncias de Product a serem persistidas.
+
+        Returns:
+            Quantidade de produtos persistidos.
         """
-        with self._get_connection() as conn:
-            cursor: sqlite3.Cursor = conn.cursor()
+        total: int = 0
+        rows: list[_ProductRow] = []
+        specs: _SpecRows = []
+        try:
+            for product in products:
+                rows.append(self._to_row(product))
+                specs.append((product.sku, product.specifications))
+                if len(rows) >= self._batch_size:
+                    self._write_batch(rows, specs)
+                    total += len(rows)
+                    rows, specs = [], []
+        finally:
+            if rows:
+                self._write_batch(rows, specs)
+                total += len(rows)
+        return total
 
-            cursor.execute(
-                """
-                INSERT INTO products (
-                    sku, product_title, price, price_pix, 
-                    price_installments, installments_count, specifications
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    product.sku,
-                    product.product_title,
-                    product.price,
-                    product.price_pix,
-                    product.price_installments,
-                    product.installments_count,
-                    self._serialize_specifications(product.specifications),
-                ),
+    def _write_batch(self, rows: list[_ProductRow], specs: _SpecRows) -> None:
+        """
+        Grava um lote de linhas e suas especificações em uma única transação.
+
+        Args:
+            rows: Linhas no formato retornado por _to_row.
+            specs: SKU e especificações de cada linha.
+        """
+        conn: sqlite3.Connection = self._get_connection()
+        start: float = time.perf_counter()
+        with self._lock, self._transaction(conn):
+            conn.executemany(self.UPSERT_SQL, rows)
+            self._sync_specifications(conn, specs)
+        if self._metrics is not None:
+            self._metrics.observe(
+                "repository_write_seconds",
+                time.perf_counter() - start,
+                {"operation": "upsert"},
+            )
+            self._metrics.observe(
+                "repository_batch_size", len(rows), {"operation": "upsert"}
             )
-            conn.commit()
+            self._metrics.increment("repository_rows_total", len(rows))
+
+    @contextmanager
+    def _transaction(self, conn: sqlite3.Connection) -> Generator[None]:
+        """
+        Abre uma transação que, se falhar, também descarta os identificadores
+        de nomes de especificações registrados nela.
+
+        Deve ser usado com o lock adquirido.
+
+        Args:
+            conn: Conexão persistente.
+        """
+        try:
+            with conn:
+                yield
+        except BaseException:
+            self._spec_key_ids.clear()
+            raise
+
+    def _sync_specifications(self, conn: sqlite3.Connection, specs: _SpecRows) -> None:
+        """
+        Substitui as especificações normalizadas dos produtos informados.
+
+        Deve ser chamado com o lock adquirido e uma transação aberta.
+
+        Args:
+            conn: Conexão com uma transação aberta.
+            specs: SKU e especificações de cada produto.
+        """
+        conn.executemany(
+            "DELETE FROM product_specs WHERE sku = ?", ((sku,) for sku, _ in specs)
+        )
+        conn.executemany(
+            "INSERT INTO product_specs (sku, key_id, value) VALUES (?, ?, ?)",
+            [
+                (sku, self._spec_key_id(conn, name), value)
+                for sku, specifications in specs
+                for name, value in specifications.items()
+            ],
+        )
+
+    def _spec_key_id(self, conn: sqlite3.Connection, name: str) -> int:
+        """
+        Retorna o identificador do nome de especificação, registrando-o em
+        spec_keys se for novo.
+
+        Args:
+            conn: Conexão com uma transação aberta.
+            name: Nome da especificação.
+        """
+        cached: int | None = self._spec_key_ids.get(name)
+        if cached is not None:
+            return cached
+        conn.execute("INSERT OR IGNORE INTO spec_keys (name) VALUES (?)", (name,))
+        key_id: int = conn.execute(
+            "SELECT id FROM spec_keys WHERE name = ?", (name,)
+        ).fetchone()[0]
+        self._spec_key_ids[name] = key_id
+        return key_id
 
     @override
     def update(self, product: "Product") -> None:
@@ -132,28 +524,447 @@ class SqliteProductRepository(IProductRepository):
         Args:
             product: Instância de Product com dados atualizados.
         """
-        with self._get_connection() as conn:
-            cursor: sqlite3.Cursor = conn.cursor()
-
-            cursor.execute(
+        row: _ProductRow = self._to_row(product)
+        conn: sqlite3.Connection = self._get_connection()
+        with self._lock, self._transaction(conn):
+            cursor: sqlite3.Cursor = conn.execute(
                 """
-                UPDATE products SET 
+                UPDATE products SET
                     product_title = ?,
                     price = ?,
                     price_pix = ?,
                     price_installments = ?,
                     installments_count = ?,
-                    specifications = ?
+                    specifications = ?,
+                    listing_fingerprint = ?,
+                    specs_updated_at = ?,
+                    updated_at = ?
                 WHERE sku = ?
             """,
-                (
-                    product.product_title,
-                    product.price,
-                    product.price_pix,
-                    product.price_installments,
-                    product.installments_count,
-                    self._serialize_specifications(product.specifications),
-                    product.sku,
-                ),
+                (*row[1:], row[0]),
+            )
+            if cursor.rowcount:
+                self._sync_specifications(conn, [(product.sku, product.specifications)])
+
+    @override
+    def get_listing_states(self, skus: Iterable[str]) -> dict[str, ListingState]:
+        """
+        Retorna o estado de listagem persistido dos produtos informados.
+
+        Args:
+            skus: SKUs dos produtos a consultar.
+
+        Returns:
+            Dicionário de SKU para ListingState, apenas para os SKUs existentes.
+        """
+        states: dict[str, ListingState] = {}
+        conn: sqlite3.Connection = self._get_connection()
+        for chunk in batched(skus, self._batch_size, strict=False):
+            placeholders: str = ", ".join("?" * len(chunk))
+            with self._lock:
+                rows: list[tuple[str, str | None, str | None]] = conn.execute(
+                    "SELECT sku, listing_fingerprint, specs_updated_at "  # noqa: S608
+                    f"FROM products WHERE sku IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+            for sku, fingerprint, specs_updated_at in rows:
+                states[sku] = ListingState(
+                    listing_fingerprint=fingerprint,
+                    specs_updated_at=(
+                        datetime.fromisoformat(specs_updated_at)
+                        if specs_updated_at
+                        else None
+                    ),
+                )
+        return states
+
+    @override
+    def find_products(
+        self,
+        specifications: Mapping[str, str] | None = None,
+        *,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        limit: int | None = None,
+    ) -> Iterator[Product]:
+        """
+        Busca os produtos com as especificações e a faixa de preço informadas.
+
+        Cada filtro de especificação usa o índice (key_id, value) de
+        product_specs, e a faixa de preço, o índice de products.price. Os
+        produtos são lidos em blocos por uma conexão própria, à medida que o
+        iterador é consumido.
+
+        Args:
+            specifications: Nome e valor exato de cada especificação exigida
+                (ex.: {"Material": "Madeira"}).
+            min_price: Preço padrão mínimo, inclusive (opcional).
+            max_price: Preço padrão máximo, inclusive (opcional).
+            limit: Quantidade máxima de produtos (opcional).
+
+        Returns:
+            Iterator de Product, em ordem crescente de preço.
+        """
+        joins: list[str] = []
+        conditions: list[str] = []
+        params: list[Any] = []
+        for index, (name, value) in enumerate((specifications or {}).items()):
+            joins.append(
+                f"JOIN spec_keys k{index} ON k{index}.name = ? "
+                f"JOIN product_specs s{index} ON s{index}.key_id = k{index}.id "
+                f"AND s{index}.value = ? AND s{index}.sku = p.sku"
             )
-            conn.commit()
+            params.extend((name, value))
+        if min_price is not None:
+            conditions.append("p.price >= ?")
+            params.append(min_price)
+        if max_price is not None:
+            conditions.append("p.price <= ?")
+            params.append(max_price)
+        sql: str = f"SELECT {self.SELECT_COLUMNS} FROM products p {' '.join(joins)}"  # noqa: S608
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        sql += " ORDER BY p.price, p.sku"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        for row in self._iter_rows(sql, params):
+            yield self._from_row(row)
+
+    @override
+    def get_by_skus(self, skus: Iterable[str]) -> Iterator[Product]:
+        """
+        Busca os produtos dos SKUs informados, em consultas de batch_size SKUs
+        pela chave primária.
+
+        Args:
+            skus: SKUs dos produtos.
+
+        Returns:
+            Iterator de Product, apenas para os SKUs existentes.
+        """
+        with self._reader() as conn:
+            for chunk in batched(skus, self._batch_size, strict=False):
+                placeholders: str = ", ".join("?" * len(chunk))
+                for row in self._fetch(
+                    conn,
+                    f"SELECT {self.SELECT_COLUMNS} FROM products p "  # noqa: S608
+                    f"WHERE p.sku IN ({placeholders})",
+                    chunk,
+                ):
+                    yield self._from_row(row)
+
+    @override
+    def find_by_price(
+        self,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        *,
+        price_field: str = "price",
+        after: tuple[float, str] | None = None,
+        limit: int | None = None,
+    ) -> Iterator[Product]:
+        """
+        Busca uma página de produtos por faixa de preço, em ordem de (preço, SKU).
+
+        A paginação é por chave (keyset): a página seguinte começa após o preço
+        e o SKU do último produto recebido, usando o índice (preço, SKU) sem
+        percorrer as páginas anteriores.
+
+        Args:
+            min_price: Preço mínimo, inclusive (opcional).
+            max_price: Preço máximo, inclusive (opcional).
+            price_field: Coluna de preço filtrada ("price" ou "price_pix").
+            after: Preço e SKU do último produto da página anterior (opcional).
+            limit: Tamanho da página (opcional).
+
+        Returns:
+            Iterator de Product, em ordem crescente de preço e SKU.
+        """
+        InfrastructureError.when(
+            has_error=price_field not in self.PRICE_COLUMNS,
+            message=f"Campo de preço inválido: {price_field!r}.",
+        )
+        column: str = f"p.{price_field}"
+        conditions: list[str] = []
+        params: list[Any] = []
+        if min_price is not None:
+            conditions.append(f"{column} >= ?")
+            params.append(min_price)
+        if max_price is not None:
+            conditions.append(f"{column} <= ?")
+            params.append(max_price)
+        if after is not None:
+            conditions.append(f"({column}, p.sku) > (?, ?)")
+            params.extend(after)
+        sql: str = f"SELECT {self.SELECT_COLUMNS} FROM products p"  # noqa: S608
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        sql += f" ORDER BY {column}, p.sku"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        for row in self._iter_rows(sql, params):
+            yield self._from_row(row)
+
+    @override
+    def search_titles(
+        self, text: str, *, limit: int | None = None
+    ) -> Iterator[Product]:
+        """
+        Busca os produtos cujo título contém todas as palavras informadas.
+
+        Usa o índice de texto completo products_fts, sem diferenciar
+        maiúsculas nem acentos; o texto é tratado como palavras, não como
+        sintaxe do FTS5.
+
+        Args:
+            text: Palavras a buscar (ex.: "mesa madeira").
+            limit: Quantidade máxima de produtos (opcional).
+
+        Returns:
+            Iterator de Product, dos mais relevantes aos menos relevantes.
+        """
+        if not text.split():
+            return
+        sql: str = (
+            f"SELECT {self.SELECT_COLUMNS} FROM products_fts "  # noqa: S608
+            "JOIN products p ON p.rowid = products_fts.rowid "
+            "WHERE products_fts MATCH ? ORDER BY products_fts.rank"
+        )
+        params: list[Any] = [_match_expression(text)]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        for row in self._iter_rows(sql, params):
+            yield self._from_row(row)
+
+    @override
+    def iter_products(
+        self,
+        *,
+        search_text: str | None = None,
+        updated_since: datetime | None = None,
+        updated_until: datetime | None = None,
+    ) -> Iterator[Product]:
+        """
+        Percorre todos os produtos, ou os que atendem aos filtros, sem
+        ordenação, lendo-os em blocos de batch_size.
+
+        O uso de memória não depende da quantidade de produtos: a consulta é
+        percorrida por um cursor e apenas um bloco fica em memória por vez.
+
+        Args:
+            search_text: Palavras que o título deve conter, pelo índice de
+                texto completo (opcional).
+            updated_since: Gravados a partir deste momento, inclusive
+                (opcional).
+            updated_until: Gravados antes deste momento (opcional).
+
+        Returns:
+            Iterator de Product.
+        """
+        joins: str = ""
+        conditions: list[str] = []
+        params: list[Any] = []
+        if search_text is not None:
+            joins = "JOIN products_fts ON products_fts.rowid = p.rowid"
+            conditions.append("products_fts MATCH ?")
+            params.append(_match_expression(search_text))
+        if updated_since is not None:
+            conditions.append("p.updated_at >= ?")
+            params.append(updated_since.astimezone(UTC).isoformat())
+        if updated_until is not None:
+            conditions.append("p.updated_at < ?")
+            params.append(updated_until.astimezone(UTC).isoformat())
+        sql: str = f"SELECT {self.SELECT_COLUMNS} FROM products p {joins}"  # noqa: S608
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        for row in self._iter_rows(sql, params):
+            yield self._from_row(row)
+
+    @override
+    def get_price_history(
+        self,
+        sku: str,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[PriceRecord]:
+        """
+        Retorna o histórico de preços de um produto, pelo índice (sku, momento).
+
+        Args:
+            sku: SKU do produto.
+            since: Início do período, inclusive (opcional).
+            until: Fim do período, exclusive (opcional).
+
+        Returns:
+            Iterator de PriceRecord, do mais antigo ao mais recente.
+        """
+        conditions: list[str] = ["sku = ?"]
+        params: list[Any] = [sku]
+        if since is not None:
+            conditions.append("recorded_at >= ?")
+            params.append(_to_timestamp(since))
+        if until is not None:
+            conditions.append("recorded_at < ?")
+            params.append(_to_timestamp(until))
+        yield from self._iter_price_records(conditions, params)
+
+    @override
+    def get_price_changes(
+        self, since: datetime, until: datetime | None = None
+    ) -> Iterator[PriceRecord]:
+        """
+        Retorna as mudanças de preço de todos os produtos em um período, pelo
+        índice de momento.
+
+        Args:
+            since: Início do período, inclusive.
+            until: Fim do período, exclusive (opcional; por padrão, até agora).
+
+        Returns:
+            Iterator de PriceRecord, do mais antigo ao mais recente.
+        """
+        conditions: list[str] = ["recorded_at >= ?"]
+        params: list[Any] = [_to_timestamp(since)]
+        if until is not None:
+            conditions.append("recorded_at < ?")
+            params.append(_to_timestamp(until))
+        yield from self._iter_price_records(conditions, params)
+
+    def _iter_price_records(
+        self, conditions: list[str], params: list[Any]
+    ) -> Iterator[PriceRecord]:
+        """
+        Lê as linhas do histórico de preços que atendem às condições.
+
+        Args:
+            conditions: Condições SQL, combinadas com AND.
+            params: Parâmetros das condições.
+        """
+        sql: str = (
+            "SELECT sku, price, price_pix, price_installments, "  # noqa: S608
+            "installments_count, recorded_at FROM price_history "
+            f"WHERE {' AND '.join(conditions)} ORDER BY recorded_at, id"
+        )
+        for sku, price, price_pix, installments, count, recorded_at in self._iter_rows(
+            sql, params
+        ):
+            yield PriceRecord(
+                sku=sku,
+                price=price,
+                price_pix=price_pix,
+                price_installments=installments,
+                installments_count=count,
+                recorded_at=datetime.fromisoformat(recorded_at),
+            )
+
+    @contextmanager
+    def _reader(self) -> Generator[sqlite3.Connection]:
+        """
+        Abre uma conexão somente leitura própria, fechada ao sair do bloco.
+
+        Em modo WAL, as leituras por essa conexão não bloqueiam nem são
+        bloqueadas pelas gravações da conexão persistente.
+        """
+        conn: sqlite3.Connection = sqlite3.connect(
+            Path(self._db_path).resolve().as_uri() + "?mode=ro",
+            uri=True,
+            timeout=self._busy_timeout,
+        )
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _fetch(
+        self, conn: sqlite3.Connection, sql: str, params: Iterable[Any] = ()
+    ) -> Iterator[Any]:
+        """
+        Executa uma consulta e retorna as linhas em blocos de batch_size.
+
+        Args:
+            conn: Conexão de leitura.
+            sql: Comando SELECT.
+            params: Parâmetros do comando.
+        """
+        cursor: sqlite3.Cursor = conn.execute(sql, tuple(params))
+        while rows := cursor.fetchmany(self._batch_size):
+            yield from rows
+
+    def _iter_rows(self, sql: str, params: Iterable[Any] = ()) -> Iterator[Any]:
+        """
+        Executa uma consulta em uma conexão somente leitura própria e retorna
+        as linhas em blocos de batch_size.
+
+        A conexão é fechada quando o iterador termina ou é descartado.
+
+        Args:
+            sql: Comando SELECT.
+            params: Parâmetros do comando.
+        """
+        with self._reader() as conn:
+            yield from self._fetch(conn, sql, params)
+
+    @staticmethod
+    def _from_row(row: tuple[str, str, float, float, float, int, str]) -> Product:
+        """
+        Converte uma linha de SELECT_COLUMNS em Product.
+
+        Args:
+            row: Valores das colunas, na ordem de SELECT_COLUMNS.
+        """
+        sku, title, price, price_pix, price_installments, installments, specs = row
+        return Product(
+            sku=sku,
+            product_title=title,
+            price=price,
+            price_pix=price_pix,
+            price_installments=price_installments,
+            installments_count=installments,
+            specifications=json.loads(specs),
+        )
+
+    def close(self) -> None:
+        """
+        Fecha a conexão persistente com o banco de dados.
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _to_timestamp(moment: datetime) -> str:
+    """
+    Formata um momento como os triggers de price_history o gravam (UTC, em
+    milissegundos), para que a comparação de texto siga a ordem cronológica.
+
+    Args:
+        moment: Momento; se ingênuo, é interpretado no fuso local.
+    """
+    return moment.astimezone(UTC).isoformat(timespec="milliseconds")
+
+
+def _match_expression(text: str) -> str:
+    """
+    Converte palavras em uma expressão MATCH do FTS5 que exige todas elas,
+    tratando cada uma como texto literal.
+
+    Args:
+        text: Palavras a buscar.
+    """
+    return " ".join('"' + term.replace('"', '""') + '"' for term in text.split())
@@ -0,0 +1,431 @@
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from datetime import timedelta
+from types import TracebackType
+from typing import Self, override
+
+from domain.interfaces import IWorkQueue
+from domain.models import CrawlTask, ProductListing, TaskKind
+
+from infrastructure.validations import InfrastructureError
+
+type _TaskRow = tuple[str, str, str, int | None, int | None, str | None]
+type _ClaimedRow = tuple[
+    int, TaskKind, str, str, int | None, int | None, str | None, int
+]
+
+# Cada URL é única dentro de uma coleta, e não em toda a fila
+_CREATE_TASKS_TABLE = """
+    CREATE TABLE IF NOT EXISTS crawl_tasks (
+        id INTEGER PRIMARY KEY,
+        crawl_id INTEGER NOT NULL REFERENCES crawls (id),
+        url TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        search_query TEXT NOT NULL,
+        page INTEGER,
+        last_page INTEGER,
+        listing TEXT,
+        status TEXT NOT NULL DEFAULT 'pending',
+        worker_id TEXT,
+        lease_expires_at REAL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        last_error TEXT,
+        UNIQUE (crawl_id, url)
+    )
+"""
+
+
+class SqliteWorkQueue(IWorkQueue):
+    """
+    Implementação concreta da fila de trabalho usando SQLite.
+
+    A tabela crawls registra as coletas, e a de maior id é a atual. A tabela
+    crawl_tasks guarda uma linha por URL de cada coleta (chave única
+    (crawl_id, url)), com a situação da tarefa (pending, leased, done ou
+    failed), o worker que a reservou, o fim do prazo da reserva em segundos
+    desde a época (relógio do sistema) e as tentativas. Apenas as tarefas da
+    coleta atual são enfileiradas, reservadas e contadas. A reserva é feita em
+    um único UPDATE ... RETURNING, de modo que dois workers, em processos ou
+    máquinas diferentes, nunca reservam a mesma tarefa.
+
+    Vários processos podem usar o mesmo arquivo. Em um volume de rede, onde o
+    journal em WAL não funciona, use wal=False; os relógios das máquinas devem
+    estar sincronizados, pois os prazos são comparados entre elas.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "crawl_queue.db",
+        *,
+        max_attempts: int = 3,
+        wal: bool = True,
+        busy_timeout: float = 30.0,
+    ) -> None:
+        """
+        Inicializa a fila e garante a existência das tabelas.
+
+        Args:
+            db_path: Caminho do arquivo do banco de dados SQLite.
+            max_attempts: Tentativas de cada tarefa antes de marcá-la como
+                failed.
+            wal: Se True, usa journal em WAL (recomendado em disco local).
+            busy_timeout: Tempo máximo, em segundos, de espera pelo lock de
+                escrita de outro processo.
+        """
+        InfrastructureError.when(
+            has_error=max_attempts < 1,
+            message="max_attempts deve ser maior ou igual a 1.",
+        )
+        self._db_path: str = db_path
+        self._max_attempts: int = max_attempts
+        self._wal: bool = wal
+        self._busy_timeout: float = busy_timeout
+        self._lock: threading.Lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """
+        Cria as tabelas de coletas e de tarefas e os índices, se necessário.
+        """
+        conn: sqlite3.Connection = self._get_connection()
+        with self._lock, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS crawls "
+                "(id INTEGER PRIMARY KEY, started_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "INSERT INTO crawls (id, started_at) SELECT 1, ? "
+                "WHERE NOT EXISTS (SELECT 1 FROM crawls)",
+                (time.time(),),
+            )
+            self._migrate(conn)
+            conn.execute(_CREATE_TASKS_TABLE)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_crawl_tasks_status "
+                "ON crawl_tasks (crawl_id, status, lease_expires_at)"
+            )
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """
+        Converte a tabela de tarefas de versões anteriores, em que cada URL era
+        única em toda a fila: as tarefas existentes passam à primeira coleta.
+
+        Args:
+            conn: Conexão com uma transação aberta.
+        """
+        columns: set[str] = {
+            row[1] for row in conn.execute("PRAGMA table_info(crawl_tasks)")
+        }
+        if not columns or "crawl_id" in columns:
+            return
+        conn.execute("ALTER TABLE crawl_tasks RENAME TO crawl_tasks_old")
+        conn.execute("DROP INDEX IF EXISTS idx_crawl_tasks_status")
+        conn.execute(_CREATE_TASKS_TABLE)
+        conn.execute(
+            "INSERT INTO crawl_tasks SELECT id, 1, url, kind, search_query, page, "
+            "last_page, listing, status, worker_id, lease_expires_at, attempts, "
+            "last_error FROM crawl_tasks_old"
+        )
+        conn.execute("DROP TABLE crawl_tasks_old")
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Retorna a conexão persistente com o banco de dados, abrindo-a se preciso.
+        """
+        if self._conn is None:
+            conn: sqlite3.Connection = sqlite3.connect(
+                self._db_path, timeout=self._busy_timeout, check_same_thread=False
+            )
+            conn.execute(f"PRAGMA journal_mode={'WAL' if self._wal else 'DELETE'}")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+        return self._conn
+
+    @override
+    def start_crawl(self, *, force: bool = False) -> bool:
+        """
+        Inicia uma nova coleta se a atual já terminou.
+
+        A verificação e a criação ocorrem em uma única transação de escrita,
+        de modo que workers que enfileiram termos ao mesmo tempo entram todos
+        na mesma coleta.
+
+        Args:
+            force: Se True, inicia a nova coleta mesmo que a atual tenha
+                tarefas pendentes ou reservadas, que são abandonadas.
+
+        Returns:
+            True se uma nova coleta foi iniciada.
+        """
+        conn: sqlite3.Connection = self._get_connection()
+        with self._lock, conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row: tuple[int, int] = conn.execute(
+                "SELECT COUNT(*), COUNT(*) FILTER "
+                "(WHERE status IN ('pending', 'leased')) "
+                "FROM crawl_tasks WHERE crawl_id = (SELECT MAX(id) FROM crawls)"
+            ).fetchone()
+            total, active = row
+            if total == 0 or (active and not force):
+                return False
+            conn.execute("INSERT INTO crawls (started_at) VALUES (?)", (time.time(),))
+            return True
+
+    @override
+    def enqueue(self, tasks: Iterable[CrawlTask]) -> int:
+        """
+        Adiciona tarefas à coleta atual, descartando as de URL já enfileirada
+        nela.
+
+        Args:
+            tasks: Tarefas a adicionar.
+
+        Returns:
+            Quantidade de tarefas novas.
+        """
+        rows: list[_TaskRow] = [
+            (
+                task.url,
+                task.kind,
+                task.search_query,
+                task.page,
+                task.last_page,
+                _serialize_listing(task.listing),
+            )
+            for task in tasks
+        ]
+        if not rows:
+            return 0
+        conn: sqlite3.Connection = self._get_connection()
+        with self._lock, conn:
+            before: int = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO crawl_tasks "
+                "(crawl_id, url, kind, search_query, page, last_page, listing) "
+                "VALUES ((SELECT MAX(id) FROM crawls), ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            return conn.total_changes - before
+
+    @override
+    def claim(
+        self, worker_id: str, *, lease: timedelta, limit: int = 1
+    ) -> list[CrawlTask]:
+        """
+        Reserva tarefas da coleta atual pendentes ou com o prazo expirado, na
+        ordem em que foram enfileiradas.
+
+        Tarefas com o prazo expirado que já esgotaram as tentativas são
+        marcadas como failed.
+
+        Args:
+            worker_id: Identificador do worker.
+            lease: Prazo da reserva.
+            limit: Quantidade máxima de tarefas.
+
+        Returns:
+            Tarefas reservadas, possivelmente nenhuma.
+        """
+        now: float = time.time()
+        conn: sqlite3.Connection = self._get_connection()
+        with self._lock, conn:
+            conn.execute(
+                "UPDATE crawl_tasks SET status = 'failed', worker_id = NULL, "
+                "last_error = 'Prazo da reserva expirado' "
+                "WHERE crawl_id = (SELECT MAX(id) FROM crawls) AND status = 'leased' "
+                "AND lease_expires_at < ? AND attempts >= ?",
+                (now, self._max_attempts),
+            )
+            rows: list[_ClaimedRow] = conn.execute(
+                """
+                UPDATE crawl_tasks
+                SET status = 'leased', worker_id = ?, lease_expires_at = ?,
+                    attempts = attempts + 1
+                WHERE id IN (
+                    SELECT id FROM crawl_tasks
+                    WHERE crawl_id = (SELECT MAX(id) FROM crawls)
+                        AND (status = 'pending'
+                            OR (status = 'leased' AND lease_expires_at < ?))
+                    ORDER BY id
+                    LIMIT ?
+                )
+                RETURNING id, kind, url, search_query, page, last_page, listing,
+                    attempts
+                """,
+                (worker_id, now + lease.total_seconds(), now, limit),
+            ).fetchall()
+        return sorted((_from_row(row) for row in rows), key=_task_order)
+
+    @override
+    def heartbeat(
+        self, worker_id: str, task_ids: Iterable[int], *, lease: timedelta
+    ) -> None:
+        """
+        Renova o prazo das tarefas ainda reservadas pelo worker.
+
+        Args:
+            worker_id: Identificador do worker.
+            task_ids: Tarefas em processamento.
+            lease: Novo prazo, a partir de agora.
+        """
+        expires_at: float = time.time() + lease.total_seconds()
+        conn: sqlite3.Connection = self._get_connection()
+        with self._lock, conn:
+            conn.executemany(
+                "UPDATE crawl_tasks SET lease_expires_at = ? "
+                "WHERE id = ? AND worker_id = ? AND status = 'leased'",
+                [(expires_at, task_id, worker_id) for task_id in task_ids],
+            )
+
+    @override
+    def complete(self, worker_id: str, task_id: int) -> None:
+        """
+        Marca a tarefa como concluída.
+
+        Args:
+            worker_id: Identificador do worker.
+            task_id: Tarefa concluída.
+        """
+        conn: sqlite3.Connection = self._get_connection()
+        with self._lock, conn:
+            conn.execute(
+                "UPDATE crawl_tasks SET status = 'done', lease_expires_at = NULL "
+                "WHERE id = ? AND worker_id = ?",
+                (task_id, worker_id),
+            )
+
+    @override
+    def fail(self, worker_id: str, task_id: int, error: str) -> None:
+        """
+        Registra a falha da tarefa, que volta à fila enquanto houver tentativas.
+
+        Args:
+            worker_id: Identificador do worker.
+            task_id: Tarefa que falhou.
+            error: Descrição da falha.
+        """
+        conn: sqlite3.Connection = self._get_connection()
+        with self._lock, conn:
+            conn.execute(
+                """
+                UPDATE crawl_tasks
+                SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                    worker_id = NULL, lease_expires_at = NULL, last_error = ?
+                WHERE id = ? AND worker_id = ? AND status = 'leased'
+                """,
+                (self._max_attempts, error, task_id, worker_id),
+            )
+
+    @override
+    def release(self, worker_id: str, task_ids: Iterable[int]) -> None:
+        """
+        Devolve à fila tarefas reservadas e não processadas, sem contar a
+        tentativa.
+
+        Args:
+            worker_id: Identificador do worker.
+            task_ids: Tarefas a devolver.
+        """
+        conn: sqlite3.Connection = self._get_connection()
+        with self._lock, conn:
+            conn.executemany(
+                "UPDATE crawl_tasks SET status = 'pending', worker_id = NULL, "
+                "lease_expires_at = NULL, attempts = attempts - 1 "
+                "WHERE id = ? AND worker_id = ? AND status = 'leased'",
+                [(task_id, worker_id) for task_id in task_ids],
+            )
+
+    @override
+    def counts(self) -> dict[str, int]:
+        """
+        Retorna a quantidade de tarefas da coleta atual por situação.
+
+        Returns:
+            Dicionário com as chaves "pending", "leased", "done" e "failed".
+        """
+        conn: sqlite3.Connection = self._get_connection()
+        with self._lock:
+            rows: list[tuple[str, int]] = conn.execute(
+                "SELECT status, COUNT(*) FROM crawl_tasks "
+                "WHERE crawl_id = (SELECT MAX(id) FROM crawls) GROUP BY status"
+            ).fetchall()
+        counts: dict[str, int] = dict.fromkeys(
+            ("pending", "leased", "done", "failed"), 0
+        )
+        counts.update(rows)
+        return counts
+
+    def close(self) -> None:
+        """
+        Fecha a conexão persistente com o banco de dados.
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _serialize_listing(listing: ProductListing | None) -> str | None:
+    """
+    Serializa os dados do card para JSON.
+
+    Args:
+        listing: Dados do card, ou None.
+    """
+    if listing is None:
+        return None
+    return json.dumps(
+        {
+            "sku": listing.sku,
+            "product_title": listing.product_title,
+            "price": listing.price,
+            "price_pix": listing.price_pix,
+            "price_installments": listing.price_installments,
+            "installments_count": listing.installments_count,
+            "product_url": listing.product_url,
+        },
+        ensure_ascii=False,
+    )
+
+
+def _from_row(row: _ClaimedRow) -> CrawlTask:
+    """
+    Monta a tarefa a partir de uma linha retornada pela reserva.
+
+    Args:
+        row: (id, kind, url, search_query, page, last_page, listing,
+            attempts).
+    """
+    task_id, kind, url, search_query, page, last_page, listing, attempts = row
+    return CrawlTask(
+        kind=kind,
+        url=url,
+        search_query=search_query,
+        page=page,
+        last_page=last_page,
+        listing=ProductListing(**json.loads(listing)) if listing else None,
+        task_id=task_id,
+        attempts=attempts,
+    )
+
+
+def _task_order(task: CrawlTask) -> int:
+    """
+    Chave de ordenação das tarefas reservadas: a ordem da fila.
+    """
+    return task.task_id or 0
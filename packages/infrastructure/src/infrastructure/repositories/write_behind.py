@@ -0,0 +1,551 @@
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from queue import Empty, Queue
+from types import TracebackType
+from typing import TYPE_CHECKING, Self, override
+
+from domain.interfaces import ICrawlCheckpointRepository, IMetrics, IProductRepository
+from domain.models import Product
+
+from infrastructure.validations import InfrastructureError
+
+if TYPE_CHECKING:
+    from domain.models import CrawlCheckpoint, ListingState, PriceRecord
+
+
+@dataclass(frozen=True, slots=True)
+class _Deferred:
+    """
+    Ação executada logo após a gravação dos produtos enfileirados antes dela.
+    """
+
+    action: Callable[[], None]
+
+
+@dataclass(frozen=True, slots=True)
+class _Barrier:
+    """
+    Ação executada isoladamente: os produtos pendentes são gravados antes, e os
+    enfileirados depois só são gravados após ela.
+    """
+
+    action: Callable[[], None]
+
+
+@dataclass(frozen=True, slots=True)
+class _Flush:
+    """
+    Pedido de gravação imediata do lote pendente; done é sinalizado em seguida,
+    mesmo após uma falha.
+    """
+
+    done: threading.Event = field(default_factory=threading.Event)
+
+
+class _Stop:
+    """
+    Marcador de encerramento da thread de gravação.
+    """
+
+
+type _Item = Product | _Deferred | _Barrier | _Flush | _Stop
+
+
+class WriteBehindProductRepository(IProductRepository):
+    """
+    Decorador de repositório que grava os produtos em segundo plano.
+
+    create e upsert_many apenas colocam os produtos em uma fila limitada e
+    retornam; uma única thread os retira e grava em lotes (group commit),
+    quando o lote atinge batch_size produtos ou quando o primeiro produto do
+    lote espera há flush_interval segundos. Assim, a latência do disco deixa de
+    afetar a coleta; com a fila cheia, quem grava aguarda (backpressure).
+
+    Após a primeira falha de gravação, os produtos e ações seguintes são
+    descartados e contados, e a falha é relançada, como InfrastructureError,
+    pela próxima gravação, por flush e por close. Ações registradas com defer
+    (ex.: o progresso da coleta) só são executadas depois que os produtos
+    enfileirados antes delas foram gravados com sucesso.
+
+    As consultas são repassadas diretamente ao repositório decorado e veem
+    apenas o que já foi gravado; use flush antes delas quando for preciso ler
+    as próprias gravações.
+    """
+
+    def __init__(
+        self,
+        repository: IProductRepository,
+        *,
+        max_pending: int = 10_000,
+        batch_size: int = 1000,
+        flush_interval: float = 1.0,
+        metrics: IMetrics | None = None,
+    ) -> None:
+        """
+        Inicializa o decorador e inicia a thread de gravação.
+
+        Args:
+            repository: Repositório onde os produtos são gravados.
+            max_pending: Capacidade da fila de produtos aguardando gravação.
+            batch_size: Quantidade máxima de produtos por lote gravado.
+            flush_interval: Tempo máximo, em segundos, que um produto aguarda
+                na fila antes que o lote seja gravado.
+            metrics: Destino do tamanho da fila (write_behind_pending) e dos
+                produtos descartados após falhas (opcional).
+        """
+        InfrastructureError.when(
+            has_error=max_pending < 1 or batch_size < 1,
+            message="max_pending e batch_size devem ser maiores ou iguais a 1.",
+        )
+        self._repository: IProductRepository = repository
+        self._batch_size: int = batch_size
+        self._flush_interval: float = flush_interval
+        self._metrics: IMetrics | None = metrics
+        self._queue: Queue[_Item] = Queue(maxsize=max_pending)
+        self._lock: threading.Lock = threading.Lock()
+        self._error: Exception | None = None
+        self._lost: int = 0
+        self._closed: bool = False
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run, name="write-behind", daemon=True
+        )
+        self._thread.start()
+
+    @override
+    def create(self, product: Product) -> None:
+        """
+        Enfileira o produto para gravação.
+
+        Args:
+            product: Instância de Product a ser persistida.
+        """
+        self._put(product)
+
+    @override
+    def update(self, product: Product) -> None:
+        """
+        Enfileira a atualização do produto, aplicada após a gravação dos
+        produtos enfileirados antes dela.
+
+        Args:
+            product: Instância de Product com dados atualizados.
+        """
+        self._put(_Barrier(lambda: self._repository.update(product)))
+
+    @override
+    def upsert_many(self, products: Iterable[Product]) -> int:
+        """
+        Enfileira os produtos para gravação.
+
+        Args:
+            products: Iterável de instâncias de Product a serem persistidas.
+
+        Returns:
+            Quantidade de produtos enfileirados.
+        """
+        total: int = 0
+        for product in products:
+            self._put(product)
+            total += 1
+        return total
+
+    def defer(self, action: Callable[[], None]) -> None:
+        """
+        Agenda uma ação para logo após a gravação dos produtos já enfileirados.
+
+        A ação não é executada se alguma gravação anterior falhar.
+
+        Args:
+            action: Função sem argumentos (ex.: registrar o progresso).
+        """
+        self._put(_Deferred(action))
+
+    def flush(self) -> None:
+        """
+        Grava imediatamente os produtos pendentes e aguarda a conclusão.
+
+        Raises:
+            InfrastructureError: Se alguma gravação falhou.
+        """
+        if self._thread.is_alive():
+            request = _Flush()
+            self._queue.put(request)
+            while not request.done.wait(0.1) and self._thread.is_alive():
+                pass
+        self._raise_if_failed()
+
+    def close(self) -> None:
+        """
+        Grava os produtos pendentes e encerra a thread de gravação.
+
+        Uma interrupção (Ctrl+C) durante a espera não abandona a gravação: a
+        espera é retomada e a interrupção relançada ao final.
+
+        Raises:
+            InfrastructureError: Se alguma gravação falhou.
+        """
+        with self._lock:
+            closing: bool = not self._closed
+            self._closed = True
+        interrupted: bool = False
+        steps: list[Callable[[], None]] = [self._thread.join]
+        if closing:
+            steps.insert(0, lambda: self._queue.put(_Stop()))
+        for step in steps:
+            while True:
+                try:
+                    step()
+                    break
+                except KeyboardInterrupt:
+                    interrupted = True
+        if interrupted:
+            raise KeyboardInterrupt
+        self._raise_if_failed()
+
+    def _put(self, item: _Item) -> None:
+        """
+        Coloca um item na fila, aguardando se ela estiver cheia.
+
+        Args:
+            item: Produto ou ação a enfileirar.
+        """
+        InfrastructureError.when(
+            has_error=self._closed,
+            message="O repositório com gravação em segundo plano foi fechado.",
+        )
+        self._raise_if_failed()
+        self._queue.put(item)
+
+    def _raise_if_failed(self) -> None:
+        """
+        Relança a primeira falha de gravação, se houver.
+        """
+        with self._lock:
+            error: Exception | None = self._error
+            lost: int = self._lost
+        if error is not None:
+            msg = (
+                f"Falha na gravação em segundo plano: {error} "
+                f"({lost} produtos não gravados)"
+            )
+            raise InfrastructureError(msg) from error
+
+    def _run(self) -> None:
+        """
+        Laço da thread de gravação: agrupa os produtos e grava cada lote.
+        """
+        products: list[Product] = []
+        deferred: list[Callable[[], None]] = []
+        deadline: float = 0.0
+        while True:
+            try:
+                item: _Item = self._queue.get(
+                    timeout=max(deadline - time.monotonic(), 0.0)
+                    if products or deferred
+                    else None
+                )
+            except Empty:
+                self._commit(products, deferred)
+                continue
+            if not products and not deferred:
+                deadline = time.monotonic() + self._flush_interval
+            if isinstance(item, Product):
+                products.append(item)
+                if len(products) >= self._batch_size:
+                    self._commit(products, deferred)
+            elif isinstance(item, _Deferred):
+                deferred.append(item.action)
+            else:
+                self._commit(products, deferred)
+                if isinstance(item, _Barrier):
+                    self._apply([item.action])
+                elif isinstance(item, _Flush):
+                    item.done.set()
+                else:
+                    return
+
+    def _commit(
+        self, products: list[Product], deferred: list[Callable[[], None]]
+    ) -> None:
+        """
+        Grava o lote pendente e, em seguida, executa as ações adiadas; ambos são
+        esvaziados.
+
+        Args:
+            products: Produtos do lote.
+            deferred: Ações a executar após a gravação do lote.
+        """
+        if products:
+            if self._error is None:
+                try:
+                    self._repository.upsert_many(products)
+                except Exception as error:  # noqa: BLE001
+                    self._fail(error, len(products))
+            else:
+                self._fail(None, len(products))
+            products.clear()
+        self._apply(deferred)
+        deferred.clear()
+        if self._metrics is not None:
+            self._metrics.set_gauge("write_behind_pending", self._queue.qsize())
+
+    def _apply(self, actions: list[Callable[[], None]]) -> None:
+        """
+        Executa as ações em ordem, exceto após uma falha.
+
+        Args:
+            actions: Ações a executar.
+        """
+        for action in actions:
+            if self._error is not None:
+                return
+            try:
+                action()
+            except Exception as error:  # noqa: BLE001
+                self._fail(error, 0)
+
+    def _fail(self, error: Exception | None, lost: int) -> None:
+        """
+        Registra a primeira falha e conta os produtos não gravados.
+
+        Args:
+            error: Exceção da gravação, ou None para produtos descartados após
+                uma falha anterior.
+            lost: Quantidade de produtos não gravados.
+        """
+        with self._lock:
+            if self._error is None and error is not None:
+                self._error = error
+            self._lost += lost
+        if self._metrics is not None and lost:
+            self._metrics.increment("write_behind_lost_products_total", lost)
+
+    @override
+    def get_listing_states(self, skus: Iterable[str]) -> dict[str, "ListingState"]:
+        """
+        Retorna o estado de listagem já gravado dos produtos informados.
+
+        Args:
+            skus: SKUs dos produtos a consultar.
+        """
+        return self._repository.get_listing_states(skus)
+
+    @override
+    def find_products(
+        self,
+        specifications: Mapping[str, str] | None = None,
+        *,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        limit: int | None = None,
+    ) -> Iterator[Product]:
+        """
+        Busca, entre os produtos já gravados, os que atendem aos filtros.
+
+        Args:
+            specifications: Especificações exigidas, por nome (opcional).
+            min_price: Preço mínimo, inclusive (opcional).
+            max_price: Preço máximo, inclusive (opcional).
+            limit: Quantidade máxima de produtos (opcional).
+        """
+        return self._repository.find_products(
+            specifications, min_price=min_price, max_price=max_price, limit=limit
+        )
+
+    @override
+    def get_by_skus(self, skus: Iterable[str]) -> Iterator[Product]:
+        """
+        Retorna os produtos já gravados com os SKUs informados.
+
+        Args:
+            skus: SKUs dos produtos a consultar.
+        """
+        return self._repository.get_by_skus(skus)
+
+    @override
+    def find_by_price(
+        self,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        *,
+        price_field: str = "price",
+        after: tuple[float, str] | None = None,
+        limit: int | None = None,
+    ) -> Iterator[Product]:
+        """
+        Retorna os produtos já gravados em uma faixa de preço.
+
+        Args:
+            min_price: Preço mínimo, inclusive (opcional).
+            max_price: Preço máximo, inclusive (opcional).
+            price_field: Coluna de preço usada no filtro e na ordenação.
+            after: Posição (preço, SKU) após a qual a página começa (opcional).
+            limit: Quantidade máxima de produtos (opcional).
+        """
+        return self._repository.find_by_price(
+            min_price, max_price, price_field=price_field, after=after, limit=limit
+        )
+
+    @override
+    def search_titles(
+        self, text: str, *, limit: int | None = None
+    ) -> Iterator[Product]:
+        """
+        Busca, entre os produtos já gravados, os que têm as palavras no título.
+
+        Args:
+            text: Palavras a buscar.
+            limit: Quantidade máxima de produtos (opcional).
+        """
+        return self._repository.search_titles(text, limit=limit)
+
+    @override
+    def iter_products(
+        self,
+        *,
+        search_text: str | None = None,
+        updated_since: datetime | None = None,
+        updated_until: datetime | None = None,
+    ) -> Iterator[Product]:
+        """
+        Percorre os produtos já gravados que atendem aos filtros.
+
+        Args:
+            search_text: Termo de busca de origem (opcional).
+            updated_since: Início do período de atualização, inclusive (opcional).
+            updated_until: Fim do período de atualização, exclusive (opcional).
+        """
+        return self._repository.iter_products(
+            search_text=search_text,
+            updated_since=updated_since,
+            updated_until=updated_until,
+        )
+
+    @override
+    def get_price_history(
+        self,
+        sku: str,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator["PriceRecord"]:
+        """
+        Retorna o histórico de preços já gravado de um produto.
+
+        Args:
+            sku: SKU do produto.
+            since: Início do período, inclusive (opcional).
+            until: Fim do período, exclusive (opcional).
+        """
+        return self._repository.get_price_history(sku, since=since, until=until)
+
+    @override
+    def get_price_changes(
+        self, since: datetime, until: datetime | None = None
+    ) -> Iterator["PriceRecord"]:
+        """
+        Retorna as mudanças de preço já gravadas em um período.
+
+        Args:
+            since: Início do período, inclusive.
+            until: Fim do período, exclusive (opcional).
+        """
+        return self._repository.get_price_changes(since, until)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class WriteBehindCheckpointRepository(ICrawlCheckpointRepository):
+    """
+    Decorador do progresso das coletas para uso com
+    WriteBehindProductRepository.
+
+    As gravações de progresso são adiadas até que os produtos enfileirados
+    antes delas estejam gravados, de modo que o checkpoint nunca indica como
+    gravado um produto que ainda está na fila ou cuja gravação falhou.
+    """
+
+    def __init__(
+        self,
+        checkpoints: ICrawlCheckpointRepository,
+        writer: WriteBehindProductRepository,
+    ) -> None:
+        """
+        Inicializa o decorador.
+
+        Args:
+            checkpoints: Repositório onde o progresso é gravado.
+            writer: Repositório de produtos com gravação em segundo plano.
+        """
+        self._checkpoints: ICrawlCheckpointRepository = checkpoints
+        self._writer: WriteBehindProductRepository = writer
+
+    @override
+    def load_checkpoint(self, search_query: str) -> "CrawlCheckpoint | None":
+        """
+        Grava as pendências e retorna o progresso gravado do termo de busca.
+
+        Args:
+            search_query: Termo de busca.
+        """
+        self._writer.flush()
+        return self._checkpoints.load_checkpoint(search_query)
+
+    @override
+    def save_progress(
+        self,
+        search_query: str,
+        page: int,
+        skus: Iterable[str],
+        *,
+        page_completed: bool,
+    ) -> None:
+        """
+        Agenda a gravação do progresso para depois dos produtos enfileirados.
+
+        Args:
+            search_query: Termo de busca.
+            page: Página processada.
+            skus: SKUs gravados na página.
+            page_completed: Se a página foi concluída.
+        """
+        saved_skus: tuple[str, ...] = tuple(skus)
+        self._writer.defer(
+            lambda: self._checkpoints.save_progress(
+                search_query, page, saved_skus, page_completed=page_completed
+            )
+        )
+
+    @override
+    def mark_finished(self, search_query: str) -> None:
+        """
+        Agenda a marcação do termo como concluído para depois dos produtos
+        enfileirados.
+
+        Args:
+            search_query: Termo de busca.
+        """
+        self._writer.defer(lambda: self._checkpoints.mark_finished(search_query))
+
+    @override
+    def reset_checkpoint(self, search_query: str) -> None:
+        """
+        Agenda a remoção do progresso do termo para depois dos produtos
+        enfileirados.
+
+        Args:
+            search_query: Termo de busca.
+        """
+        self._writer.defer(lambda: self._checkpoints.reset_checkpoint(search_query))
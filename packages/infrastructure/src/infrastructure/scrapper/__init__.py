@@ -1,4 +1,50 @@
-from .http_client import RequestsHttpClient
+from .cached_http_client import CacheStats, CachingHttpClient
+from .circuit_breaker_http_client import CircuitBreakerHttpClient
+from .hedged_http_client import HedgedHttpClient
+from .http_client import (
+    BaseHttpClient,
+    HttpResponse,
+    HttpStream,
+    RequestsHttpClient,
+)
+from .instrumented_http_client import InstrumentedHttpClient
 from .maeto_scrapper import LojaMaetoScraper
+from .page_archive import (
+    ARCHIVE_CODECS,
+    ArchiveReplayHttpClient,
+    ArchiveStats,
+    ArchivingHttpClient,
+    PageArchive,
+)
+from .parsers import (
+    PARSER_BACKENDS,
+    BeautifulSoupParser,
+    PageParser,
+    create_parser,
+)
+from .process_pool_parser import ProcessPoolPageParser
+from .rate_limited_http_client import RateLimitedHttpClient
 
-__all__ = ["LojaMaetoScraper", "RequestsHttpClient"]
+__all__ = [
+    "ARCHIVE_CODECS",
+    "PARSER_BACKENDS",
+    "ArchiveReplayHttpClient",
+    "ArchiveStats",
+    "ArchivingHttpClient",
+    "BaseHttpClient",
+    "BeautifulSoupParser",
+    "CacheStats",
+    "CachingHttpClient",
+    "CircuitBreakerHttpClient",
+    "HedgedHttpClient",
+    "HttpResponse",
+    "HttpStream",
+    "InstrumentedHttpClient",
+    "LojaMaetoScraper",
+    "PageArchive",
+    "PageParser",
+    "ProcessPoolPageParser",
+    "RateLimitedHttpClient",
+    "RequestsHttpClient",
+    "create_parser",
+]
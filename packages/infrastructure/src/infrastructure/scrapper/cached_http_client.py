@@ -0,0 +1,507 @@
+import hashlib
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Self, override
+
+from infrastructure.scrapper.http_client import (
+    BaseHttpClient,
+    HttpResponse,
+    HttpStream,
+)
+
+HTTP_OK = 200
+HTTP_NOT_MODIFIED = 304
+
+# Caracteres lidos do disco por vez nas respostas lidas aos poucos
+STREAM_CHUNK_CHARS = 16 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """
+    Contadores de uso do cache HTTP.
+
+    Atributos:
+        hits: Respostas servidas do disco sem acessar a rede.
+        revalidations: Respostas confirmadas pelo servidor com 304 Not Modified.
+        misses: Respostas baixadas por completo.
+        evictions: Entradas removidas para respeitar o limite de tamanho.
+        size_bytes: Tamanho atual dos corpos armazenados.
+    """
+
+    hits: int
+    revalidations: int
+    misses: int
+    evictions: int
+    size_bytes: int
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """
+    Metadados de uma resposta armazenada.
+    """
+
+    key: str
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+    size: int
+
+
+class CachingHttpClient(BaseHttpClient):
+    """
+    Decorador de cliente HTTP com cache de respostas em disco.
+
+    Os corpos ficam em arquivos nomeados pelo hash da URL e os metadados em um
+    índice SQLite no mesmo diretório. Enquanto a entrada estiver dentro do TTL
+    da sua classe de URL ela é servida direto do disco; depois disso é
+    revalidada com If-None-Match/If-Modified-Since. Ao ultrapassar o tamanho
+    máximo, as entradas acessadas há mais tempo são removidas (LRU).
+
+    Em open, o corpo é lido do disco aos poucos e, quando vem da rede, gravado
+    no cache à medida que é lido; se a resposta for fechada antes do fim, o
+    restante é baixado direto para o disco, sem ficar em memória, para que a
+    página fique completa no cache.
+    """
+
+    def __init__(
+        self,
+        http_client: BaseHttpClient,
+        cache_dir: str | Path,
+        max_size_bytes: int = 512 * 1024 * 1024,
+        ttl_by_class: Mapping[str, float] | None = None,
+        url_classifier: Callable[[str], str] | None = None,
+    ) -> None:
+        """
+        Inicializa o cache sobre o cliente HTTP informado.
+
+        Args:
+            http_client: Cliente HTTP usado quando a resposta não está no cache.
+            cache_dir: Diretório onde os corpos e o índice são armazenados.
+            max_size_bytes: Tamanho máximo somado dos corpos armazenados.
+            ttl_by_class: Tempo de validade, em segundos, por classe de URL.
+                Classes ausentes têm TTL zero, isto é, sempre são revalidadas.
+            url_classifier: Função que retorna a classe de uma URL.
+        """
+        self._http_client: BaseHttpClient = http_client
+        self._cache_dir: Path = Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._max_size_bytes: int = max_size_bytes
+        self._ttl_by_class: dict[str, float] = dict(ttl_by_class or {})
+        self._url_classifier: Callable[[str], str] = url_classifier or (
+            lambda _url: "default"
+        )
+        self._lock: threading.Lock = threading.Lock()
+        self._hits: int = 0
+        self._revalidations: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._conn: sqlite3.Connection = sqlite3.connect(
+            self._cache_dir / "index.sqlite", check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_entries_accessed_at "
+                "ON entries (accessed_at)"
+            )
+        row: tuple[int | None] = self._conn.execute(
+            "SELECT SUM(size) FROM entries"
+        ).fetchone()
+        self._size_bytes: int = row[0] or 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Retorna os contadores atuais do cache.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                revalidations=self._revalidations,
+                misses=self._misses,
+                evictions=self._evictions,
+                size_bytes=self._size_bytes,
+            )
+
+    @override
+    def fetch(self, url: str, headers: dict[str, str] | None = None) -> HttpResponse:
+        """
+        Retorna a resposta do cache ou da rede, revalidando quando expirada.
+
+        Args:
+            url: URL de destino da requisição.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Resposta HTTP completa.
+        """
+        key: str = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        entry: _CacheEntry | None = self._lookup(key)
+        body: str | None = self._read_body(key) if entry else None
+        if entry is None or body is None:
+            return self._download(url, key, headers)
+
+        ttl: float = self._ttl_by_class.get(self._url_classifier(url), 0.0)
+        if time.time() - entry.stored_at < ttl:
+            self._touch(key, refresh=False)
+            with self._lock:
+                self._hits += 1
+            return HttpResponse(url=url, status_code=HTTP_OK, text=body)
+
+        conditional_headers: dict[str, str] = dict(headers or {})
+        if entry.etag:
+            conditional_headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            conditional_headers["If-Modified-Since"] = entry.last_modified
+        response: HttpResponse = self._http_client.fetch(url, conditional_headers)
+        if response.status_code == HTTP_NOT_MODIFIED:
+            self._touch(key, refresh=True)
+            with self._lock:
+                self._revalidations += 1
+            return HttpResponse(
+                url=url, status_code=HTTP_OK, text=body, headers=response.headers
+            )
+        self._store(url, key, response)
+        return response
+
+    @override
+    def open(self, url: str, headers: dict[str, str] | None = None) -> HttpStream:
+        """
+        Abre a resposta do cache ou da rede, revalidando quando expirada.
+
+        Args:
+            url: URL de destino da requisição.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Resposta HTTP, que deve ser fechada após o uso.
+        """
+        key: str = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        entry: _CacheEntry | None = self._lookup(key)
+        cached: HttpStream | None = self._open_body(url, key) if entry else None
+        if entry is None or cached is None:
+            return self._tee(url, key, self._http_client.open(url, headers))
+
+        ttl: float = self._ttl_by_class.get(self._url_classifier(url), 0.0)
+        if time.time() - entry.stored_at < ttl:
+            self._touch(key, refresh=False)
+            with self._lock:
+                self._hits += 1
+            return cached
+
+        conditional_headers: dict[str, str] = dict(headers or {})
+        if entry.etag:
+            conditional_headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            conditional_headers["If-Modified-Since"] = entry.last_modified
+        try:
+            response: HttpStream = self._http_client.open(url, conditional_headers)
+        except BaseException:
+            cached.close()
+            raise
+        if response.status_code == HTTP_NOT_MODIFIED:
+            response.close()
+            self._touch(key, refresh=True)
+            with self._lock:
+                self._revalidations += 1
+            cached.headers = response.headers
+            return cached
+        cached.close()
+        return self._tee(url, key, response)
+
+    def _open_body(self, url: str, key: str) -> HttpStream | None:
+        """
+        Abre o corpo armazenado para leitura aos poucos.
+
+        Args:
+            url: URL requisitada.
+            key: Chave da URL no cache.
+
+        Returns:
+            Resposta 200 lida do disco, ou None se o arquivo não existir.
+        """
+        try:
+            file = self._body_path(key).open(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        return HttpStream(
+            url,
+            HTTP_OK,
+            iter(lambda: file.read(STREAM_CHUNK_CHARS), ""),
+            on_close=file.close,
+        )
+
+    def _tee(self, url: str, key: str, response: HttpStream) -> HttpStream:
+        """
+        Envolve uma resposta da rede para gravá-la no cache enquanto é lida.
+
+        O corpo só entra no cache se for lido por inteiro antes de a resposta
+        ser fechada; uma resposta fechada antes do fim é descartada, sem baixar
+        o restante. Respostas que não são 200 ou que pedem no-store passam sem
+        ser gravadas.
+
+        Args:
+            url: URL requisitada.
+            key: Chave da URL no cache.
+            response: Resposta aberta da rede.
+
+        Returns:
+            Resposta HTTP, que deve ser fechada após o uso.
+        """
+        with self._lock:
+            self._misses += 1
+        if not _is_cacheable(response.status_code, response.headers):
+            return response
+        path: Path = self._body_path(key)
+        path.parent.mkdir(exist_ok=True)
+        temporary_path: Path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        file: BinaryIO = temporary_path.open("wb")
+        size: int = 0
+        complete: bool = False
+
+        def write(chunks: Iterator[str]) -> Iterator[str]:
+            nonlocal size, complete
+            for chunk in chunks:
+                data: bytes = chunk.encode("utf-8")
+                size += len(data)
+                if size <= self._max_size_bytes:
+                    file.write(data)
+                yield chunk
+            complete = True
+
+        body: Iterator[str] = write(response.iter_text())
+
+        def close() -> None:
+            try:
+                file.close()
+                response.close()
+            finally:
+                if complete and size <= self._max_size_bytes:
+                    temporary_path.replace(path)
+                    self._index(url, key, response.headers, size)
+                else:
+                    temporary_path.unlink(missing_ok=True)
+
+        return HttpStream(
+            url, response.status_code, body, response.headers, on_close=close
+        )
+
+    def _download(
+        self, url: str, key: str, headers: dict[str, str] | None
+    ) -> HttpResponse:
+        """
+        Baixa a resposta completa e a armazena no cache.
+
+        Args:
+            url: URL de destino da requisição.
+            key: Chave da URL no cache.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Resposta HTTP completa.
+        """
+        response: HttpResponse = self._http_client.fetch(url, headers)
+        self._store(url, key, response)
+        return response
+
+    def _lookup(self, key: str) -> _CacheEntry | None:
+        """
+        Busca os metadados de uma entrada pela chave.
+
+        Args:
+            key: Chave da URL no cache.
+
+        Returns:
+            Metadados da entrada ou None.
+        """
+        with self._lock:
+            row: tuple[str | None, str | None, float, int] | None = self._conn.execute(
+                "SELECT etag, last_modified, stored_at, size FROM entries "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return _CacheEntry(
+            key=key,
+            etag=row[0],
+            last_modified=row[1],
+            stored_at=row[2],
+            size=row[3],
+        )
+
+    def _body_path(self, key: str) -> Path:
+        """
+        Retorna o caminho do arquivo do corpo, agrupado por prefixo da chave.
+
+        Args:
+            key: Chave da URL no cache.
+        """
+        return self._cache_dir / key[:2] / f"{key}.html"
+
+    def _read_body(self, key: str) -> str | None:
+        """
+        Lê o corpo armazenado, retornando None se o arquivo não existir.
+
+        Args:
+            key: Chave da URL no cache.
+        """
+        try:
+            return self._body_path(key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def _touch(self, key: str, *, refresh: bool) -> None:
+        """
+        Atualiza o último acesso da entrada e, se revalidada, a data de gravação.
+
+        Args:
+            key: Chave da URL no cache.
+            refresh: Se True, reinicia o TTL da entrada.
+        """
+        now: float = time.time()
+        with self._lock, self._conn:
+            if refresh:
+                self._conn.execute(
+                    "UPDATE entries SET accessed_at = ?, stored_at = ? WHERE key = ?",
+                    (now, now, key),
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+
+    def _store(self, url: str, key: str, response: HttpResponse) -> None:
+        """
+        Armazena uma resposta 200 e aplica o limite de tamanho.
+
+        Args:
+            url: URL requisitada.
+            key: Chave da URL no cache.
+            response: Resposta recebida da rede.
+        """
+        with self._lock:
+            self._misses += 1
+        if not _is_cacheable(response.status_code, response.headers):
+            return
+        data: bytes = response.text.encode("utf-8")
+        if len(data) > self._max_size_bytes:
+            return
+        path: Path = self._body_path(key)
+        path.parent.mkdir(exist_ok=True)
+        temporary_path: Path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        temporary_path.write_bytes(data)
+        temporary_path.replace(path)
+        self._index(url, key, response.headers, len(data))
+
+    def _index(self, url: str, key: str, headers: dict[str, str], size: int) -> None:
+        """
+        Registra no índice um corpo já gravado e aplica o limite de tamanho.
+
+        Args:
+            url: URL requisitada.
+            key: Chave da URL no cache.
+            headers: Cabeçalhos da resposta.
+            size: Tamanho do corpo gravado.
+        """
+        now: float = time.time()
+        with self._lock, self._conn:
+            previous: tuple[int] | None = self._conn.execute(
+                "SELECT size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                """
+                INSERT INTO entries (
+                    key, url, etag, last_modified, stored_at, accessed_at, size
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    stored_at = excluded.stored_at,
+                    accessed_at = excluded.accessed_at,
+                    size = excluded.size
+            """,
+                (
+                    key,
+                    url,
+                    headers.get("etag"),
+                    headers.get("last-modified"),
+                    now,
+                    now,
+                    size,
+                ),
+            )
+            self._size_bytes += size - (previous[0] if previous else 0)
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Remove as entradas menos usadas até o cache caber no tamanho máximo.
+
+        Deve ser chamado com o lock e a transação já abertos.
+        """
+        if self._size_bytes <= self._max_size_bytes:
+            return
+        cursor: sqlite3.Cursor = self._conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at"
+        )
+        evicted: list[tuple[str]] = []
+        for key, size in cursor:
+            if self._size_bytes <= self._max_size_bytes:
+                break
+            self._body_path(key).unlink(missing_ok=True)
+            self._size_bytes -= size
+            self._evictions += 1
+            evicted.append((key,))
+        cursor.close()
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", evicted)
+
+    def close(self) -> None:
+        """
+        Fecha o índice do cache.
+        """
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _is_cacheable(status_code: int, headers: dict[str, str]) -> bool:
+    """
+    Indica se a resposta pode ser gravada no cache.
+
+    Args:
+        status_code: Código de status HTTP.
+        headers: Cabeçalhos da resposta.
+    """
+    cache_control: str = headers.get("cache-control", "").lower()
+    return status_code == HTTP_OK and "no-store" not in cache_control
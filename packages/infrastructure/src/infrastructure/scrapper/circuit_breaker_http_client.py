@@ -0,0 +1,328 @@
+import threading
+import time
+from collections.abc import Iterable
+from typing import override
+from urllib.parse import urlparse
+
+from domain.interfaces import IMetrics
+
+from infrastructure.scrapper.http_client import (
+    BaseHttpClient,
+    HttpResponse,
+    HttpStream,
+)
+from infrastructure.validations import InfrastructureError, RequestCancelledError
+
+
+class _HostCircuit:
+    """
+    Estado do circuito de um host: fechado (requisições liberadas), aberto
+    (requisições retidas até o fim da pausa) ou meio aberto (uma única
+    requisição de teste liberada; as demais aguardam o resultado dela).
+    """
+
+    def __init__(
+        self, failure_threshold: int, reset_timeout: float, max_reset_timeout: float
+    ) -> None:
+        """
+        Inicializa o circuito fechado.
+
+        Args:
+            failure_threshold: Falhas seguidas que abrem o circuito.
+            reset_timeout: Pausa, em segundos, após a primeira abertura.
+            max_reset_timeout: Pausa máxima, em segundos.
+        """
+        self.state: str = "closed"
+        self.open_until: float = 0.0
+        self._failures: int = 0
+        self._failure_threshold: int = failure_threshold
+        self._reset_timeout: float = reset_timeout
+        self._max_reset_timeout: float = max_reset_timeout
+        self._pause: float = reset_timeout
+        self._changed: threading.Condition = threading.Condition()
+
+    def acquire(self, timeout: float) -> bool:
+        """
+        Aguarda até que uma requisição possa ser enviada ao host.
+
+        Com o circuito aberto, aguarda o fim da pausa; a primeira requisição a
+        chegar depois dele passa como teste (meio aberto), e as demais
+        aguardam o resultado dela. Desiste na hora se a pausa terminar depois
+        do tempo máximo de espera.
+
+        Args:
+            timeout: Tempo máximo de espera, em segundos.
+
+        Returns:
+            True se a requisição foi liberada; False se a espera se esgotou.
+        """
+        ends_at: float = time.monotonic() + timeout
+        with self._changed:
+            while True:
+                now: float = time.monotonic()
+                if self.state == "closed":
+                    return True
+                if self.state == "open" and now >= self.open_until:
+                    self.state = "half_open"
+                    return True
+                wake_at: float = self.open_until if self.state == "open" else ends_at
+                if now >= ends_at or wake_at > ends_at:
+                    return False
+                self._changed.wait(wake_at - now)
+
+    def release(self) -> None:
+        """
+        Devolve o teste de uma requisição cancelada antes de chegar ao host,
+        sem registrar resultado; a próxima requisição em espera assume o
+        teste.
+        """
+        with self._changed:
+            if self.state == "half_open":
+                self.state = "open"
+                self._changed.notify_all()
+
+    def record(self, *, failed: bool, now: float) -> bool:
+        """
+        Registra o resultado de uma requisição liberada.
+
+        Uma falha com o circuito meio aberto o reabre com o dobro da pausa
+        anterior (até max_reset_timeout); um sucesso o fecha. As requisições
+        em espera são avisadas do novo estado.
+
+        Args:
+            failed: Se a requisição falhou.
+            now: Momento atual (monotônico).
+
+        Returns:
+            True se o circuito mudou entre aberto e fechado.
+        """
+        with self._changed:
+            if not failed:
+                self._failures = 0
+                if self.state == "closed":
+                    return False
+                self.state = "closed"
+                self._pause = self._reset_timeout
+                self._changed.notify_all()
+                return True
+            if self.state == "half_open":
+                self._pause = min(self._pause * 2, self._max_reset_timeout)
+            else:
+                self._failures += 1
+                if self._failures < self._failure_threshold or self.state == "open":
+                    return False
+            self.state = "open"
+            self.open_until = now + self._pause
+            self._changed.notify_all()
+            return True
+
+
+class CircuitBreakerHttpClient(BaseHttpClient):
+    """
+    Decorador de cliente HTTP que pausa as requisições a um host que falha.
+
+    Após failure_threshold falhas seguidas de um host (erros de rede, prazos
+    esgotados ou respostas com status em failure_status_codes), o circuito do
+    host abre: as requisições seguintes aguardam, sem acessar a rede, por
+    reset_timeout segundos. Depois disso, uma requisição de teste é liberada e
+    as demais aguardam o resultado dela; se ela funcionar, o circuito fecha e
+    todas seguem, senão a pausa dobra, até max_reset_timeout. Uma requisição
+    que teria de esperar mais que max_wait segundos falha com
+    InfrastructureError. Nas respostas lidas aos poucos, conta apenas o status;
+    falhas na leitura do corpo não são consideradas. Requisições canceladas
+    antes de sair da máquina (RequestCancelledError) não contam como falha.
+
+    A espera ocupa a thread de quem faz a requisição; por isso, o decorador
+    deve ficar acima do limitador de requisições, para não reter as vagas dele
+    durante a pausa.
+    """
+
+    def __init__(
+        self,
+        http_client: BaseHttpClient,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 10.0,
+        max_reset_timeout: float = 120.0,
+        max_wait: float = 60.0,
+        failure_status_codes: Iterable[int] = (500, 502, 504),
+        metrics: IMetrics | None = None,
+    ) -> None:
+        """
+        Inicializa o decorador sobre o cliente HTTP informado.
+
+        Args:
+            http_client: Cliente HTTP que executa as requisições.
+            failure_threshold: Falhas seguidas de um host que abrem o circuito.
+            reset_timeout: Pausa, em segundos, antes da requisição de teste.
+            max_reset_timeout: Pausa máxima, em segundos, após testes que
+                falham seguidamente.
+            max_wait: Espera máxima, em segundos, de uma requisição pelo fim
+                da pausa e pelo resultado do teste.
+            failure_status_codes: Status considerados falha. 429 e 503 ficam
+                de fora por padrão, pois indicam limitação, tratada pelo
+                RateLimitedHttpClient.
+            metrics: Destino das métricas dos circuitos (opcional).
+        """
+        InfrastructureError.when(
+            has_error=failure_threshold < 1,
+            message="failure_threshold deve ser maior ou igual a 1.",
+        )
+        InfrastructureError.when(
+            has_error=not 0 < reset_timeout <= max_reset_timeout,
+            message="As pausas devem ser 0 < reset_timeout <= max_reset_timeout.",
+        )
+        InfrastructureError.when(
+            has_error=max_wait < 0,
+            message="max_wait não pode ser negativo.",
+        )
+        self._http_client: BaseHttpClient = http_client
+        self._failure_threshold: int = failure_threshold
+        self._reset_timeout: float = reset_timeout
+        self._max_reset_timeout: float = max_reset_timeout
+        self._max_wait: float = max_wait
+        self._failure_status_codes: frozenset[int] = frozenset(failure_status_codes)
+        self._metrics: IMetrics | None = metrics
+        self._hosts: dict[str, _HostCircuit] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def open_hosts(self) -> list[str]:
+        """
+        Retorna os hosts com o circuito aberto ou em teste.
+        """
+        with self._lock:
+            hosts: dict[str, _HostCircuit] = dict(self._hosts)
+        return [host for host, circuit in hosts.items() if circuit.state != "closed"]
+
+    def _circuit(self, host: str) -> _HostCircuit:
+        """
+        Retorna o circuito do host, criando-o na primeira requisição.
+
+        Args:
+            host: Host (com porta) da URL.
+        """
+        with self._lock:
+            circuit: _HostCircuit | None = self._hosts.get(host)
+            if circuit is None:
+                circuit = self._hosts[host] = _HostCircuit(
+                    self._failure_threshold,
+                    self._reset_timeout,
+                    self._max_reset_timeout,
+                )
+            return circuit
+
+    @override
+    def fetch(self, url: str, headers: dict[str, str] | None = None) -> HttpResponse:
+        """
+        Realiza a requisição quando o circuito do host permitir.
+
+        Args:
+            url: URL de destino da requisição.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Resposta HTTP completa.
+
+        Raises:
+            InfrastructureError: Se o circuito do host não liberar a requisição
+                dentro de max_wait.
+        """
+        host: str = urlparse(url).netloc
+        circuit: _HostCircuit = self._acquire(host, url)
+        try:
+            response: HttpResponse = self._http_client.fetch(url, headers)
+        except RequestCancelledError:
+            circuit.release()
+            raise
+        except BaseException:
+            self._record(host, circuit, failed=True)
+            raise
+        self._record(
+            host,
+            circuit,
+            failed=response.status_code in self._failure_status_codes,
+        )
+        return response
+
+    @override
+    def open(self, url: str, headers: dict[str, str] | None = None) -> HttpStream:
+        """
+        Abre a resposta quando o circuito do host permitir.
+
+        Args:
+            url: URL de destino da requisição.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Resposta HTTP, que deve ser fechada após o uso.
+
+        Raises:
+            InfrastructureError: Se o circuito do host não liberar a requisição
+                dentro de max_wait.
+        """
+        host: str = urlparse(url).netloc
+        circuit: _HostCircuit = self._acquire(host, url)
+        try:
+            response: HttpStream = self._http_client.open(url, headers)
+        except RequestCancelledError:
+            circuit.release()
+            raise
+        except BaseException:
+            self._record(host, circuit, failed=True)
+            raise
+        self._record(
+            host,
+            circuit,
+            failed=response.status_code in self._failure_status_codes,
+        )
+        return response
+
+    def _acquire(self, host: str, url: str) -> _HostCircuit:
+        """
+        Aguarda que o circuito do host libere a requisição e o retorna.
+
+        Args:
+            host: Host da URL.
+            url: URL de destino da requisição.
+
+        Raises:
+            InfrastructureError: Se a espera passar de max_wait.
+        """
+        circuit: _HostCircuit = self._circuit(host)
+        start: float = time.monotonic()
+        allowed: bool = circuit.acquire(self._max_wait)
+        waited: float = time.monotonic() - start
+        if self._metrics is not None and waited > 0.001:
+            self._metrics.observe(
+                "circuit_breaker_wait_seconds", waited, {"host": host}
+            )
+        if allowed:
+            return circuit
+        if self._metrics is not None:
+            self._metrics.increment(
+                "circuit_breaker_rejections_total", labels={"host": host}
+            )
+        msg: str = (
+            f"Host {host} pausado após falhas seguidas; a pausa não terminou "
+            f"em {self._max_wait:.1f}s: {url}"
+        )
+        raise InfrastructureError(msg)
+
+    def _record(self, host: str, circuit: _HostCircuit, *, failed: bool) -> None:
+        """
+        Registra o resultado da requisição no circuito do host.
+
+        Args:
+            host: Host da URL.
+            circuit: Circuito do host.
+            failed: Se a requisição falhou.
+        """
+        changed: bool = circuit.record(failed=failed, now=time.monotonic())
+        if changed and self._metrics is not None:
+            self._metrics.set_gauge(
+                "circuit_breaker_open", float(failed), {"host": host}
+            )
+            if failed:
+                self._metrics.increment(
+                    "circuit_breaker_trips_total", labels={"host": host}
+                )
@@ -0,0 +1,581 @@
+import math
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import Future
+from queue import SimpleQueue
+from typing import TYPE_CHECKING, override
+
+from domain.interfaces import IMetrics
+
+from infrastructure.scrapper.http_client import (
+    CURRENT_TICKET,
+    AdmissionTicket,
+    BaseHttpClient,
+    HttpResponse,
+    HttpStream,
+)
+from infrastructure.validations import InfrastructureError, RequestCancelledError
+
+if TYPE_CHECKING:
+    from contextvars import Token
+
+
+class _LatencyWindow:
+    """
+    Latências mais recentes de uma classe de URL, usadas para estimar o
+    percentil a partir do qual uma requisição é considerada lenta.
+    """
+
+    def __init__(self, size: int, min_samples: int) -> None:
+        """
+        Inicializa a janela vazia.
+
+        Args:
+            size: Quantidade de latências guardadas.
+            min_samples: Latências necessárias antes de estimar o percentil.
+        """
+        self._samples: deque[float] = deque(maxlen=size)
+        self._min_samples: int = min_samples
+        self._lock: threading.Lock = threading.Lock()
+
+    def add(self, latency: float) -> None:
+        """
+        Registra a latência de uma requisição concluída.
+
+        Args:
+            latency: Duração, em segundos.
+        """
+        with self._lock:
+            self._samples.append(latency)
+
+    def percentile(self, quantile: float) -> float | None:
+        """
+        Retorna o percentil das latências da janela.
+
+        Args:
+            quantile: Percentil, entre 0 e 1 (ex.: 0.95).
+
+        Returns:
+            Latência, em segundos, ou None se ainda não houver amostras
+            suficientes.
+        """
+        with self._lock:
+            if len(self._samples) < self._min_samples:
+                return None
+            samples: list[float] = sorted(self._samples)
+        return samples[min(len(samples) - 1, math.ceil(quantile * len(samples)) - 1)]
+
+
+class _WorkerPool:
+    """
+    Threads (daemon) reaproveitadas entre as requisições, criadas sob demanda
+    até max_workers; com todas ocupadas, as tarefas aguardam na fila.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        """
+        Inicializa o conjunto, sem threads.
+
+        Args:
+            max_workers: Máximo de threads.
+        """
+        self._max_workers: int = max_workers
+        self._tasks: SimpleQueue[Callable[[], None]] = SimpleQueue()
+        self._lock: threading.Lock = threading.Lock()
+        self._workers: int = 0
+        self._idle: int = 0
+        self._pending: int = 0
+
+    def submit(self, task: Callable[[], None]) -> None:
+        """
+        Agenda uma tarefa, criando uma thread se nenhuma estiver livre.
+
+        Args:
+            task: Função a executar; não deve lançar exceções.
+        """
+        with self._lock:
+            self._pending += 1
+            spawn: bool = (
+                self._pending > self._idle and self._workers < self._max_workers
+            )
+            if spawn:
+                self._workers += 1
+        self._tasks.put(task)
+        if spawn:
+            threading.Thread(target=self._work, name="hedged-http", daemon=True).start()
+
+    def _work(self) -> None:
+        """
+        Laço de uma thread: executa as tarefas da fila.
+        """
+        while True:
+            with self._lock:
+                self._idle += 1
+            task: Callable[[], None] = self._tasks.get()
+            with self._lock:
+                self._idle -= 1
+                self._pending -= 1
+            task()
+
+
+class _Race[T]:
+    """
+    Disputa entre a requisição original e a duplicada: vence a primeira que
+    obtém resposta. Respostas que chegam depois de decidida a disputa são
+    descartadas (fechadas, no caso das lidas aos poucos).
+    """
+
+    def __init__(self, discard: Callable[[T], None]) -> None:
+        """
+        Inicializa a disputa.
+
+        Args:
+            discard: Função chamada com as respostas perdedoras.
+        """
+        self._discard: Callable[[T], None] = discard
+        self._lock: threading.Lock = threading.Lock()
+        self._changed: threading.Condition = threading.Condition(self._lock)
+        self._settled: bool = False
+        self._pending: int = 0
+        self._decided: bool = False
+        self._winner: T | None = None
+        self._winner_index: int | None = None
+        self._error: BaseException | None = None
+
+    def join(self, index: int, future: Future[T]) -> None:
+        """
+        Inscreve uma requisição na disputa.
+
+        Args:
+            index: Posição da requisição (0 para a original).
+            future: Execução da requisição.
+        """
+        with self._lock:
+            self._pending += 1
+        future.add_done_callback(lambda done: self._settle(index, done))
+
+    def _settle(self, index: int, future: Future[T]) -> None:
+        """
+        Registra o término de uma requisição.
+
+        Args:
+            index: Posição da requisição.
+            future: Execução concluída.
+        """
+        error: BaseException | None = future.exception()
+        with self._lock:
+            self._pending -= 1
+            if error is not None:
+                self._error = error
+                if self._pending == 0:
+                    self._settled = True
+                    self._changed.notify_all()
+                return
+            if not self._decided:
+                self._decided = True
+                self._winner = future.result()
+                self._winner_index = index
+                self._settled = True
+                self._changed.notify_all()
+                return
+        self._discard(future.result())
+
+    def notify(self) -> None:
+        """
+        Acorda a espera da disputa para que ela reavalie o tempo das
+        tentativas.
+        """
+        with self._changed:
+            self._changed.notify_all()
+
+    def wait(self, ticket: AdmissionTicket, limit: float | None) -> bool:
+        """
+        Aguarda uma resposta, a falha de todas as requisições ou que a
+        tentativa informada passe do limite de tempo com o servidor.
+
+        Enquanto a tentativa aguarda vaga localmente, o tempo dela não corre.
+
+        Args:
+            ticket: Tentativa cujo tempo é comparado com o limite.
+            limit: Tempo máximo, em segundos (None: sem limite).
+
+        Returns:
+            True se a disputa terminou antes do limite.
+        """
+        with self._changed:
+            while not self._settled:
+                if limit is None:
+                    self._changed.wait()
+                    continue
+                remaining: float = limit - ticket.service_time()
+                if remaining <= 0:
+                    return False
+                self._changed.wait(None if ticket.waiting else remaining)
+            return True
+
+    def close(self) -> tuple[T | None, int | None, BaseException | None]:
+        """
+        Encerra a disputa; respostas que ainda chegarem serão descartadas.
+
+        Returns:
+            Resposta vencedora e sua posição, ou (None, None) se nenhuma
+            chegou, e a última falha, se houver.
+        """
+        with self._lock:
+            self._decided = True
+            return self._winner, self._winner_index, self._error
+
+
+class HedgedHttpClient(BaseHttpClient):
+    """
+    Decorador de cliente HTTP com requisições duplicadas (hedging) e prazos
+    por classe de URL, para reduzir a latência de cauda.
+
+    Quando uma requisição demora mais que o percentil hedge_percentile das
+    latências recentes da sua classe de URL, uma cópia é enviada e vale a
+    primeira resposta; a outra é descartada ao chegar. As cópias são limitadas
+    a max_hedge_ratio das requisições, para não multiplicar a carga quando o
+    site todo fica lento. Uma requisição sem resposta dentro do prazo da sua
+    classe falha com InfrastructureError; nas respostas lidas aos poucos, o
+    prazo também vale para a leitura do corpo.
+
+    Quando a requisição tem prazo ou pode receber cópia, ela é executada em
+    uma das até max_workers threads (daemon) do decorador, reaproveitadas
+    entre as requisições, para que a espera possa ser interrompida; uma
+    requisição abandonada termina em segundo plano, limitada pelos timeouts do
+    cliente decorado, sem impedir o encerramento do programa. Sem prazo nem
+    cópia possível, ela é executada na própria thread de quem a fez.
+
+    Sobre um limitador de requisições, o decorador deve ficar acima dele, para
+    que cada cópia ocupe a sua própria vaga. O tempo que uma tentativa passa
+    aguardando vaga (AdmissionTicket) não conta para o percentil, o prazo nem
+    as latências medidas, e as tentativas que ainda aguardam quando a disputa
+    termina são canceladas sem chegar ao servidor.
+    """
+
+    def __init__(
+        self,
+        http_client: BaseHttpClient,
+        *,
+        hedge_percentile: float = 0.95,
+        max_hedge_ratio: float = 0.1,
+        deadline_by_class: Mapping[str, float] | None = None,
+        url_classifier: Callable[[str], str] | None = None,
+        window_size: int = 200,
+        min_samples: int = 20,
+        max_workers: int = 32,
+        metrics: IMetrics | None = None,
+    ) -> None:
+        """
+        Inicializa o decorador sobre o cliente HTTP informado.
+
+        Args:
+            http_client: Cliente HTTP que executa as requisições.
+            hedge_percentile: Percentil das latências recentes (entre 0 e 1) a
+                partir do qual a cópia é enviada.
+            max_hedge_ratio: Fração máxima das requisições que recebem cópia
+                (0 desativa as cópias).
+            deadline_by_class: Prazo, em segundos, das requisições de cada
+                classe de URL; classes ausentes não têm prazo (opcional).
+            url_classifier: Função que retorna a classe de uma URL (opcional).
+            window_size: Latências recentes guardadas por classe de URL.
+            min_samples: Latências necessárias antes de enviar cópias.
+            max_workers: Máximo de threads que executam as requisições e as
+                cópias.
+            metrics: Destino das métricas de cópias e prazos (opcional).
+        """
+        InfrastructureError.when(
+            has_error=not 0 < hedge_percentile < 1,
+            message="hedge_percentile deve estar entre 0 e 1.",
+        )
+        InfrastructureError.when(
+            has_error=not 0 <= max_hedge_ratio <= 1,
+            message="max_hedge_ratio deve estar entre 0 e 1.",
+        )
+        InfrastructureError.when(
+            has_error=any(
+                deadline <= 0 for deadline in (deadline_by_class or {}).values()
+            ),
+            message="Os prazos devem ser maiores que zero.",
+        )
+        InfrastructureError.when(
+            has_error=not 1 <= min_samples <= window_size,
+            message="min_samples deve estar entre 1 e window_size.",
+        )
+        InfrastructureError.when(
+            has_error=max_workers < 1,
+            message="max_workers deve ser maior ou igual a 1.",
+        )
+        self._http_client: BaseHttpClient = http_client
+        self._hedge_percentile: float = hedge_percentile
+        self._max_hedge_ratio: float = max_hedge_ratio
+        self._deadlines: dict[str, float] = dict(deadline_by_class or {})
+        self._url_classifier: Callable[[str], str] = url_classifier or (
+            lambda _url: "default"
+        )
+        self._window_size: int = window_size
+        self._min_samples: int = min_samples
+        self._metrics: IMetrics | None = metrics
+        self._lock: threading.Lock = threading.Lock()
+        self._windows: dict[str, _LatencyWindow] = {}
+        self._requests: int = 0
+        self._hedges: int = 0
+        self._workers: _WorkerPool = _WorkerPool(max_workers)
+
+    @override
+    def fetch(self, url: str, headers: dict[str, str] | None = None) -> HttpResponse:
+        """
+        Realiza a requisição, enviando uma cópia se ela demorar.
+
+        Args:
+            url: URL de destino da requisição.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Primeira resposta HTTP completa recebida.
+
+        Raises:
+            InfrastructureError: Se nenhuma resposta chegar dentro do prazo.
+        """
+        url_class: str = self._url_classifier(url)
+        response, _clock = self._race(
+            url,
+            url_class,
+            lambda: self._http_client.fetch(url, headers),
+            lambda _response: None,
+        )
+        return response
+
+    @override
+    def open(self, url: str, headers: dict[str, str] | None = None) -> HttpStream:
+        """
+        Abre a resposta, enviando uma cópia se o status e os cabeçalhos
+        demorarem.
+
+        Args:
+            url: URL de destino da requisição.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Primeira resposta HTTP aberta, que deve ser fechada após o uso. A
+            leitura do corpo falha com InfrastructureError se passar do prazo.
+
+        Raises:
+            InfrastructureError: Se nenhuma resposta chegar dentro do prazo.
+        """
+        url_class: str = self._url_classifier(url)
+        response, clock = self._race(
+            url,
+            url_class,
+            lambda: self._http_client.open(url, headers),
+            HttpStream.close,
+        )
+        deadline: float | None = self._deadlines.get(url_class)
+        if deadline is None:
+            return response
+        return HttpStream(
+            response.url,
+            response.status_code,
+            self._until(response.iter_text(), clock, deadline, url, url_class),
+            response.headers,
+            on_close=response.close,
+        )
+
+    def _window(self, url_class: str) -> _LatencyWindow:
+        """
+        Retorna a janela de latências da classe de URL, criando-a se preciso.
+
+        Args:
+            url_class: Classe da URL.
+        """
+        with self._lock:
+            window: _LatencyWindow | None = self._windows.get(url_class)
+            if window is None:
+                window = self._windows[url_class] = _LatencyWindow(
+                    self._window_size, self._min_samples
+                )
+            return window
+
+    def _race[T](
+        self,
+        url: str,
+        url_class: str,
+        call: Callable[[], T],
+        discard: Callable[[T], None],
+    ) -> tuple[T, AdmissionTicket]:
+        """
+        Executa a requisição e, se ela passar do percentil, uma cópia,
+        retornando a primeira resposta.
+
+        O percentil e o prazo são comparados com o tempo da requisição
+        original com o servidor, sem as esperas locais. Ao fim da disputa, as
+        tentativas que ainda aguardam vaga são canceladas. Sem prazo nem cópia
+        possível, a requisição é executada na thread atual.
+
+        Args:
+            url: URL de destino da requisição.
+            url_class: Classe da URL.
+            call: Função que executa a requisição.
+            discard: Função chamada com as respostas descartadas.
+
+        Returns:
+            Resposta vencedora e a tentativa original, cujo tempo com o
+            servidor é o relógio do prazo.
+        """
+        window: _LatencyWindow = self._window(url_class)
+        deadline: float | None = self._deadlines.get(url_class)
+        hedge_delay: float | None = window.percentile(self._hedge_percentile)
+        with self._lock:
+            self._requests += 1
+        if deadline is None and (hedge_delay is None or self._max_hedge_ratio == 0):
+            ticket: AdmissionTicket = AdmissionTicket()
+            return self._attempt(call, window, ticket), ticket
+
+        race: _Race[T] = _Race(discard)
+        tickets: list[AdmissionTicket] = []
+
+        def answered() -> None:
+            # Com a resposta de uma tentativa, as que aguardam vaga desistem
+            # antes de ocupar a que ela está prestes a liberar
+            for ticket in tickets:
+                if ticket.waiting:
+                    ticket.cancel()
+
+        tickets.append(AdmissionTicket(race.notify, answered))
+        race.join(0, self._start(call, window, tickets[0]))
+
+        hedged: bool = False
+        if (
+            hedge_delay is not None
+            and (deadline is None or hedge_delay < deadline)
+            and not race.wait(tickets[0], hedge_delay)
+            and self._reserve_hedge()
+        ):
+            hedged = True
+            tickets.append(AdmissionTicket(race.notify, answered))
+            race.join(1, self._start(call, window, tickets[1]))
+            self._count("http_hedged_requests_total", url_class)
+        race.wait(tickets[0], deadline)
+
+        response, winner, error = race.close()
+        for ticket in tickets:
+            ticket.cancel()
+        if response is not None:
+            if hedged and winner == 1:
+                self._count("http_hedge_wins_total", url_class)
+            return response, tickets[0]
+        if error is not None:
+            raise error
+        self._count("http_deadline_exceeded_total", url_class)
+        msg: str = f"Prazo de {deadline:.1f}s esgotado: {url}"
+        raise InfrastructureError(msg)
+
+    def _reserve_hedge(self) -> bool:
+        """
+        Reserva o envio de uma cópia, se a fração máxima permitir.
+
+        Returns:
+            True se a cópia pode ser enviada.
+        """
+        with self._lock:
+            if self._hedges + 1 > self._max_hedge_ratio * self._requests:
+                return False
+            self._hedges += 1
+            return True
+
+    def _attempt[T](
+        self, call: Callable[[], T], window: _LatencyWindow, ticket: AdmissionTicket
+    ) -> T:
+        """
+        Executa a tentativa na thread atual e registra sua latência, sem as
+        esperas locais, na janela da classe.
+
+        Args:
+            call: Função que executa a requisição.
+            window: Janela de latências da classe da URL.
+            ticket: Tentativa da requisição, visível aos limitadores abaixo.
+
+        Returns:
+            Resposta da requisição.
+
+        Raises:
+            RequestCancelledError: Se a tentativa foi cancelada antes de
+                começar.
+        """
+        if not ticket.admit():
+            msg: str = "Requisição cancelada antes de começar"
+            raise RequestCancelledError(msg)
+        token: Token[AdmissionTicket | None] = CURRENT_TICKET.set(ticket)
+        try:
+            result: T = call()
+        finally:
+            CURRENT_TICKET.reset(token)
+        window.add(ticket.service_time())
+        return result
+
+    def _start[T](
+        self, call: Callable[[], T], window: _LatencyWindow, ticket: AdmissionTicket
+    ) -> Future[T]:
+        """
+        Executa a tentativa em uma das threads do decorador.
+
+        Args:
+            call: Função que executa a requisição.
+            window: Janela de latências da classe da URL.
+            ticket: Tentativa da requisição; o tempo na fila das threads conta
+                como espera local.
+
+        Returns:
+            Execução da requisição.
+        """
+        future: Future[T] = Future()
+        future.set_running_or_notify_cancel()
+
+        def run() -> None:
+            try:
+                result: T = self._attempt(call, window, ticket)
+            except BaseException as error:  # noqa: BLE001
+                future.set_exception(error)
+                return
+            future.set_result(result)
+
+        self._workers.submit(run)
+        return future
+
+    def _until(
+        self,
+        chunks: Iterator[str],
+        clock: AdmissionTicket,
+        deadline: float,
+        url: str,
+        url_class: str,
+    ) -> Iterator[str]:
+        """
+        Repassa os pedaços do corpo enquanto o prazo não se esgota.
+
+        Args:
+            chunks: Pedaços do corpo.
+            clock: Tentativa original, cujo tempo com o servidor é comparado
+                com o prazo.
+            deadline: Prazo, em segundos.
+            url: URL requisitada.
+            url_class: Classe da URL.
+        """
+        for chunk in chunks:
+            if clock.service_time() > deadline:
+                self._count("http_deadline_exceeded_total", url_class)
+                msg: str = f"Prazo esgotado durante a leitura: {url}"
+                raise InfrastructureError(msg)
+            yield chunk
+
+    def _count(self, name: str, url_class: str) -> None:
+        """
+        Soma um a um contador da classe de URL, se houver destino de métricas.
+
+        Args:
+            name: Nome da métrica.
+            url_class: Classe da URL.
+        """
+        if self._metrics is not None:
+            self._metrics.increment(name, labels={"url_class": url_class})
@@ -0,0 +1,216 @@
+import html
+import re
+from functools import cache
+
+# Atributos de uma tag: nome, opcionalmente seguido de =valor (com ou sem aspas)
+_ATTRIBUTE = re.compile(r"""([^\s=/"'>]+)(?:\s*=\s*("[^"]*"|'[^']*'|[^\s"'>]+))?""")
+
+
+@cache
+def _token_pattern(tag: str) -> re.Pattern[str]:
+    """
+    Compila a expressão que localiza aberturas e fechamentos da tag.
+
+    Comentários e o conteúdo de script/style são consumidos por inteiro para
+    que tags dentro deles não sejam contadas. Um comentário ou script/style
+    ainda sem fechamento casa apenas a abertura (grupo 4), indicando que o
+    restante do documento ainda não chegou.
+
+    Args:
+        tag: Nome da tag, em minúsculas.
+    """
+    return re.compile(
+        r"<!--.*?-->"
+        r"|<(script|style)\b(?:[^>\"']|\"[^\"]*\"|'[^']*')*>.*?</\1\s*>"
+        rf"|<(/?){re.escape(tag)}\b((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>"
+        r"|(<!--|<(?:script|style)\b)",
+        re.DOTALL | re.IGNORECASE,
+    )
+
+
+def _attributes(raw: str) -> dict[str, str]:
+    """
+    Converte o trecho de atributos de uma tag em dicionário.
+
+    Args:
+        raw: Texto entre o nome da tag e o ">".
+    """
+    return {
+        name.lower(): html.unescape(value.strip("\"'")) if value else ""
+        for name, value in _ATTRIBUTE.findall(raw.rstrip("/"))
+    }
+
+
+class RegionScanner:
+    """
+    Recorta elementos de um documento recebido em pedaços.
+
+    Equivale a extract_elements, mas sem precisar do documento inteiro: só o
+    trecho ainda não examinado e os elementos recortados ficam em memória. Com
+    first_only, feed indica quando o primeiro elemento terminou, para que a
+    leitura do restante do documento seja interrompida.
+    """
+
+    def __init__(
+        self,
+        tag: str,
+        *,
+        css_class: str | None = None,
+        element_id: str | None = None,
+        first_only: bool = False,
+    ) -> None:
+        """
+        Inicializa o recorte.
+
+        Args:
+            tag: Nome da tag procurada (ex.: "div").
+            css_class: Classe que o elemento deve conter (opcional).
+            element_id: Id que o elemento deve ter (opcional).
+            first_only: Se True, recorta apenas o primeiro elemento encontrado.
+        """
+        self._pattern: re.Pattern[str] = _token_pattern(tag.lower())
+        self._css_class: str | None = css_class
+        self._element_id: str | None = element_id
+        self._first_only: bool = first_only
+        self._buffer: str = ""
+        self._scan: int = 0
+        self._start: int | None = None
+        self._depth: int = 0
+        self._regions: list[str] = []
+        self._done: bool = False
+
+    @property
+    def done(self) -> bool:
+        """
+        Indica se o primeiro elemento já foi recortado (com first_only).
+        """
+        return self._done
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Examina o próximo pedaço do documento.
+
+        Args:
+            chunk: Continuação do documento.
+
+        Returns:
+            True se o restante do documento não é mais necessário.
+        """
+        if not self._done:
+            self._buffer += chunk
+            self._consume(final=False)
+        return self._done
+
+    def finish(self) -> str:
+        """
+        Encerra o recorte, no fim do documento ou após interromper a leitura.
+
+        Returns:
+            HTML dos elementos encontrados, concatenados na ordem do documento,
+            ou string vazia.
+        """
+        if not self._done:
+            self._consume(final=True)
+            if self._start is not None:
+                # Elemento sem fechamento: mantém o restante do documento
+                self._regions.append(self._buffer[self._start :])
+        self._buffer = ""
+        self._start = None
+        return "".join(self._regions)
+
+    def _consume(self, *, final: bool) -> None:
+        """
+        Processa as tags do trecho pendente e descarta o que não é mais útil.
+
+        Args:
+            final: Se True, não há mais pedaços: comentários e scripts sem
+                fechamento são ignorados, como em um documento completo.
+        """
+        position: int = self._scan
+        incomplete: bool = False
+        for match in self._pattern.finditer(self._buffer, self._scan):
+            if match.group(4) is not None:
+                if final:
+                    continue
+                position = match.start()
+                incomplete = True
+                break
+            position = match.end()
+            if match.group(2) is not None and self._handle_tag(match):
+                self._done = True
+                return
+        if not incomplete and not final:
+            # Uma tag pode estar cortada no fim do pedaço: reexamina a partir
+            # do último "<"
+            last_tag: int = self._buffer.rfind("<", position)
+            position = last_tag if last_tag != -1 else len(self._buffer)
+        keep_from: int = position if self._start is None else self._start
+        self._buffer = self._buffer[keep_from:]
+        self._scan = position - keep_from
+        if self._start is not None:
+            self._start = 0
+
+    def _handle_tag(self, match: re.Match[str]) -> bool:
+        """
+        Atualiza o recorte com uma abertura ou fechamento da tag procurada.
+
+        Args:
+            match: Tag encontrada.
+
+        Returns:
+            True se o primeiro elemento terminou e first_only foi pedido.
+        """
+        closing: bool = match.group(2) == "/"
+        if self._start is not None:
+            self._depth += -1 if closing else 1
+            if self._depth == 0:
+                self._regions.append(self._buffer[self._start : match.end()])
+                self._start = None
+                return self._first_only
+            return False
+        if closing:
+            return False
+        attributes: dict[str, str] = _attributes(match.group(3))
+        if (
+            self._css_class is not None
+            and self._css_class not in attributes.get("class", "").split()
+        ):
+            return False
+        if self._element_id is not None and attributes.get("id") != self._element_id:
+            return False
+        self._start = match.start()
+        self._depth = 1
+        return False
+
+
+def extract_elements(
+    document: str,
+    tag: str,
+    *,
+    css_class: str | None = None,
+    element_id: str | None = None,
+    first_only: bool = False,
+) -> str:
+    """
+    Recorta do documento apenas os elementos que correspondem ao seletor.
+
+    Localiza as tags de abertura `tag` com a classe e/ou id informados e
+    retorna o HTML de cada elemento, do início até o fechamento correspondente,
+    concatenados na ordem do documento. Elementos aninhados em outro já
+    recortado fazem parte do recorte externo.
+
+    Args:
+        document: HTML completo da página.
+        tag: Nome da tag procurada (ex.: "div").
+        css_class: Classe que o elemento deve conter (opcional).
+        element_id: Id que o elemento deve ter (opcional).
+        first_only: Se True, retorna apenas o primeiro elemento encontrado.
+
+    Returns:
+        HTML dos elementos encontrados, ou string vazia.
+    """
+    scanner = RegionScanner(
+        tag, css_class=css_class, element_id=element_id, first_only=first_only
+    )
+    scanner.feed(document)
+    return scanner.finish()
@@ -1,14 +1,301 @@
+import codecs
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Generator, Iterable, Iterator
+from contextlib import suppress
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Self, override
+
 import requests
 from domain.interfaces import IHttpClient
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from infrastructure.validations import InfrastructureError
+
+# Bytes lidos da rede por vez nas respostas lidas aos poucos
+STREAM_CHUNK_SIZE = 16 * 1024
 
+# Ao interromper a leitura de uma resposta, o restante do corpo é descartado
+# até este limite para que a conexão volte ao pool; respostas maiores têm a
+# conexão fechada
+STREAM_DRAIN_BYTES = 256 * 1024
 
-class RequestsHttpClient(IHttpClient):
+
+@dataclass(frozen=True, slots=True)
+class HttpResponse:
     """
-    Implementação concreta de cliente HTTP usando requests.
+    Resposta HTTP já decodificada.
 
-    Responsável por realizar requisições HTTP GET para coletar dados de páginas web.
+    Atributos:
+        url: URL requisitada.
+        status_code: Código de status HTTP.
+        text: Corpo da resposta decodificado.
+        headers: Cabeçalhos da resposta, com nomes em minúsculas.
+    """
+
+    url: str
+    status_code: int
+    text: str
+    headers: dict[str, str] = field(default_factory=dict[str, str])
+
+    def raise_for_status(self) -> None:
+        """
+        Lança requests.HTTPError quando o status indica erro (4xx ou 5xx).
+        """
+        if self.status_code >= 400:
+            msg = f"{self.status_code} Error for url: {self.url}"
+            raise requests.HTTPError(msg)
+
+
+class HttpStream:
+    """
+    Resposta HTTP cujo corpo é lido aos poucos.
+
+    O status e os cabeçalhos estão disponíveis de imediato; o corpo é lido à
+    medida que iter_text é percorrido. A resposta deve ser fechada (close ou
+    bloco with), mesmo que o corpo não seja lido até o fim.
+
+    Atributos:
+        url: URL requisitada.
+        status_code: Código de status HTTP.
+        headers: Cabeçalhos da resposta, com nomes em minúsculas.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        chunks: Iterable[str],
+        headers: dict[str, str] | None = None,
+        on_close: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Inicializa a resposta.
+
+        Args:
+            url: URL requisitada.
+            status_code: Código de status HTTP.
+            chunks: Pedaços do corpo, já decodificados, lidos sob demanda.
+            headers: Cabeçalhos da resposta, com nomes em minúsculas.
+            on_close: Função chamada uma única vez ao fechar a resposta, para
+                liberar a conexão ou o arquivo de onde o corpo é lido.
+        """
+        self.url: str = url
+        self.status_code: int = status_code
+        self.headers: dict[str, str] = headers or {}
+        self._chunks: Iterator[str] = iter(chunks)
+        self._on_close: Callable[[], None] | None = on_close
+
+    @classmethod
+    def from_response(cls, response: HttpResponse) -> Self:
+        """
+        Cria a resposta a partir de uma resposta já lida por inteiro.
+
+        Args:
+            response: Resposta completa.
+        """
+        return cls(
+            response.url,
+            response.status_code,
+            (response.text,) if response.text else (),
+            response.headers,
+        )
+
+    def iter_text(self) -> Iterator[str]:
+        """
+        Retorna os pedaços do corpo ainda não lidos.
+
+        Interromper a iteração não encerra a leitura: uma nova chamada continua
+        do ponto em que a anterior parou.
+        """
+        # Sem yield from, que fecharia o iterador junto com este gerador
+        for chunk in self._chunks:  # noqa: UP028
+            yield chunk
+
+    def raise_for_status(self) -> None:
+        """
+        Lança requests.HTTPError quando o status indica erro (4xx ou 5xx).
+        """
+        if self.status_code >= 400:
+            msg = f"{self.status_code} Error for url: {self.url}"
+            raise requests.HTTPError(msg)
+
+    def close(self) -> None:
+        """
+        Libera os recursos da resposta. Chamadas seguintes não têm efeito.
+        """
+        on_close: Callable[[], None] | None = self._on_close
+        self._on_close = None
+        if on_close is not None:
+            on_close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class AdmissionTicket:
+    """
+    Tentativa de requisição que pode aguardar vaga em limitadores locais.
+
+    Separa o tempo em que a tentativa aguarda localmente (na fila de threads
+    ou no limitador de requisições) do tempo em que está com o servidor, para
+    que prazos e latências considerem apenas o segundo. A tentativa começa
+    aguardando; quem a executa chama admit ao começar, e um limitador chama
+    wait ao retê-la e admit ao liberá-la. Enquanto aguarda, a tentativa pode
+    ser cancelada, e admit passa a recusá-la. O limitador chama respond quando
+    o servidor responde, antes de liberar a vaga, para que as cópias da mesma
+    requisição possam ser canceladas antes de ocupá-la.
+
+    O limitador encontra a tentativa da thread atual em CURRENT_TICKET.
+    """
+
+    def __init__(
+        self,
+        on_change: Callable[[], None] | None = None,
+        on_response: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Inicializa a tentativa, aguardando.
+
+        Args:
+            on_change: Função chamada quando a tentativa passa a aguardar ou é
+                liberada (opcional).
+            on_response: Função chamada quando o servidor responde à tentativa
+                (opcional).
+        """
+        now: float = time.monotonic()
+        self._created_at: float = now
+        self._waiting_since: float | None = now
+        self._waited: float = 0.0
+        self._cancelled: bool = False
+        self._wake: Callable[[], None] | None = None
+        self._on_change: Callable[[], None] | None = on_change
+        self._on_response: Callable[[], None] | None = on_response
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Indica se a tentativa foi cancelada.
+        """
+        return self._cancelled
+
+    @property
+    def waiting(self) -> bool:
+        """
+        Indica se a tentativa está aguardando localmente.
+        """
+        with self._lock:
+            return self._waiting_since is not None
+
+    def service_time(self) -> float:
+        """
+        Retorna o tempo, em segundos, que a tentativa passou liberada, sem
+        contar as esperas locais.
+        """
+        now: float = time.monotonic()
+        with self._lock:
+            waited: float = self._waited
+            if self._waiting_since is not None:
+                waited += now - self._waiting_since
+        return now - self._created_at - waited
+
+    def wait(self, wake: Callable[[], None]) -> None:
+        """
+        Registra que a tentativa passou a aguardar vaga em um limitador.
+
+        Args:
+            wake: Função que acorda a espera no limitador, chamada se a
+                tentativa for cancelada.
+        """
+        with self._lock:
+            if self._waiting_since is None:
+                self._waiting_since = time.monotonic()
+            self._wake = wake
+        if self._on_change is not None:
+            self._on_change()
+
+    def admit(self) -> bool:
+        """
+        Libera a tentativa, encerrando a espera local.
+
+        Returns:
+            False se a tentativa foi cancelada e não deve ser enviada.
+        """
+        with self._lock:
+            if self._cancelled:
+                return False
+            if self._waiting_since is not None:
+                self._waited += time.monotonic() - self._waiting_since
+                self._waiting_since = None
+            self._wake = None
+        if self._on_change is not None:
+            self._on_change()
+        return True
+
+    def respond(self) -> None:
+        """
+        Registra que o servidor respondeu à tentativa.
+        """
+        if self._on_response is not None:
+            self._on_response()
+
+    def cancel(self) -> None:
+        """
+        Cancela a tentativa: se ela aguarda, o limitador é acordado e a recusa;
+        se já foi liberada, não é liberada de novo.
+        """
+        with self._lock:
+            self._cancelled = True
+            wake: Callable[[], None] | None = self._wake
+        if wake is not None:
+            wake()
+
+
+# Tentativa executada na thread atual, consultada pelos limitadores locais
+CURRENT_TICKET: ContextVar[AdmissionTicket | None] = ContextVar(
+    "current_ticket", default=None
+)
+
+
+class BaseHttpClient(IHttpClient, ABC):
+    """
+    Base para clientes HTTP que expõem a resposta completa.
+
+    Decoradores de cliente (cache, limitação de taxa etc.) dependem do status e
+    dos cabeçalhos da resposta, que IHttpClient.get não expõe. Subclasses
+    implementam fetch; get é derivado dele. Subclasses que conseguem entregar o
+    corpo aos poucos também sobrescrevem open, de onde stream é derivado.
     """
 
+    @abstractmethod
+    def fetch(self, url: str, headers: dict[str, str] | None = None) -> HttpResponse:
+        """
+        Realiza uma requisição HTTP GET sem validar o status da resposta.
+
+        Args:
+            url: URL de destino da requisição.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Resposta HTTP completa.
+        """
+        pass
+
+    @override
     def get(self, url: str, headers: dict[str, str] | None = None) -> str:
         """
         Realiza uma requisição HTTP GET para a URL informada.
@@ -20,6 +307,234 @@ class RequestsHttpClient(IHttpClient):
         Returns:
             Conteúdo da resposta como string.
         """
-        response = requests.get(url, headers=headers)  # noqa: S113
+        response: HttpResponse = self.fetch(url, headers)
         response.raise_for_status()
         return response.text
+
+    def open(self, url: str, headers: dict[str, str] | None = None) -> HttpStream:
+        """
+        Realiza uma requisição HTTP GET cujo corpo é lido aos poucos, sem
+        validar o status da resposta.
+
+        Por padrão, a resposta é obtida por inteiro com fetch.
+
+        Args:
+            url: URL de destino da requisição.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Resposta HTTP, que deve ser fechada após o uso.
+        """
+        return HttpStream.from_response(self.fetch(url, headers))
+
+    @override
+    def stream(self, url: str, headers: dict[str, str] | None = None) -> Generator[str]:
+        """
+        Realiza uma requisição HTTP GET e retorna o corpo em pedaços.
+
+        Ao fechar o gerador antes do fim, a resposta é fechada.
+
+        Args:
+            url: URL de destino da requisição.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Gerador com os pedaços do corpo, já decodificados.
+        """
+        with self.open(url, headers) as response:
+            response.raise_for_status()
+            yield from response.iter_text()
+
+
+class RequestsHttpClient(BaseHttpClient):
+    """
+    Implementação concreta de cliente HTTP usando requests.
+
+    Responsável por realizar requisições HTTP GET para coletar dados de páginas web.
+    Mantém uma sessão com pool de conexões keep-alive, aplica timeouts de conexão
+    e leitura e repete requisições com backoff exponencial em respostas 429/5xx.
+    O corpo é lido em pedaços de STREAM_CHUNK_SIZE bytes, e a leitura de um
+    corpo que ultrapassa max_body_bytes é interrompida com erro; em open, quem
+    para de ler antes do limite não é afetado.
+    """
+
+    RETRY_STATUS_CODES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        retry_status_codes: Iterable[int] | None = None,
+        max_body_bytes: int | None = 16 * 1024 * 1024,
+    ) -> None:
+        """
+        Inicializa a sessão HTTP e o pool de conexões.
+
+        Args:
+            pool_size: Máximo de conexões mantidas abertas por host.
+            connect_timeout: Tempo máximo, em segundos, para abrir a conexão.
+            read_timeout: Tempo máximo, em segundos, de espera pela resposta.
+            max_retries: Quantidade máxima de novas tentativas por requisição.
+            backoff_factor: Fator do backoff exponencial entre tentativas.
+            retry_status_codes: Status repetidos automaticamente. Por padrão,
+                RETRY_STATUS_CODES; sob um RateLimitedHttpClient, 429 e 503
+                devem ficar de fora para que o limitador os perceba.
+            max_body_bytes: Tamanho máximo, em bytes e já descomprimido, do
+                corpo de uma resposta (None: sem limite).
+        """
+        self._max_body_bytes: int | None = max_body_bytes
+        self._timeout: tuple[float, float] = (connect_timeout, read_timeout)
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=frozenset(
+                self.RETRY_STATUS_CODES
+                if retry_status_codes is None
+                else retry_status_codes
+            ),
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry,
+            pool_block=True,
+        )
+        self._session: requests.Session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # gzip/deflate sempre; brotli quando o pacote opcional estiver instalado
+        self._session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+    @override
+    def fetch(self, url: str, headers: dict[str, str] | None = None) -> HttpResponse:
+        """
+        Realiza uma requisição HTTP GET sem validar o status da resposta.
+
+        Args:
+            url: URL de destino da requisição.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Resposta HTTP completa.
+        """
+        with self.open(url, headers) as response:
+            text: str = "".join(response.iter_text())
+        return HttpResponse(
+            url=url,
+            status_code=response.status_code,
+            text=text,
+            headers=response.headers,
+        )
+
+    @override
+    def open(self, url: str, headers: dict[str, str] | None = None) -> HttpStream:
+        """
+        Realiza uma requisição HTTP GET cujo corpo é lido da rede aos poucos.
+
+        Ao fechar a resposta antes do fim do corpo, o restante é descartado (até
+        STREAM_DRAIN_BYTES) para que a conexão seja reaproveitada.
+
+        Args:
+            url: URL de destino da requisição.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Resposta HTTP, que deve ser fechada após o uso.
+        """
+        response: requests.Response = self._session.get(
+            url, headers=headers, timeout=self._timeout, stream=True
+        )
+        body = _StreamedBody(url, response, self._max_body_bytes)
+        return HttpStream(
+            url,
+            response.status_code,
+            body.iter_text(),
+            {name.lower(): value for name, value in response.headers.items()},
+            on_close=body.close,
+        )
+
+    def close(self) -> None:
+        """
+        Encerra a sessão e libera as conexões do pool.
+        """
+        self._session.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class _StreamedBody:
+    """
+    Corpo de uma resposta do requests lido aos poucos e decodificado.
+    """
+
+    def __init__(
+        self, url: str, response: requests.Response, max_bytes: int | None
+    ) -> None:
+        """
+        Inicializa a leitura do corpo.
+
+        Args:
+            url: URL requisitada.
+            response: Resposta aberta com stream=True.
+            max_bytes: Tamanho máximo do corpo (None: sem limite).
+        """
+        self._url: str = url
+        self._response: requests.Response = response
+        self._max_bytes: int | None = max_bytes
+        self._finished: bool = False
+
+    def iter_text(self) -> Iterator[str]:
+        """
+        Lê o corpo em pedaços, decodificando com a codificação da resposta.
+        """
+        try:
+            decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder(
+                self._response.encoding or "utf-8"
+            )(errors="replace")
+        except LookupError:
+            # Codificação desconhecida no Content-Type, como faz o requests
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        size: int = 0
+        for data in self._response.iter_content(STREAM_CHUNK_SIZE):
+            size += len(data)
+            if self._max_bytes is not None and size > self._max_bytes:
+                self._response.close()
+                self._finished = True
+                msg: str = f"Resposta maior que {self._max_bytes} bytes: {self._url}"
+                raise InfrastructureError(msg)
+            text: str = decoder.decode(data)
+            if text:
+                yield text
+        self._finished = True
+        tail: str = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+    def close(self) -> None:
+        """
+        Descarta o restante do corpo, se for pequeno, e libera a conexão.
+        """
+        if not self._finished:
+            self._finished = True
+            drained: int = 0
+            with suppress(requests.RequestException):
+                for data in self._response.iter_content(STREAM_CHUNK_SIZE):
+                    drained += len(data)
+                    if drained > STREAM_DRAIN_BYTES:
+                        break
+        self._response.close()
@@ -0,0 +1,129 @@
+import time
+from collections.abc import Callable, Iterator
+from typing import override
+
+from domain.interfaces import IMetrics
+
+from infrastructure.scrapper.http_client import (
+    BaseHttpClient,
+    HttpResponse,
+    HttpStream,
+)
+
+
+class InstrumentedHttpClient(BaseHttpClient):
+    """
+    Decorador de cliente HTTP que registra métricas de cada requisição.
+
+    Conta as requisições por classe de URL e status (http_requests_total) e
+    registra a latência por classe de URL (http_request_seconds) e o tamanho
+    dos corpos (http_response_bytes). Falhas de rede são contadas com status
+    "error". Colocado abaixo do cache, mede apenas o tráfego real de rede. Nas
+    respostas lidas aos poucos, a latência vai até o fechamento da resposta e
+    o tamanho é o da parte do corpo efetivamente lida.
+    """
+
+    def __init__(
+        self,
+        http_client: BaseHttpClient,
+        metrics: IMetrics,
+        url_classifier: Callable[[str], str] | None = None,
+    ) -> None:
+        """
+        Inicializa o decorador sobre o cliente HTTP informado.
+
+        Args:
+            http_client: Cliente HTTP que executa as requisições.
+            metrics: Destino das métricas.
+            url_classifier: Função que retorna a classe de uma URL (opcional).
+        """
+        self._http_client: BaseHttpClient = http_client
+        self._metrics: IMetrics = metrics
+        self._url_classifier: Callable[[str], str] = url_classifier or (
+            lambda _url: "default"
+        )
+
+    @override
+    def fetch(self, url: str, headers: dict[str, str] | None = None) -> HttpResponse:
+        """
+        Realiza a requisição e registra status, latência e tamanho.
+
+        Args:
+            url: URL de destino da requisição.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Resposta HTTP completa.
+        """
+        url_class: str = self._url_classifier(url)
+        start: float = time.perf_counter()
+        try:
+            response: HttpResponse = self._http_client.fetch(url, headers)
+        except BaseException:
+            self._record(url_class, start, "error", None)
+            raise
+        self._record(url_class, start, str(response.status_code), len(response.text))
+        return response
+
+    @override
+    def open(self, url: str, headers: dict[str, str] | None = None) -> HttpStream:
+        """
+        Abre a resposta e registra status, latência e tamanho ao fechá-la.
+
+        Args:
+            url: URL de destino da requisição.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Resposta HTTP, que deve ser fechada após o uso.
+        """
+        url_class: str = self._url_classifier(url)
+        start: float = time.perf_counter()
+        try:
+            response: HttpStream = self._http_client.open(url, headers)
+        except BaseException:
+            self._record(url_class, start, "error", None)
+            raise
+        received: int = 0
+
+        def count(chunks: Iterator[str]) -> Iterator[str]:
+            nonlocal received
+            for chunk in chunks:
+                received += len(chunk)
+                yield chunk
+
+        def close() -> None:
+            response.close()
+            self._record(url_class, start, str(response.status_code), received)
+
+        return HttpStream(
+            url,
+            response.status_code,
+            count(response.iter_text()),
+            response.headers,
+            on_close=close,
+        )
+
+    def _record(
+        self, url_class: str, start: float, status: str, size: int | None
+    ) -> None:
+        """
+        Registra uma requisição encerrada.
+
+        Args:
+            url_class: Classe da URL.
+            start: Início da requisição (time.perf_counter).
+            status: Código de status, ou "error" em falhas de rede.
+            size: Tamanho do corpo lido, ou None em falhas de rede.
+        """
+        if size is not None:
+            self._metrics.observe("http_response_bytes", size, {"url_class": url_class})
+        self._metrics.observe(
+            "http_request_seconds",
+            time.perf_counter() - start,
+            {"url_class": url_class},
+        )
+        self._metrics.increment(
+            "http_requests_total",
+            labels={"url_class": url_class, "status": status},
+        )
@@ -1,31 +1,101 @@
-import re
-from collections.abc import Iterator
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from datetime import UTC, datetime, timedelta
+from itertools import count, islice
 from typing import override
-
-from bs4 import BeautifulSoup, ResultSet, Tag
-from domain.interfaces import IHttpClient, IWebScraper
-from domain.models import Product
-
+from urllib.parse import urlparse
+
+import requests
+from domain.interfaces import IHttpClient, IMetrics, IProductRepository, IWebScraper
+from domain.models import ListingState, Product, ProductListing
+
+from infrastructure.scrapper.html_regions import RegionScanner
+from infrastructure.scrapper.parsers import (
+    SPECS_TABLE_ID,
+    PageParser,
+    create_parser,
+    parse_page_count,
+)
 from infrastructure.validations import InfrastructureError
 
+# Falhas de requisição que não interrompem a coleta: a página de busca ou o
+# produto afetado é ignorado
+_FETCH_ERRORS: tuple[type[Exception], ...] = (
+    InfrastructureError,
+    requests.RequestException,
+)
+
 
 class LojaMaetoScraper(IWebScraper):
     """
     Scraper concreto para o site Loja Maeto.
 
-    Responsável por coletar produtos e detalhes de produtos de forma síncrona.
+    Responsável por coletar produtos e detalhes de produtos. As páginas de
+    detalhe de uma mesma página de busca são buscadas em paralelo, assim como
+    as páginas de busca quando a primeira informa o total de páginas.
+
+    Quando recebe um repositório, opera em modo incremental: produtos cuja
+    listagem não mudou desde a última coleta e cujas especificações ainda são
+    recentes não têm a página de detalhe buscada e não são retornados, pois já
+    estão persistidos com os mesmos dados.
     """
 
     BASE_URL: str = "https://www.lojamaeto.com"
 
-    def __init__(self, http_client: IHttpClient) -> None:
+    def __init__(
+        self,
+        http_client: IHttpClient,
+        max_workers: int = 1,
+        repository: IProductRepository | None = None,
+        max_specs_age: timedelta | None = None,
+        parser: PageParser | None = None,
+        base_url: str | None = None,
+        metrics: IMetrics | None = None,
+    ) -> None:
         """
         Inicializa o scraper com um cliente HTTP.
 
         Args:
             http_client: Instância de IHttpClient para requisições web.
+            max_workers: Máximo de páginas de detalhe (ou de busca) buscadas
+                simultaneamente.
+            repository: Repositório consultado no modo incremental (opcional).
+            max_specs_age: Idade máxima das especificações persistidas antes de
+                serem coletadas novamente no modo incremental (opcional).
+            parser: Backend de parsing das páginas (opcional). Por padrão usa o
+                mais rápido instalado (selectolax, lxml ou html.parser).
+            base_url: Endereço do site (opcional). Por padrão, BASE_URL; útil
+                para apontar para um servidor local em benchmarks.
+            metrics: Destino das métricas de parsing e de falhas de extração
+                (opcional).
         """
+        InfrastructureError.when(
+            has_error=max_workers < 1,
+            message="max_workers deve ser maior ou igual a 1.",
+        )
         self._http_client: IHttpClient = http_client
+        self._max_workers: int = max_workers
+        self._repository: IProductRepository | None = repository
+        self._max_specs_age: timedelta | None = max_specs_age
+        self._parser: PageParser = parser or create_parser()
+        self._base_url: str = (base_url or self.BASE_URL).rstrip("/")
+        self._metrics: IMetrics | None = metrics
+
+    @staticmethod
+    def classify_url(url: str) -> str:
+        """
+        Classifica uma URL do site como página de busca ou de produto.
+
+        Args:
+            url: URL a ser classificada.
+
+        Returns:
+            "search" para páginas de busca e "product" para as demais.
+        """
+        return "search" if urlparse(url).path.startswith("/search") else "product"
 
     def _build_search_url(self, query: str, page: int = 1) -> str:
         """
@@ -38,12 +108,24 @@ class LojaMaetoScraper(IWebScraper):
         Returns:
             URL completa para busca.
         """
-        return f"{self.BASE_URL}/search?q={query}&page={page}"
+        return f"{self._base_url}/search?q={query}&page={page}"
 
     @override
     def scrape_products(self, query: str) -> Iterator["Product"]:
         """
-        Realiza scraping de produtos de forma síncrona.
+        Realiza scraping de produtos, buscando os detalhes em paralelo.
+
+        Quando a primeira página informa o total de páginas, as demais são
+        buscadas em paralelo, sem a requisição extra da página vazia; caso
+        contrário, são buscadas uma a uma até a primeira vazia. Os produtos são
+        retornados na mesma ordem em que aparecem na busca.
+
+        Páginas e produtos cuja requisição falha são informados e ignorados, e
+        a coleta continua; sem o total de páginas, uma página que falha encerra
+        a busca, pois não é possível saber se havia outras depois dela.
+
+        As páginas de busca e de detalhe compartilham as mesmas max_workers
+        threads, que são o limite de requisições simultâneas da coleta.
 
         Args:
             query: Termo de busca para coletar produtos.
@@ -51,218 +133,444 @@ class LojaMaetoScraper(IWebScraper):
         Returns:
             Iterator de objetos Product encontrados.
         """
-        page: int = 1
-        while True:
-            page_url: str = self._build_search_url(query, page)
-            try:
-                html: str = self._http_client.get(page_url)
-                soup: BeautifulSoup = BeautifulSoup(html, "html.parser")
-                itens: ResultSet[Tag] = soup.select("div.item")
-                if not itens:
+        html: str | None = self._try_fetch_search_page(query, 1)
+        if html is None:
+            return
+        listings: list[ProductListing] = self.parse_search_page(html)
+        if not listings:
+            return
+        page_count: int | None = self.count_search_pages(html, len(listings))
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            yield from self._scrape_details(listings, executor)
+            pages: Iterator[str | None] = (
+                self._fetch_search_pages(query, range(2, page_count + 1), executor)
+                if page_count is not None
+                else (self._try_fetch_search_page(query, number) for number in count(2))
+            )
+            for html in pages:
+                if html is None:
+                    # Sem o total de páginas, não há como saber se a busca acabou
+                    if page_count is None:
+                        break
+                    continue
+                listings = self.parse_search_page(html)
+                if not listings:
                     break
-                item: Tag
-                for item in itens:
-                    sku = self._extract_sku(item)
-                    product_title = self._extract_product_title(item)
-                    price = self._extract_price(item)
-                    price_pix = self._extract_price_pix(item)
-                    price_installments = self._extract_price_installments(item)
-                    installments_count = self._extract_installments_count(item)
-                    product_url = self._extract_product_url(item)
-                    specifications: dict[str, str] = {}
-                    if product_url:
-                        specifications = self.scrape_product_details(product_url)
-                    try:
-                        if not sku or not product_title:
-                            msg = "SKU ou título do produto ausente."
-                            raise ValueError(msg)
-                        yield Product(
-                            sku=sku,
-                            product_title=product_title,
-                            price=price,
-                            price_pix=price_pix,
-                            price_installments=price_installments,
-                            installments_count=installments_count,
-                            specifications=specifications,
-                        )
-                    except (InfrastructureError, TypeError) as e:
-                        error_msg: str = f"Erro ao processar item: {e}"
-                        print(error_msg)
-                        continue
-                page += 1
-            except InfrastructureError as e:
-                error_msg: str = f"Erro na página {page}: {e}"
-                print(error_msg)
-                break
-
-    def _extract_sku(self, item: Tag) -> str | None:
-        """
-        Extrai o SKU do produto do HTML.
+                yield from self._scrape_details(listings, executor)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _try_fetch_search_page(self, query: str, page: int) -> str | None:
+        """
+        Busca o HTML de uma página de resultados, informando a falha em vez de
+        lançá-la.
+
+        Args:
+            query: Termo de busca.
+            page: Número da página.
+
+        Returns:
+            Conteúdo HTML da página, ou None se a requisição falhou.
+        """
+        try:
+            return self.fetch_search_page(query, page)
+        except _FETCH_ERRORS as e:
+            error_msg: str = f"Erro na página {page}: {e}"
+            print(error_msg)
+            return None
+
+    def _fetch_search_pages(
+        self, query: str, pages: range, executor: ThreadPoolExecutor
+    ) -> Iterator[str | None]:
+        """
+        Busca as páginas de resultados em paralelo, com no máximo max_workers
+        páginas adiantadas, e as retorna em ordem.
 
         Args:
-            item: Tag HTML do produto.
+            query: Termo de busca.
+            pages: Números das páginas.
+            executor: Threads da coleta, compartilhadas com as páginas de
+                detalhe.
 
         Returns:
-            SKU do produto ou None.
+            Iterator do HTML de cada página, na ordem de pages, com None no
+            lugar das páginas que falharam.
+        """
+        numbers: Iterator[int] = iter(pages)
+        pending: deque[Future[str | None]] = deque(
+            executor.submit(self._try_fetch_search_page, query, number)
+            for number in islice(numbers, self._max_workers)
+        )
+        try:
+            while pending:
+                html: str | None = pending.popleft().result()
+                number: int | None = next(numbers, None)
+                if number is not None:
+                    pending.append(
+                        executor.submit(self._try_fetch_search_page, query, number)
+                    )
+                yield html
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @override
+    def search_page_url(self, query: str, page: int) -> str:
+        """
+        Retorna a URL de uma página de resultados.
+
+        Args:
+            query: Termo de busca.
+            page: Número da página, a partir de 1.
         """
-        product_div: Tag | None = item.select_one("div.product")
-        return str(product_div.get("data-sku")) if product_div else None
+        return self._build_search_url(query, page)
 
-    def _extract_product_title(self, item: Tag) -> str | None:
+    @override
+    def fetch_search_page(self, query: str, page: int) -> str:
         """
-        Extrai o título do produto do HTML.
+        Busca o HTML de uma página de resultados.
 
         Args:
-            item: Tag HTML do produto.
+            query: Termo de busca.
+            page: Número da página, a partir de 1.
 
         Returns:
-            Título do produto ou None.
+            Conteúdo HTML da página de busca.
         """
-        title_tag: Tag | None = item.select_one("h4.product-list-name a")
-        return title_tag.text.strip() if title_tag else None
+        return self._http_client.get(self._build_search_url(query, page))
 
-    def _extract_price(self, item: Tag) -> float:
+    @override
+    def count_search_pages(self, html: str, page_size: int) -> int | None:
         """
-        Extrai o preço padrão do produto do HTML.
+        Obtém o total de páginas pelos links da paginação ou pelo total de
+        resultados informado na primeira página.
 
         Args:
-            item: Tag HTML do produto.
+            html: Conteúdo HTML da primeira página de busca.
+            page_size: Quantidade de cards da primeira página.
 
         Returns:
-            Preço do produto.
+            Quantidade de páginas, ou None se a página não a informar.
         """
-        price_tag: Tag | None = item.select_one("div.price span.to-price")
-        price = price_tag.text.strip() if price_tag else None
-        return self._clean_to_float(price) if price else 0.0
+        return parse_page_count(html, page_size)
 
-    def _extract_price_pix(self, item: Tag) -> float:
+    @override
+    def parse_search_page(self, html: str) -> list[ProductListing]:
         """
-        Extrai o preço para pagamento via Pix do produto do HTML.
+        Extrai os cards de produto de uma página de resultados.
 
         Args:
-            item: Tag HTML do produto.
+            html: Conteúdo HTML da página de busca.
 
         Returns:
-            Preço para pagamento via Pix.
+            Lista de cards, na ordem da página. Vazia após a última página.
         """
-        price_tag: Tag | None = item.select_one(
-            "div.cash-payment-container span.to-price"
+        start: float = time.perf_counter()
+        listings: list[ProductListing] = self._parser.parse_listing(
+            html, self._base_url
         )
-        price = price_tag.text.strip() if price_tag else None
-        return self._clean_to_float(price) if price else 0.0
+        if self._metrics is not None:
+            self._metrics.observe(
+                "parse_seconds",
+                time.perf_counter() - start,
+                {"page_type": "search"},
+            )
+            self._count_missing_fields(listings)
+        return listings
+
+    def _count_missing_fields(self, listings: list[ProductListing]) -> None:
+        """
+        Conta, por campo, os cards em que a extração não encontrou valor.
+
+        Args:
+            listings: Cards de uma página de busca.
+        """
+        if self._metrics is None:
+            return
+        for listing in listings:
+            missing: dict[str, bool] = {
+                "sku": not listing.sku or listing.sku == "None",
+                "product_title": not listing.product_title,
+                "product_url": not listing.product_url,
+                "price": not listing.price,
+                "price_pix": not listing.price_pix,
+                "price_installments": not listing.price_installments,
+                "installments_count": not listing.installments_count,
+            }
+            for field_name, is_missing in missing.items():
+                if is_missing:
+                    self._metrics.increment(
+                        "extraction_failures_total", labels={"field": field_name}
+                    )
 
-    def _extract_price_installments(self, item: Tag) -> float:
+    @override
+    def scrape_listing_details(
+        self,
+        listings: list[ProductListing],
+        *,
+        on_fetch_error: Callable[[ProductListing, Exception], None] | None = None,
+    ) -> Iterator["Product"]:
         """
-        Extrai o valor da parcela do produto do HTML.
+        Busca em paralelo as páginas de detalhe dos cards e monta os produtos.
+
+        No modo incremental, os cards inalterados são descartados antes. Cards
+        sem SKU ou título são informados e descartados sem buscar a página de
+        detalhe. Produtos cuja página de detalhe não pôde ser lida são
+        informados, repassados a on_fetch_error e ignorados, sem interromper os
+        demais.
+
+        Args:
+            listings: Cards de uma página de busca.
+            on_fetch_error: Função chamada com o card e a exceção quando a
+                página de detalhe não pôde ser lida (opcional).
+
+        Returns:
+            Iterator de objetos Product, na ordem dos cards.
+        """
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            yield from self._scrape_details(listings, executor, on_fetch_error)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _scrape_details(
+        self,
+        listings: list[ProductListing],
+        executor: ThreadPoolExecutor,
+        on_fetch_error: Callable[[ProductListing, Exception], None] | None = None,
+    ) -> Iterator["Product"]:
+        """
+        Busca as páginas de detalhe dos cards nas threads informadas.
+
+        Args:
+            listings: Cards de uma página de busca.
+            executor: Threads que buscam as páginas de detalhe.
+            on_fetch_error: Função chamada com o card e a exceção quando a
+                página de detalhe não pôde ser lida (opcional).
+
+        Returns:
+            Iterator de objetos Product, na ordem dos cards.
+        """
+        listings = [
+            listing
+            for listing in self._skip_unchanged(listings)
+            if self._is_usable(listing)
+        ]
+        futures: list[Future[dict[str, str] | Exception]] = [
+            executor.submit(self._fetch_specifications, listing) for listing in listings
+        ]
+        try:
+            for listing, future in zip(listings, futures, strict=True):
+                specifications: dict[str, str] | Exception = future.result()
+                if isinstance(specifications, Exception):
+                    if on_fetch_error is not None:
+                        on_fetch_error(listing, specifications)
+                    continue
+                try:
+                    yield self._build_product(listing, specifications)
+                except (ValueError, TypeError) as e:
+                    self._report_unusable(e)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _is_usable(self, listing: ProductListing) -> bool:
+        """
+        Indica se o card tem os dados mínimos (SKU e título) para montar o
+        produto, informando e contando os que não têm.
+
+        Args:
+            listing: Dados do card do produto.
+        """
+        if listing.sku and listing.product_title:
+            return True
+        self._report_unusable(ValueError("SKU ou título do produto ausente."))
+        return False
+
+    def _report_unusable(self, error: Exception) -> None:
+        """
+        Informa e conta um card descartado por dados inválidos.
+
+        Args:
+            error: Motivo do descarte.
+        """
+        error_msg: str = f"Erro ao processar item: {error}"
+        print(error_msg)
+        if self._metrics is not None:
+            self._metrics.increment(
+                "extraction_failures_total", labels={"field": "item"}
+            )
+
+    @staticmethod
+    def _build_product(
+        listing: ProductListing, specifications: dict[str, str]
+    ) -> Product:
+        """
+        Monta o produto a partir do card e das especificações.
 
         Args:
-            item: Tag HTML do produto.
+            listing: Dados do card do produto.
+            specifications: Especificações do produto.
 
         Returns:
-            Valor da parcela.
+            Produto completo.
         """
-        price_tag: Tag | None = item.select_one(
-            "div.product-parcel span.installments-amount"
+        if not listing.sku or not listing.product_title:
+            msg = "SKU ou título do produto ausente."
+            raise ValueError(msg)
+        return Product(
+            sku=listing.sku,
+            product_title=listing.product_title,
+            price=listing.price,
+            price_pix=listing.price_pix,
+            price_installments=listing.price_installments,
+            installments_count=listing.installments_count,
+            specifications=specifications,
         )
-        price = price_tag.text.strip() if price_tag else None
-        return self._clean_to_float(price) if price else 0.0
 
-    def _extract_installments_count(self, item: Tag) -> int:
+    def _skip_unchanged(self, listings: list[ProductListing]) -> list[ProductListing]:
         """
-        Extrai a quantidade de parcelas do produto do HTML.
+        Remove os produtos que não precisam ser coletados novamente.
+
+        Fora do modo incremental, retorna a lista sem alterações.
 
         Args:
-            item: Tag HTML do produto.
+            listings: Dados dos cards de uma página de busca.
 
         Returns:
-            Quantidade de parcelas.
+            Cards cujos produtos precisam ter os detalhes coletados.
         """
-        installments_count_tag = item.select_one(
-            "div.product-parcel span.installments-number"
+        if self._repository is None:
+            return listings
+        states: dict[str, ListingState] = self._repository.get_listing_states(
+            listing.sku for listing in listings if listing.sku
+        )
+        now: datetime = datetime.now(UTC)
+        return [
+            listing for listing in listings if self._needs_details(listing, states, now)
+        ]
+
+    def _needs_details(
+        self, listing: ProductListing, states: dict[str, ListingState], now: datetime
+    ) -> bool:
+        """
+        Indica se o produto é novo, mudou na listagem ou tem especificações antigas.
+
+        Args:
+            listing: Dados do card do produto.
+            states: Estados persistidos, por SKU.
+            now: Momento atual (UTC).
+
+        Returns:
+            True se a página de detalhe deve ser buscada.
+        """
+        if not listing.sku or not listing.product_title:
+            return True
+        state: ListingState | None = states.get(listing.sku)
+        if state is None or state.specs_updated_at is None:
+            return True
+        fingerprint: str = Product(
+            sku=listing.sku,
+            product_title=listing.product_title,
+            price=listing.price,
+            price_pix=listing.price_pix,
+            price_installments=listing.price_installments,
+            installments_count=listing.installments_count,
+            specifications={},
+        ).listing_fingerprint()
+        if fingerprint != state.listing_fingerprint:
+            return True
+        return (
+            self._max_specs_age is not None
+            and now - state.specs_updated_at > self._max_specs_age
         )
-        if not installments_count_tag or not installments_count_tag.text:
-            return 0
-        installments_count_text: str = installments_count_tag.text.strip()
-        match = re.search(r"\d+", installments_count_text)
-        if match:
-            try:
-                return int(match.group())
-            except (ValueError, IndexError) as e:
-                print(
-                    f"Erro ao converter quantidade de parcelas para int: "
-                    f"'{installments_count_text}' - {e}"
-                )
-        return 0
 
-    def _clean_to_float(self, price_str: str) -> float:
+    def _fetch_specifications(
+        self, listing: ProductListing
+    ) -> dict[str, str] | Exception:
         """
-        Converte string de preço para float.
+        Busca as especificações do produto, quando houver URL de detalhe.
 
         Args:
-            price_str: String representando o preço.
+            listing: Dados do card do produto.
 
         Returns:
-            Valor do preço como float.
+            Dicionário com especificações do produto, ou a exceção da
+            requisição se a página de detalhe não pôde ser lida.
         """
+        if not listing.product_url:
+            return {}
         try:
-            price = re.findall(r"\d{1,3}(?:[.,]\d{3})*[.,]\d{2}", price_str)
-            return float(price[0].replace(".", "").replace(",", ".")) if price else 0.0
-        except (ValueError, IndexError) as e:
-            error_msg: str = f"Erro ao converter preço para float: {e}"
+            html: str = self._read_specifications_table(listing.product_url)
+        except (*_FETCH_ERRORS, ValueError) as e:
+            error_msg: str = (
+                f"Erro ao extrair especificações de {listing.product_url}: {e}"
+            )
             print(error_msg)
-            return 0.0
+            return e
+        return self._parse_specifications(html)
 
-    def _extract_product_url(self, item: Tag) -> str | None:
+    def _read_specifications_table(self, product_url: str) -> str:
         """
-        Extrai a URL do produto do HTML.
+        Lê a página do produto até o fim da tabela de especificações.
 
         Args:
-            item: Tag HTML do produto.
+            product_url: URL do produto.
 
         Returns:
-            URL do produto ou None.
+            HTML da tabela, ou string vazia se a página não a tiver.
         """
-        link_elem: Tag | None = item.select_one("h4.product-list-name a")
-        if not link_elem or not link_elem.get("href"):
-            return None
-        product_url: str = str(link_elem["href"])
-        if product_url.startswith("/"):
-            product_url = f"{self.BASE_URL}{product_url}"
-        return product_url
+        scanner = RegionScanner("table", element_id=SPECS_TABLE_ID, first_only=True)
+        with closing(self._http_client.stream(product_url)) as chunks:
+            for chunk in chunks:
+                if scanner.feed(chunk):
+                    break
+        return scanner.finish()
 
     @override
     def scrape_product_details(self, product_url: str) -> dict[str, str]:
         """
         Realiza scraping dos detalhes de um produto específico.
 
+        A página é lida aos poucos e só até o fim da tabela de especificações,
+        que é a única parte guardada em memória e enviada ao parser.
+
         Args:
             product_url: URL do produto a ser detalhado.
 
         Returns:
-            Dicionário com especificações detalhadas do produto.
+            Dicionário com especificações detalhadas do produto, vazio se a
+            página não pôde ser lida.
         """
         try:
-            html: str = self._http_client.get(product_url)
-        except ValueError as e:
+            html: str = self._read_specifications_table(product_url)
+        except (*_FETCH_ERRORS, ValueError) as e:
             error_msg: str = f"Erro ao extrair especificações de {product_url}: {e}"
             print(error_msg)
             return {}
-        soup: BeautifulSoup = BeautifulSoup(html, "html.parser")
-        specs_table: Tag | None = soup.select_one(
-            "table#product-description-table-attributes"
-        )
-        if not specs_table:
-            return {}
-        specs: dict[str, str] = {}
-        rows: ResultSet[Tag] = specs_table.select("tr")
-        row: Tag
-        for row in rows:
-            name_td: Tag | None = row.select_one("td.attribute-name")
-            value_td: Tag | None = row.select_one("td.attribute-value span")
-            if name_td and value_td:
-                name_text: str = name_td.get_text(strip=True)
-                value_text: str = value_td.get_text(strip=True)
-                # Só adicionar se ambos não estiverem vazios
-                if name_text and value_text:
-                    specs[name_text] = value_text
-        return specs
+        return self._parse_specifications(html)
+
+    def _parse_specifications(self, html: str) -> dict[str, str]:
+        """
+        Extrai as especificações da tabela e registra as métricas de parsing.
+
+        Args:
+            html: HTML da tabela de especificações.
+
+        Returns:
+            Dicionário com especificações do produto.
+        """
+        start: float = time.perf_counter()
+        specifications: dict[str, str] = self._parser.parse_specifications(html)
+        if self._metrics is not None:
+            self._metrics.observe(
+                "parse_seconds",
+                time.perf_counter() - start,
+                {"page_type": "product"},
+            )
+            if not specifications:
+                self._metrics.increment(
+                    "extraction_failures_total", labels={"field": "specifications"}
+                )
+        return specifications
@@ -0,0 +1,360 @@
+import gzip
+import hashlib
+import importlib.util
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Self, override
+
+from infrastructure.scrapper.http_client import BaseHttpClient, HttpResponse
+from infrastructure.validations import InfrastructureError
+
+HTTP_OK = 200
+HTTP_NOT_FOUND = 404
+
+ARCHIVE_CODECS: tuple[str, ...] = ("auto", "zstd", "gzip")
+
+# Níveis de compressão dos novos conteúdos
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 9
+
+_EXTENSIONS: dict[str, str] = {"zstd": ".zst", "gzip": ".gz"}
+
+
+@dataclass(frozen=True, slots=True)
+class ArchiveStats:
+    """
+    Contadores do arquivo de páginas.
+
+    Atributos:
+        pages: URLs arquivadas.
+        blobs: Conteúdos distintos armazenados.
+        size_bytes: Tamanho somado dos conteúdos distintos, sem compressão.
+        stored_bytes: Tamanho somado dos arquivos comprimidos.
+    """
+
+    pages: int
+    blobs: int
+    size_bytes: int
+    stored_bytes: int
+
+
+class PageArchive:
+    """
+    Arquivo comprimido do HTML das páginas coletadas, endereçado por conteúdo.
+
+    Cada conteúdo distinto é gravado uma única vez, comprimido com zstd (se o
+    pacote zstandard estiver instalado) ou gzip, em um arquivo nomeado pelo
+    seu SHA-256; páginas com o mesmo HTML, em URLs ou coletas diferentes,
+    compartilham o arquivo. Um índice SQLite no mesmo diretório associa cada
+    URL ao conteúdo da sua coleta mais recente.
+
+    Ao contrário do cache HTTP, nada é removido: o arquivo serve para refazer a
+    extração quando os seletores mudam, sem acessar o site.
+    """
+
+    def __init__(self, archive_dir: str | Path, codec: str = "auto") -> None:
+        """
+        Abre (ou cria) o arquivo de páginas.
+
+        Args:
+            archive_dir: Diretório dos conteúdos e do índice.
+            codec: Compressão dos novos conteúdos: "zstd", "gzip" ou "auto"
+                (zstd, se instalado). Os já gravados são lidos com a
+                compressão com que foram gravados.
+        """
+        InfrastructureError.when(
+            has_error=codec not in ARCHIVE_CODECS,
+            message=f"Compressão desconhecida: {codec}.",
+        )
+        zstd_available: bool = importlib.util.find_spec("zstandard") is not None
+        InfrastructureError.when(
+            has_error=codec == "zstd" and not zstd_available,
+            message="A compressão zstd requer o pacote zstandard.",
+        )
+        self._archive_dir: Path = Path(archive_dir)
+        self._archive_dir.mkdir(parents=True, exist_ok=True)
+        self._codec: str = (
+            codec if codec != "auto" else ("zstd" if zstd_available else "gzip")
+        )
+        self._lock: threading.Lock = threading.Lock()
+        self._conn: sqlite3.Connection = sqlite3.connect(
+            self._archive_dir / "index.sqlite", check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS blobs (
+                    digest TEXT PRIMARY KEY,
+                    codec TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_size INTEGER NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    url_class TEXT NOT NULL,
+                    digest TEXT NOT NULL REFERENCES blobs (digest),
+                    fetched_at REAL NOT NULL
+                )
+            """)
+
+    @property
+    def stats(self) -> ArchiveStats:
+        """
+        Retorna os contadores atuais do arquivo.
+        """
+        with self._lock:
+            pages: tuple[int] = self._conn.execute(
+                "SELECT COUNT(*) FROM pages"
+            ).fetchone()
+            blobs: tuple[int, int | None, int | None] = self._conn.execute(
+                "SELECT COUNT(*), SUM(size), SUM(stored_size) FROM blobs"
+            ).fetchone()
+        return ArchiveStats(
+            pages=pages[0],
+            blobs=blobs[0],
+            size_bytes=blobs[1] or 0,
+            stored_bytes=blobs[2] or 0,
+        )
+
+    def put(self, url: str, html: str, url_class: str = "default") -> str:
+        """
+        Arquiva o HTML de uma URL, gravando o conteúdo só se ele for novo.
+
+        Args:
+            url: URL da página.
+            html: Conteúdo da página.
+            url_class: Classe da URL (ex.: "search" ou "product").
+
+        Returns:
+            SHA-256 do conteúdo.
+        """
+        data: bytes = html.encode("utf-8")
+        digest: str = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            known: tuple[str] | None = self._conn.execute(
+                "SELECT codec FROM blobs WHERE digest = ?", (digest,)
+            ).fetchone()
+        if known is None:
+            stored_size: int = self._write_blob(digest, data)
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO blobs (digest, codec, size, stored_size) "
+                    "VALUES (?, ?, ?, ?)",
+                    (digest, self._codec, len(data), stored_size),
+                )
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO pages (url, url_class, digest, fetched_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    url_class = excluded.url_class,
+                    digest = excluded.digest,
+                    fetched_at = excluded.fetched_at
+                """,
+                (url, url_class, digest, time.time()),
+            )
+        return digest
+
+    def get(self, url: str) -> str | None:
+        """
+        Retorna o HTML arquivado de uma URL.
+
+        Args:
+            url: URL da página.
+
+        Returns:
+            Conteúdo da coleta mais recente, ou None se a URL não foi
+            arquivada.
+        """
+        with self._lock:
+            row: tuple[str, str] | None = self._conn.execute(
+                "SELECT pages.digest, blobs.codec FROM pages "
+                "JOIN blobs ON blobs.digest = pages.digest WHERE pages.url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        digest, codec = row
+        try:
+            compressed: bytes = self._blob_path(digest, codec).read_bytes()
+        except FileNotFoundError:
+            return None
+        return _decompress(compressed, codec).decode("utf-8")
+
+    def _blob_path(self, digest: str, codec: str) -> Path:
+        """
+        Retorna o caminho do arquivo do conteúdo, agrupado por prefixo do hash.
+
+        Args:
+            digest: SHA-256 do conteúdo.
+            codec: Compressão do conteúdo.
+        """
+        return self._archive_dir / digest[:2] / f"{digest}{_EXTENSIONS[codec]}"
+
+    def _write_blob(self, digest: str, data: bytes) -> int:
+        """
+        Comprime e grava o conteúdo de forma atômica.
+
+        Args:
+            digest: SHA-256 do conteúdo.
+            data: Conteúdo sem compressão.
+
+        Returns:
+            Tamanho do arquivo comprimido.
+        """
+        compressed: bytes = _compress(data, self._codec)
+        path: Path = self._blob_path(digest, self._codec)
+        path.parent.mkdir(exist_ok=True)
+        temporary_path: Path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        temporary_path.write_bytes(compressed)
+        temporary_path.replace(path)
+        return len(compressed)
+
+    def close(self) -> None:
+        """
+        Fecha o índice do arquivo.
+        """
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class ArchivingHttpClient(BaseHttpClient):
+    """
+    Decorador de cliente HTTP que arquiva o HTML das respostas 200.
+    """
+
+    def __init__(
+        self,
+        http_client: BaseHttpClient,
+        archive: PageArchive,
+        url_classifier: Callable[[str], str] | None = None,
+    ) -> None:
+        """
+        Inicializa o decorador sobre o cliente HTTP informado.
+
+        Args:
+            http_client: Cliente HTTP que busca as páginas.
+            archive: Arquivo onde as páginas são gravadas.
+            url_classifier: Função que retorna a classe de uma URL, gravada
+                no índice (opcional).
+        """
+        self._http_client: BaseHttpClient = http_client
+        self._archive: PageArchive = archive
+        self._url_classifier: Callable[[str], str] = url_classifier or (
+            lambda _url: "default"
+        )
+
+    @override
+    def fetch(self, url: str, headers: dict[str, str] | None = None) -> HttpResponse:
+        """
+        Busca a página e a arquiva, se a resposta for 200.
+
+        Args:
+            url: URL de destino da requisição.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Resposta HTTP completa.
+        """
+        response: HttpResponse = self._http_client.fetch(url, headers)
+        if response.status_code == HTTP_OK:
+            self._archive.put(url, response.text, self._url_classifier(url))
+        return response
+
+
+class ArchiveReplayHttpClient(BaseHttpClient):
+    """
+    Cliente HTTP que responde com as páginas arquivadas, sem acessar a rede.
+
+    URLs ausentes do arquivo recebem 404, como uma página inexistente no site.
+    """
+
+    def __init__(self, archive: PageArchive) -> None:
+        """
+        Inicializa o cliente sobre o arquivo informado.
+
+        Args:
+            archive: Arquivo de onde as páginas são lidas.
+        """
+        self._archive: PageArchive = archive
+        self._lock: threading.Lock = threading.Lock()
+        self._misses: int = 0
+
+    @property
+    def misses(self) -> int:
+        """
+        Quantidade de URLs pedidas que não estavam no arquivo.
+        """
+        with self._lock:
+            return self._misses
+
+    @override
+    def fetch(self, url: str, headers: dict[str, str] | None = None) -> HttpResponse:
+        """
+        Retorna a página arquivada da URL.
+
+        Args:
+            url: URL da página.
+            headers: Ignorados.
+
+        Returns:
+            Resposta 200 com o HTML arquivado, ou 404 se a URL não foi
+            arquivada.
+        """
+        html: str | None = self._archive.get(url)
+        if html is None:
+            with self._lock:
+                self._misses += 1
+            return HttpResponse(url=url, status_code=HTTP_NOT_FOUND, text="")
+        return HttpResponse(url=url, status_code=HTTP_OK, text=html)
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    """
+    Comprime o conteúdo com a compressão informada.
+
+    Args:
+        data: Conteúdo sem compressão.
+        codec: "zstd" ou "gzip".
+    """
+    if codec == "zstd":
+        import zstandard  # pyright: ignore[reportMissingImports]
+
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)  # pyright: ignore
+        return compressor.compress(data)  # pyright: ignore
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    """
+    Descomprime o conteúdo gravado com a compressão informada.
+
+    Args:
+        data: Conteúdo comprimido.
+        codec: "zstd" ou "gzip".
+    """
+    if codec == "zstd":
+        import zstandard  # pyright: ignore[reportMissingImports]
+
+        return zstandard.ZstdDecompressor().decompress(data)  # pyright: ignore
+    return gzip.decompress(data)
@@ -0,0 +1,502 @@
+import importlib.util
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import override
+
+from bs4 import BeautifulSoup, Tag
+from domain.models import ProductListing
+
+from infrastructure.scrapper.html_regions import extract_elements
+from infrastructure.validations import InfrastructureError
+
+
+@dataclass(frozen=True, slots=True)
+class _FieldRule:
+    """
+    Seletor pré-compilado no formato "ancestral elemento".
+
+    Ex.: "div.price span.to-price" vira _FieldRule("price", "span", "to-price",
+    "div", "price").
+    """
+
+    field: str
+    tag: str
+    css_class: str | None
+    ancestor_tag: str | None = None
+    ancestor_class: str | None = None
+
+
+# Seletores dos campos do card de produto (div.item)
+_LISTING_RULES: tuple[_FieldRule, ...] = (
+    _FieldRule("sku", "div", "product"),
+    _FieldRule("link", "a", None, "h4", "product-list-name"),
+    _FieldRule("price", "span", "to-price", "div", "price"),
+    _FieldRule("price_pix", "span", "to-price", "div", "cash-payment-container"),
+    _FieldRule(
+        "price_installments", "span", "installments-amount", "div", "product-parcel"
+    ),
+    _FieldRule(
+        "installments_count", "span", "installments-number", "div", "product-parcel"
+    ),
+)
+
+# Seletores das células de uma linha da tabela de especificações
+_SPEC_ROW_RULES: tuple[_FieldRule, ...] = (
+    _FieldRule("name", "td", "attribute-name"),
+    _FieldRule("value", "span", None, "td", "attribute-value"),
+)
+
+SPECS_TABLE_ID: str = "product-description-table-attributes"
+
+
+def clean_to_float(price_str: str) -> float:
+    """
+    Converte string de preço para float.
+
+    Args:
+        price_str: String representando o preço.
+
+    Returns:
+        Valor do preço como float.
+    """
+    try:
+        price = re.findall(r"\d{1,3}(?:[.,]\d{3})*[.,]\d{2}", price_str)
+        return float(price[0].replace(".", "").replace(",", ".")) if price else 0.0
+    except (ValueError, IndexError) as e:
+        error_msg: str = f"Erro ao converter preço para float: {e}"
+        print(error_msg)
+        return 0.0
+
+
+def parse_installments_count(installments_count_text: str) -> int:
+    """
+    Converte o texto da quantidade de parcelas (ex.: "10x") para int.
+
+    Args:
+        installments_count_text: Texto da quantidade de parcelas.
+
+    Returns:
+        Quantidade de parcelas, ou 0 se não houver número.
+    """
+    installments_count_text = installments_count_text.strip()
+    match = re.search(r"\d+", installments_count_text)
+    if match:
+        try:
+            return int(match.group())
+        except (ValueError, IndexError) as e:
+            print(
+                f"Erro ao converter quantidade de parcelas para int: "
+                f"'{installments_count_text}' - {e}"
+            )
+    return 0
+
+
+# Número da página nos links da paginação (ex.: "/search?q=mesa&amp;page=12")
+_PAGE_LINK = re.compile(r"[?&](?:amp;)?page=(\d+)")
+
+# Total de resultados informado na página (ex.: "1.234 produtos encontrados")
+_RESULT_COUNT = re.compile(
+    r"(\d{1,3}(?:\.\d{3})+|\d+)\s+(?:produtos?|resultados?|itens)\s+encontrad[oa]s?",
+    re.IGNORECASE,
+)
+
+
+def parse_page_count(html: str, page_size: int) -> int | None:
+    """
+    Obtém o total de páginas da busca a partir da primeira página.
+
+    Usa o maior número de página dos links da paginação (ul.pagination) ou,
+    na falta deles, o total de resultados informado na página dividido pela
+    quantidade de cards por página.
+
+    Args:
+        html: Conteúdo HTML da primeira página de busca.
+        page_size: Quantidade de cards da primeira página.
+
+    Returns:
+        Quantidade de páginas, ou None se a página não informar.
+    """
+    pagination: str = extract_elements(html, "ul", css_class="pagination")
+    pages: list[int] = [int(number) for number in _PAGE_LINK.findall(pagination)]
+    if pages:
+        return max(pages)
+    match = _RESULT_COUNT.search(html)
+    if match is None or page_size < 1:
+        return None
+    total: int = int(match.group(1).replace(".", ""))
+    return -(-total // page_size)
+
+
+class PageParser(ABC):
+    """
+    Interface dos parsers das páginas de busca e de produto da Loja Maeto.
+    """
+
+    @abstractmethod
+    def parse_listing(self, html: str, base_url: str) -> list[ProductListing]:
+        """
+        Extrai os cards de produto (div.item) de uma página de busca.
+
+        Args:
+            html: Conteúdo HTML da página de busca.
+            base_url: URL base usada para tornar absolutos os links relativos.
+
+        Returns:
+            Lista de cards, na ordem em que aparecem na página.
+        """
+        pass
+
+    @abstractmethod
+    def parse_specifications(self, html: str) -> dict[str, str]:
+        """
+        Extrai a tabela de especificações de uma página de produto.
+
+        Args:
+            html: Conteúdo HTML da página do produto.
+
+        Returns:
+            Dicionário com especificações detalhadas do produto.
+        """
+        pass
+
+
+class TreePageParser[NodeT](PageParser):
+    """
+    Base dos backends de parsing baseados em árvore DOM.
+
+    Cada backend expõe apenas as primitivas de navegação da sua árvore; a
+    extração dos campos é feita aqui, percorrendo cada card uma única vez e
+    comparando os nós com seletores pré-compilados.
+
+    No modo parcial, antes de construir a árvore o HTML é recortado para conter
+    apenas os cards (div.item) ou a tabela de especificações, de modo que o
+    custo de parsing acompanha o tamanho dos dados usados, não o da página.
+    Nesse modo, seletores cujo ancestral esteja fora do recorte não casam.
+    """
+
+    def __init__(self, *, partial: bool = False) -> None:
+        """
+        Inicializa o backend.
+
+        Args:
+            partial: Se True, constrói a árvore apenas das regiões usadas.
+        """
+        self._partial: bool = partial
+
+    @abstractmethod
+    def _parse(self, html: str) -> NodeT | None:
+        """
+        Constrói a árvore do documento e retorna o nó raiz.
+
+        Args:
+            html: Conteúdo HTML da página.
+        """
+        pass
+
+    @abstractmethod
+    def _descendants(self, node: NodeT) -> Iterator[NodeT]:
+        """
+        Percorre, em ordem de documento, os elementos descendentes do nó.
+
+        Args:
+            node: Nó de origem, que não é incluído.
+        """
+        pass
+
+    @abstractmethod
+    def _tag_name(self, node: NodeT) -> str:
+        """
+        Retorna o nome da tag do nó.
+        """
+        pass
+
+    @abstractmethod
+    def _classes(self, node: NodeT) -> list[str]:
+        """
+        Retorna as classes CSS do nó.
+        """
+        pass
+
+    @abstractmethod
+    def _attribute(self, node: NodeT, name: str) -> str | None:
+        """
+        Retorna o valor de um atributo do nó, ou None se ausente.
+        """
+        pass
+
+    @abstractmethod
+    def _parent(self, node: NodeT) -> NodeT | None:
+        """
+        Retorna o elemento pai do nó, ou None na raiz.
+        """
+        pass
+
+    @abstractmethod
+    def _text(self, node: NodeT) -> str:
+        """
+        Retorna todo o texto do nó, concatenado sem alterações.
+        """
+        pass
+
+    @abstractmethod
+    def _stripped_text(self, node: NodeT) -> str:
+        """
+        Retorna o texto do nó, com cada trecho sem espaços nas bordas.
+        """
+        pass
+
+    @override
+    def parse_listing(self, html: str, base_url: str) -> list[ProductListing]:
+        """
+        Extrai os cards de produto (div.item) de uma página de busca.
+
+        Args:
+            html: Conteúdo HTML da página de busca.
+            base_url: URL base usada para tornar absolutos os links relativos.
+
+        Returns:
+            Lista de cards, na ordem em que aparecem na página.
+        """
+        if self._partial:
+            html = extract_elements(html, "div", css_class="item")
+        root: NodeT | None = self._parse(html)
+        if root is None:
+            return []
+        return [
+            self._extract_listing_item(node, base_url)
+            for node in self._descendants(root)
+            if self._tag_name(node) == "div" and "item" in self._classes(node)
+        ]
+
+    @override
+    def parse_specifications(self, html: str) -> dict[str, str]:
+        """
+        Extrai a tabela de especificações de uma página de produto.
+
+        Args:
+            html: Conteúdo HTML da página do produto.
+
+        Returns:
+            Dicionário com especificações detalhadas do produto.
+        """
+        if self._partial:
+            html = extract_elements(
+                html, "table", element_id=SPECS_TABLE_ID, first_only=True
+            )
+        root: NodeT | None = self._parse(html)
+        if root is None:
+            return {}
+        specs_table: NodeT | None = next(
+            (
+                node
+                for node in self._descendants(root)
+                if self._tag_name(node) == "table"
+                and self._attribute(node, "id") == SPECS_TABLE_ID
+            ),
+            None,
+        )
+        if specs_table is None:
+            return {}
+        specs: dict[str, str] = {}
+        for row in self._descendants(specs_table):
+            if self._tag_name(row) != "tr":
+                continue
+            cells: dict[str, NodeT] = self._match(row, _SPEC_ROW_RULES)
+            if "name" in cells and "value" in cells:
+                name_text: str = self._stripped_text(cells["name"])
+                value_text: str = self._stripped_text(cells["value"])
+                # Só adicionar se ambos não estiverem vazios
+                if name_text and value_text:
+                    specs[name_text] = value_text
+        return specs
+
+    def _extract_listing_item(self, item: NodeT, base_url: str) -> ProductListing:
+        """
+        Extrai os campos de um card de produto em uma única travessia.
+
+        Args:
+            item: Nó div.item do produto.
+            base_url: URL base usada para tornar absolutos os links relativos.
+
+        Returns:
+            Dados do card do produto.
+        """
+        found: dict[str, NodeT] = self._match(item, _LISTING_RULES)
+        sku: str | None = (
+            str(self._attribute(found["sku"], "data-sku")) if "sku" in found else None
+        )
+        product_title: str | None = None
+        product_url: str | None = None
+        if "link" in found:
+            product_title = self._text(found["link"]).strip()
+            href: str | None = self._attribute(found["link"], "href")
+            if href:
+                product_url = f"{base_url}{href}" if href.startswith("/") else href
+        installments_count: int = 0
+        if "installments_count" in found:
+            installments_text: str = self._text(found["installments_count"])
+            if installments_text:
+                installments_count = parse_installments_count(installments_text)
+        return ProductListing(
+            sku=sku,
+            product_title=product_title,
+            price=self._price(found.get("price")),
+            price_pix=self._price(found.get("price_pix")),
+            price_installments=self._price(found.get("price_installments")),
+            installments_count=installments_count,
+            product_url=product_url,
+        )
+
+    def _price(self, node: NodeT | None) -> float:
+        """
+        Converte o texto de um nó de preço para float.
+
+        Args:
+            node: Nó com o preço, ou None.
+
+        Returns:
+            Preço, ou 0.0 se ausente.
+        """
+        price: str | None = self._text(node).strip() if node is not None else None
+        return clean_to_float(price) if price else 0.0
+
+    def _match(self, scope: NodeT, rules: tuple[_FieldRule, ...]) -> dict[str, NodeT]:
+        """
+        Percorre o escopo uma vez e retorna o primeiro nó de cada regra.
+
+        Args:
+            scope: Nó cujos descendentes são avaliados.
+            rules: Regras a aplicar.
+
+        Returns:
+            Dicionário de campo para o primeiro nó correspondente.
+        """
+        found: dict[str, NodeT] = {}
+        for node in self._descendants(scope):
+            tag_name: str = self._tag_name(node)
+            classes: list[str] | None = None
+            for rule in rules:
+                if rule.field in found or rule.tag != tag_name:
+                    continue
+                if rule.css_class is not None:
+                    if classes is None:
+                        classes = self._classes(node)
+                    if rule.css_class not in classes:
+                        continue
+                if rule.ancestor_tag is None or self._has_ancestor(node, rule):
+                    found[rule.field] = node
+            if len(found) == len(rules):
+                break
+        return found
+
+    def _has_ancestor(self, node: NodeT, rule: _FieldRule) -> bool:
+        """
+        Indica se algum ancestral do nó corresponde ao ancestral da regra.
+
+        Args:
+            node: Nó avaliado.
+            rule: Regra com o ancestral esperado.
+        """
+        parent: NodeT | None = self._parent(node)
+        while parent is not None:
+            if self._tag_name(parent) == rule.ancestor_tag and (
+                rule.ancestor_class is None
+                or rule.ancestor_class in self._classes(parent)
+            ):
+                return True
+            parent = self._parent(parent)
+        return False
+
+
+class BeautifulSoupParser(TreePageParser[Tag]):
+    """
+    Backend de parsing com BeautifulSoup ("html.parser" ou "lxml").
+    """
+
+    def __init__(self, features: str = "html.parser", *, partial: bool = False) -> None:
+        """
+        Inicializa o backend.
+
+        Args:
+            features: Construtor de árvore do BeautifulSoup.
+            partial: Se True, constrói a árvore apenas das regiões usadas.
+        """
+        super().__init__(partial=partial)
+        self._features: str = features
+
+    @override
+    def _parse(self, html: str) -> Tag | None:
+        return BeautifulSoup(html, self._features)
+
+    @override
+    def _descendants(self, node: Tag) -> Iterator[Tag]:
+        return (child for child in node.descendants if isinstance(child, Tag))
+
+    @override
+    def _tag_name(self, node: Tag) -> str:
+        return node.name
+
+    @override
+    def _classes(self, node: Tag) -> list[str]:
+        classes = node.get("class")
+        if classes is None:
+            return []
+        return classes.split() if isinstance(classes, str) else list(classes)
+
+    @override
+    def _attribute(self, node: Tag, name: str) -> str | None:
+        value = node.get(name)
+        if value is None or isinstance(value, str):
+            return value
+        return " ".join(value)
+
+    @override
+    def _parent(self, node: Tag) -> Tag | None:
+        return node.parent
+
+    @override
+    def _text(self, node: Tag) -> str:
+        return node.get_text()
+
+    @override
+    def _stripped_text(self, node: Tag) -> str:
+        return node.get_text(strip=True)
+
+
+PARSER_BACKENDS: tuple[str, ...] = ("auto", "selectolax", "lxml", "html.parser")
+
+
+def create_parser(backend: str = "auto", *, partial: bool = False) -> PageParser:
+    """
+    Cria o backend de parsing solicitado.
+
+    Com "auto", usa o mais rápido disponível: selectolax, lxml e, por fim, o
+    "html.parser" da biblioteca padrão.
+
+    Args:
+        backend: Um dos nomes em PARSER_BACKENDS.
+        partial: Se True, constrói a árvore apenas das regiões usadas.
+
+    Returns:
+        Instância do backend de parsing.
+    """
+    InfrastructureError.when(
+        has_error=backend not in PARSER_BACKENDS,
+        message=f"Backend de parsing desconhecido: {backend}",
+    )
+    if backend == "auto":
+        backend = next(
+            (
+                name
+                for name in ("selectolax", "lxml")
+                if importlib.util.find_spec(name) is not None
+            ),
+            "html.parser",
+        )
+    if backend == "selectolax":
+        from infrastructure.scrapper.selectolax_parser import SelectolaxParser
+
+        return SelectolaxParser(partial=partial)
+    return BeautifulSoupParser(backend, partial=partial)
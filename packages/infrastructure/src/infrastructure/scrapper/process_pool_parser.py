@@ -0,0 +1,143 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from types import TracebackType
+from typing import Self, override
+
+from domain.models import ProductListing
+
+from infrastructure.scrapper.parsers import PageParser, create_parser
+from infrastructure.validations import InfrastructureError
+
+# Parser de cada processo do pool, criado pelo inicializador
+_worker_parser: PageParser | None = None
+
+
+def _init_worker(backend: str, partial: bool) -> None:  # noqa: FBT001
+    """
+    Cria o parser do processo uma única vez, na inicialização do worker.
+
+    Args:
+        backend: Nome do backend de parsing.
+        partial: Se True, constrói a árvore apenas das regiões usadas.
+    """
+    global _worker_parser
+    _worker_parser = create_parser(backend, partial=partial)
+
+
+def _get_worker_parser() -> PageParser:
+    """
+    Retorna o parser do processo, criando-o se o inicializador não rodou.
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = create_parser()
+    return _worker_parser
+
+
+def _parse_listing(html: str, base_url: str) -> list[ProductListing]:
+    """
+    Extrai os cards de uma página de busca dentro do worker.
+
+    Args:
+        html: Conteúdo HTML da página de busca.
+        base_url: URL base usada para completar os links dos produtos.
+    """
+    return _get_worker_parser().parse_listing(html, base_url)
+
+
+def _parse_specifications(html: str) -> dict[str, str]:
+    """
+    Extrai as especificações de uma página de produto dentro do worker.
+
+    Args:
+        html: Conteúdo HTML da página de produto.
+    """
+    return _get_worker_parser().parse_specifications(html)
+
+
+class ProcessPoolPageParser(PageParser):
+    """
+    Parser que distribui o HTML entre processos para usar todos os núcleos.
+
+    Com o GIL, o parsing feito pelas threads de busca ocupa um único núcleo.
+    Aqui cada chamada envia o HTML bruto a um pool de processos, cada um com o
+    seu próprio backend de parsing, e aguarda o resultado. Os workers devolvem
+    apenas os dados extraídos (ProductListing e dicionários), nunca árvores, o
+    que mantém a serialização entre processos pequena. As chamadas bloqueiam a
+    thread chamadora, então o paralelismo vem de várias threads chamando ao
+    mesmo tempo, como fazem o pipeline e a busca de detalhes.
+    """
+
+    def __init__(
+        self,
+        backend: str = "auto",
+        *,
+        partial: bool = False,
+        max_workers: int | None = None,
+    ) -> None:
+        """
+        Inicializa o pool de processos.
+
+        Args:
+            backend: Backend de parsing usado pelos workers (ver PARSER_BACKENDS).
+            partial: Se True, constrói a árvore apenas das regiões usadas.
+            max_workers: Quantidade de processos. Por padrão, um por núcleo.
+        """
+        InfrastructureError.when(
+            has_error=max_workers is not None and max_workers < 1,
+            message="max_workers deve ser maior ou igual a 1.",
+        )
+        # Valida o backend no processo principal, antes de criar os workers
+        create_parser(backend, partial=partial)
+        self._executor: ProcessPoolExecutor = ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count() or 1,
+            # spawn: o processo principal já tem threads, o que torna fork inseguro
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(backend, partial),
+        )
+
+    @override
+    def parse_listing(self, html: str, base_url: str) -> list[ProductListing]:
+        """
+        Extrai os cards de produto de uma página de busca em um worker.
+
+        Args:
+            html: Conteúdo HTML da página de busca.
+            base_url: URL base usada para completar os links dos produtos.
+
+        Returns:
+            Lista de cards, na ordem da página.
+        """
+        return self._executor.submit(_parse_listing, html, base_url).result()
+
+    @override
+    def parse_specifications(self, html: str) -> dict[str, str]:
+        """
+        Extrai as especificações de uma página de produto em um worker.
+
+        Args:
+            html: Conteúdo HTML da página de produto.
+
+        Returns:
+            Dicionário com as especificações do produto.
+        """
+        return self._executor.submit(_parse_specifications, html).result()
+
+    def close(self) -> None:
+        """
+        Encerra os processos do pool.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,561 @@
+import threading
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import override
+from urllib.parse import urlparse
+
+from domain.interfaces import IMetrics
+
+from infrastructure.scrapper.http_client import (
+    CURRENT_TICKET,
+    AdmissionTicket,
+    BaseHttpClient,
+    HttpResponse,
+    HttpStream,
+)
+from infrastructure.validations import InfrastructureError, RequestCancelledError
+
+# Status que indicam que o servidor está limitando as requisições
+THROTTLE_STATUS_CODES: frozenset[int] = frozenset({429, 503})
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """
+    Converte o cabeçalho Retry-After em segundos de espera.
+
+    Aceita tanto a forma em segundos ("120") quanto a data HTTP
+    ("Wed, 21 Oct 2026 07:28:00 GMT").
+
+    Args:
+        value: Valor do cabeçalho, ou None.
+        now: Momento atual (timestamp), usado com a forma de data (opcional).
+
+    Returns:
+        Segundos de espera (nunca negativos), ou None se ausente ou inválido.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at: datetime = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    current: float = time.time() if now is None else now
+    return max(retry_at.timestamp() - current, 0.0)
+
+
+class _HostLimiter:
+    """
+    Limites de um host: token bucket de taxa e concorrência adaptativa (AIMD).
+
+    A cada resposta saudável, a concorrência cresce 1/limite (cerca de +1 por
+    "janela" de requisições, como no controle de congestionamento do TCP) e a
+    taxa cresce rate_increase requisições/s por segundo decorrido. Respostas
+    429/503 ou latência acima de latency_factor vezes a linha de base (média
+    móvel das latências) reduzem ambas multiplicativamente, no máximo uma vez
+    por decrease_cooldown segundos.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_concurrency: float,
+        min_concurrency: float,
+        max_concurrency: float,
+        initial_rate: float,
+        min_rate: float,
+        max_rate: float,
+        rate_increase: float,
+        decrease_factor: float,
+        latency_factor: float,
+        decrease_cooldown: float,
+    ) -> None:
+        """
+        Inicializa os limites do host.
+
+        Args:
+            initial_concurrency: Requisições simultâneas iniciais.
+            min_concurrency: Mínimo de requisições simultâneas.
+            max_concurrency: Máximo de requisições simultâneas.
+            initial_rate: Requisições por segundo iniciais.
+            min_rate: Mínimo de requisições por segundo.
+            max_rate: Máximo de requisições por segundo.
+            rate_increase: Aumento da taxa, em requisições/s, por segundo sem
+                sinais de sobrecarga.
+            decrease_factor: Fator aplicado aos limites em cada redução.
+            latency_factor: Múltiplo da latência de base considerado lento.
+            decrease_cooldown: Intervalo mínimo, em segundos, entre reduções.
+        """
+        self.concurrency: float = initial_concurrency
+        self.rate: float = initial_rate
+        self.in_flight: int = 0
+        self.blocked_until: float = 0.0
+        self.baseline_latency: float | None = None
+        self._min_concurrency: float = min_concurrency
+        self._max_concurrency: float = max_concurrency
+        self._min_rate: float = min_rate
+        self._max_rate: float = max_rate
+        self._rate_increase: float = rate_increase
+        self._decrease_factor: float = decrease_factor
+        self._latency_factor: float = latency_factor
+        self._decrease_cooldown: float = decrease_cooldown
+        self._tokens: float = 1.0
+        self._refilled_at: float = time.monotonic()
+        self._decreased_at: float = 0.0
+        self._increased_at: float = time.monotonic()
+        self.condition: threading.Condition = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        """
+        Repõe os tokens proporcionalmente ao tempo decorrido.
+
+        Deve ser chamado com a condição adquirida.
+
+        Args:
+            now: Momento atual (monotônico).
+        """
+        capacity: float = max(self.rate, 1.0)
+        self._tokens = min(
+            capacity, self._tokens + (now - self._refilled_at) * self.rate
+        )
+        self._refilled_at = now
+
+    def wait_time(self, now: float) -> float:
+        """
+        Retorna quanto falta para uma nova requisição poder começar.
+
+        Deve ser chamado com a condição adquirida. Zero indica que pode
+        começar já; infinito, que depende do término de outra requisição.
+
+        Args:
+            now: Momento atual (monotônico).
+        """
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.in_flight >= int(self.concurrency):
+            return float("inf")
+        self._refill(now)
+        if self._tokens >= 1.0:
+            return 0.0
+        return (1.0 - self._tokens) / self.rate
+
+    def start(self) -> None:
+        """
+        Consome um token e ocupa uma vaga de concorrência.
+
+        Deve ser chamado com a condição adquirida, após wait_time retornar 0.
+        """
+        self._tokens -= 1.0
+        self.in_flight += 1
+
+    def finish(self, latency: float | None, *, throttled: bool) -> str | None:
+        """
+        Libera a vaga e ajusta os limites conforme o resultado.
+
+        Deve ser chamado com a condição adquirida.
+
+        Args:
+            latency: Duração da requisição, em segundos, ou None se ela falhou
+                sem resposta (os limites não são alterados).
+            throttled: Se o servidor respondeu 429/503.
+
+        Returns:
+            Motivo da redução ("throttled" ou "latency"), ou None se os limites
+            não foram reduzidos.
+        """
+        self.in_flight -= 1
+        if latency is None:
+            return None
+        now: float = time.monotonic()
+        reason: str | None = None
+        baseline: float | None = self.baseline_latency
+        if throttled:
+            reason = "throttled"
+        else:
+            if baseline is not None and latency > baseline * self._latency_factor:
+                reason = "latency"
+            # Média móvel exponencial: uma lentidão persistente vira a nova base
+            self.baseline_latency = (
+                latency if baseline is None else 0.9 * baseline + 0.1 * latency
+            )
+        if reason is None:
+            self.concurrency = min(
+                self._max_concurrency, self.concurrency + 1.0 / self.concurrency
+            )
+            self.rate = min(
+                self._max_rate,
+                self.rate + self._rate_increase * (now - self._increased_at),
+            )
+            self._increased_at = now
+            return None
+        if now - self._decreased_at < self._decrease_cooldown:
+            return None
+        self._decreased_at = now
+        self.concurrency = max(
+            self._min_concurrency, self.concurrency * self._decrease_factor
+        )
+        self.rate = max(self._min_rate, self.rate * self._decrease_factor)
+        self._increased_at = now
+        return reason
+
+
+class RateLimitedHttpClient(BaseHttpClient):
+    """
+    Decorador de cliente HTTP com limitação de taxa e de concorrência por host.
+
+    Cada host tem um token bucket (requisições por segundo) e um limite de
+    requisições simultâneas, ajustados por AIMD: crescem aditivamente enquanto
+    as respostas são rápidas e bem-sucedidas e caem multiplicativamente em
+    respostas 429/503 ou quando a latência sobe. O cabeçalho Retry-After
+    bloqueia novas requisições ao host até o prazo informado, e as respostas
+    limitadas são repetidas após a espera. O cliente decorado não deve repetir
+    429/503 por conta própria, senão o limitador não as percebe.
+
+    A espera por vaga é registrada na tentativa da thread (CURRENT_TICKET),
+    quando houver, para que decoradores acima descontem do prazo o tempo
+    aguardado localmente; uma tentativa cancelada durante a espera falha com
+    RequestCancelledError, sem ocupar vaga.
+    """
+
+    def __init__(
+        self,
+        http_client: BaseHttpClient,
+        *,
+        initial_concurrency: int = 4,
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        initial_rate: float = 10.0,
+        min_rate: float = 0.5,
+        max_rate: float = 200.0,
+        rate_increase: float = 5.0,
+        decrease_factor: float = 0.5,
+        latency_factor: float = 3.0,
+        decrease_cooldown: float = 1.0,
+        max_retries: int = 3,
+        default_retry_after: float = 1.0,
+        metrics: IMetrics | None = None,
+    ) -> None:
+        """
+        Inicializa o limitador sobre o cliente HTTP informado.
+
+        Args:
+            http_client: Cliente HTTP que executa as requisições.
+            initial_concurrency: Requisições simultâneas iniciais por host.
+            min_concurrency: Mínimo de requisições simultâneas por host.
+            max_concurrency: Máximo de requisições simultâneas por host.
+            initial_rate: Requisições por segundo iniciais por host.
+            min_rate: Mínimo de requisições por segundo por host.
+            max_rate: Máximo de requisições por segundo por host.
+            rate_increase: Aumento da taxa, em requisições/s, por segundo sem
+                sinais de sobrecarga.
+            decrease_factor: Fator (entre 0 e 1) aplicado aos limites a cada
+                redução.
+            latency_factor: Múltiplo da latência de base a partir do qual a
+                resposta é considerada lenta.
+            decrease_cooldown: Intervalo mínimo, em segundos, entre reduções.
+            max_retries: Novas tentativas após respostas 429/503.
+            default_retry_after: Espera, em segundos, quando a resposta
+                limitada não traz Retry-After.
+            metrics: Destino das métricas dos limites (opcional).
+        """
+        InfrastructureError.when(
+            has_error=not 1
+            <= min_concurrency
+            <= initial_concurrency
+            <= max_concurrency,
+            message="Os limites de concorrência devem ser 1 <= mín <= inicial <= máx.",
+        )
+        InfrastructureError.when(
+            has_error=not 0 < min_rate <= initial_rate <= max_rate,
+            message="Os limites de taxa devem ser 0 < mín <= inicial <= máx.",
+        )
+        InfrastructureError.when(
+            has_error=not 0 < decrease_factor < 1,
+            message="decrease_factor deve estar entre 0 e 1.",
+        )
+        self._http_client: BaseHttpClient = http_client
+        self._limiter_options: dict[str, float] = {
+            "initial_concurrency": initial_concurrency,
+            "min_concurrency": min_concurrency,
+            "max_concurrency": max_concurrency,
+            "initial_rate": initial_rate,
+            "min_rate": min_rate,
+            "max_rate": max_rate,
+            "rate_increase": rate_increase,
+            "decrease_factor": decrease_factor,
+            "latency_factor": latency_factor,
+            "decrease_cooldown": decrease_cooldown,
+        }
+        self._max_retries: int = max_retries
+        self._default_retry_after: float = default_retry_after
+        self._metrics: IMetrics | None = metrics
+        self._hosts: dict[str, _HostLimiter] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def limits(self) -> dict[str, tuple[float, float]]:
+        """
+        Retorna os limites atuais de cada host.
+
+        Returns:
+            Dicionário de host para (concorrência, requisições por segundo).
+        """
+        with self._lock:
+            hosts: dict[str, _HostLimiter] = dict(self._hosts)
+        result: dict[str, tuple[float, float]] = {}
+        for host, limiter in hosts.items():
+            with limiter.condition:
+                result[host] = (limiter.concurrency, limiter.rate)
+        return result
+
+    def _limiter(self, host: str) -> _HostLimiter:
+        """
+        Retorna os limites do host, criando-os na primeira requisição.
+
+        Args:
+            host: Host (com porta) da URL.
+        """
+        with self._lock:
+            limiter: _HostLimiter | None = self._hosts.get(host)
+            if limiter is None:
+                limiter = self._hosts[host] = _HostLimiter(**self._limiter_options)
+            return limiter
+
+    @override
+    def fetch(self, url: str, headers: dict[str, str] | None = None) -> HttpResponse:
+        """
+        Realiza a requisição respeitando os limites do host.
+
+        Respostas 429/503 reduzem os limites e são repetidas após a espera
+        indicada por Retry-After, até max_retries vezes.
+
+        Args:
+            url: URL de destino da requisição.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Resposta HTTP completa (a última, se as tentativas se esgotarem).
+
+        Raises:
+            RequestCancelledError: Se a tentativa for cancelada enquanto
+                aguarda vaga.
+        """
+        host: str = urlparse(url).netloc
+        limiter: _HostLimiter = self._limiter(host)
+        attempt: int = 0
+        while True:
+            self._acquire(host, limiter)
+            start: float = time.monotonic()
+            try:
+                response: HttpResponse = self._http_client.fetch(url, headers)
+            except BaseException:
+                self._release(host, limiter, None, throttled=False, retry_after=None)
+                raise
+            throttled: bool = response.status_code in THROTTLE_STATUS_CODES
+            if not throttled:
+                self._respond()
+            self._release(
+                host,
+                limiter,
+                time.monotonic() - start,
+                throttled=throttled,
+                retry_after=self._retry_after(response) if throttled else None,
+            )
+            if not throttled or attempt >= self._max_retries:
+                return response
+            attempt += 1
+
+    @override
+    def open(self, url: str, headers: dict[str, str] | None = None) -> HttpStream:
+        """
+        Abre a resposta respeitando os limites do host.
+
+        A vaga da requisição fica ocupada até a resposta ser fechada, e a
+        latência considerada pelo ajuste dos limites vai até esse momento.
+        Respostas 429/503 são fechadas e repetidas como em fetch.
+
+        Args:
+            url: URL de destino da requisição.
+            headers: Cabeçalhos personalizados para a requisição (opcional).
+
+        Returns:
+            Resposta HTTP, que deve ser fechada após o uso.
+
+        Raises:
+            RequestCancelledError: Se a tentativa for cancelada enquanto
+                aguarda vaga.
+        """
+        host: str = urlparse(url).netloc
+        limiter: _HostLimiter = self._limiter(host)
+        attempt: int = 0
+        while True:
+            self._acquire(host, limiter)
+            start: float = time.monotonic()
+            try:
+                response: HttpStream = self._http_client.open(url, headers)
+            except BaseException:
+                self._release(host, limiter, None, throttled=False, retry_after=None)
+                raise
+            throttled: bool = response.status_code in THROTTLE_STATUS_CODES
+            if throttled and attempt < self._max_retries:
+                response.close()
+                self._release(
+                    host,
+                    limiter,
+                    time.monotonic() - start,
+                    throttled=True,
+                    retry_after=self._retry_after(response),
+                )
+                attempt += 1
+                continue
+            self._respond()
+            return self._hold(host, limiter, response, start)
+
+    def _hold(
+        self, host: str, limiter: _HostLimiter, response: HttpStream, start: float
+    ) -> HttpStream:
+        """
+        Envolve a resposta para que a vaga do host seja liberada ao fechá-la.
+
+        Args:
+            host: Host da URL.
+            limiter: Limites do host.
+            response: Resposta aberta.
+            start: Início da requisição (time.monotonic).
+
+        Returns:
+            Resposta HTTP, que deve ser fechada após o uso.
+        """
+        throttled: bool = response.status_code in THROTTLE_STATUS_CODES
+
+        def close() -> None:
+            try:
+                response.close()
+            finally:
+                self._release(
+                    host,
+                    limiter,
+                    time.monotonic() - start,
+                    throttled=throttled,
+                    retry_after=self._retry_after(response) if throttled else None,
+                )
+
+        return HttpStream(
+            response.url,
+            response.status_code,
+            response.iter_text(),
+            response.headers,
+            on_close=close,
+        )
+
+    def _retry_after(self, response: HttpResponse | HttpStream) -> float:
+        """
+        Retorna a espera pedida por uma resposta limitada.
+
+        Args:
+            response: Resposta 429/503.
+        """
+        retry_after: float | None = parse_retry_after(
+            response.headers.get("retry-after")
+        )
+        return self._default_retry_after if retry_after is None else retry_after
+
+    def _acquire(self, host: str, limiter: _HostLimiter) -> None:
+        """
+        Aguarda até que o host aceite uma nova requisição.
+
+        Args:
+            host: Host da URL.
+            limiter: Limites do host.
+
+        Raises:
+            RequestCancelledError: Se a tentativa da thread for cancelada antes
+                de obter a vaga.
+        """
+        ticket: AdmissionTicket | None = CURRENT_TICKET.get()
+        start: float = time.monotonic()
+        with limiter.condition:
+            while ticket is None or not ticket.cancelled:
+                wait: float = limiter.wait_time(time.monotonic())
+                if wait <= 0:
+                    break
+                if ticket is not None and not ticket.waiting:
+                    ticket.wait(lambda: self._wake(limiter))
+                limiter.condition.wait(None if wait == float("inf") else wait)
+            if ticket is not None and not ticket.admit():
+                msg: str = f"Requisição cancelada antes de obter vaga em {host}"
+                raise RequestCancelledError(msg)
+            limiter.start()
+            in_flight: int = limiter.in_flight
+        if self._metrics is not None:
+            self._metrics.observe(
+                "rate_limit_wait_seconds", time.monotonic() - start, {"host": host}
+            )
+            self._metrics.set_gauge("rate_limit_in_flight", in_flight, {"host": host})
+
+    @staticmethod
+    def _respond() -> None:
+        """
+        Avisa a tentativa da thread, se houver, de que o servidor respondeu.
+        """
+        ticket: AdmissionTicket | None = CURRENT_TICKET.get()
+        if ticket is not None:
+            ticket.respond()
+
+    @staticmethod
+    def _wake(limiter: _HostLimiter) -> None:
+        """
+        Acorda as requisições que aguardam vaga no host, para que as
+        canceladas desistam.
+
+        Args:
+            limiter: Limites do host.
+        """
+        with limiter.condition:
+            limiter.condition.notify_all()
+
+    def _release(
+        self,
+        host: str,
+        limiter: _HostLimiter,
+        latency: float | None,
+        *,
+        throttled: bool,
+        retry_after: float | None,
+    ) -> None:
+        """
+        Libera a vaga da requisição, ajusta os limites e acorda quem espera.
+
+        Args:
+            host: Host da URL.
+            limiter: Limites do host.
+            latency: Duração da requisição, em segundos, ou None se ela falhou.
+            throttled: Se o servidor respondeu 429/503.
+            retry_after: Espera pedida pelo servidor, em segundos (opcional).
+        """
+        with limiter.condition:
+            reason: str | None = limiter.finish(latency, throttled=throttled)
+            if retry_after is not None:
+                limiter.blocked_until = max(
+                    limiter.blocked_until, time.monotonic() + retry_after
+                )
+            limiter.condition.notify_all()
+            concurrency: float = limiter.concurrency
+            rate: float = limiter.rate
+            in_flight: int = limiter.in_flight
+        if self._metrics is None:
+            return
+        labels: dict[str, str] = {"host": host}
+        self._metrics.set_gauge("rate_limit_concurrency", concurrency, labels)
+        self._metrics.set_gauge("rate_limit_requests_per_second", rate, labels)
+        self._metrics.set_gauge("rate_limit_in_flight", in_flight, labels)
+        if reason is not None:
+            self._metrics.increment(
+                "rate_limit_decreases_total", labels={"host": host, "reason": reason}
+            )
+        if retry_after is not None:
+            self._metrics.increment("rate_limit_throttled_total", labels=labels)
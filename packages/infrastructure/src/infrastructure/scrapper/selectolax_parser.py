@@ -0,0 +1,52 @@
+from collections.abc import Iterator
+from typing import override
+
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+from infrastructure.scrapper.parsers import TreePageParser
+
+
+class SelectolaxParser(TreePageParser[LexborNode]):
+    """
+    Backend de parsing com selectolax (motor Lexbor).
+
+    Requer o pacote opcional selectolax.
+    """
+
+    @override
+    def _parse(self, html: str) -> LexborNode | None:
+        return LexborHTMLParser(html).root
+
+    @override
+    def _descendants(self, node: LexborNode) -> Iterator[LexborNode]:
+        nodes: Iterator[LexborNode] = node.traverse(include_text=False)
+        next(nodes, None)
+        # Comentários e doctype aparecem como tags iniciadas por "-" ou "!"
+        return (child for child in nodes if (child.tag or "-")[0].isalpha())
+
+    @override
+    def _tag_name(self, node: LexborNode) -> str:
+        return node.tag or ""
+
+    @override
+    def _classes(self, node: LexborNode) -> list[str]:
+        return (node.attributes.get("class") or "").split()
+
+    @override
+    def _attribute(self, node: LexborNode, name: str) -> str | None:
+        attributes: dict[str, str | None] = node.attributes
+        if name not in attributes:
+            return None
+        return attributes[name] or ""
+
+    @override
+    def _parent(self, node: LexborNode) -> LexborNode | None:
+        return node.parent
+
+    @override
+    def _text(self, node: LexborNode) -> str:
+        return node.text(deep=True)
+
+    @override
+    def _stripped_text(self, node: LexborNode) -> str:
+        return node.text(deep=True, strip=True)
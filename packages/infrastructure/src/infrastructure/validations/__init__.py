@@ -1,3 +1,3 @@
-from .exceptions import InfrastructureError
+from .exceptions import InfrastructureError, RequestCancelledError
 
-__all__ = ["InfrastructureError"]
+__all__ = ["InfrastructureError", "RequestCancelledError"]
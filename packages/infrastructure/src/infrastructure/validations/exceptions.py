@@ -6,3 +6,10 @@ class InfrastructureError(Exception):
     def when(cls, *, has_error: bool, message: str) -> None:
         if has_error:
             raise cls(message)
+
+
+class RequestCancelledError(InfrastructureError):
+    """
+    Requisição cancelada enquanto aguardava vaga em um limitador local, antes
+    de chegar ao servidor.
+    """
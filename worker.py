@@ -0,0 +1,226 @@
+import argparse
+import os
+import socket
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from application.services import CrawlWorkerService
+from domain.validations.exceptions import DomainValidationError
+from infrastructure.repositories import SqliteProductRepository, SqliteWorkQueue
+from infrastructure.scrapper import (
+    CircuitBreakerHttpClient,
+    HedgedHttpClient,
+    LojaMaetoScraper,
+    RateLimitedHttpClient,
+    RequestsHttpClient,
+)
+from infrastructure.validations.exceptions import InfrastructureError
+
+from main import (
+    CIRCUIT_BREAKER_FAILURES,
+    CIRCUIT_BREAKER_MAX_RESET,
+    CIRCUIT_BREAKER_MAX_WAIT,
+    CIRCUIT_BREAKER_RESET,
+    HEDGE_MAX_RATIO,
+    HEDGE_PERCENTILE,
+    HTTP_DEADLINES,
+    read_queries,
+)
+
+if TYPE_CHECKING:
+    from application.interfaces import ICrawlWorker
+    from domain.interfaces import IHttpClient, IWebScraper
+
+VERDE = "\033[32m"
+AMARELO = "\033[33m"
+VERMELHO = "\033[31m"
+RESET = "\033[0m"
+CINZA = "\033[2m"
+
+# Tarefas processadas simultaneamente por worker
+DEFAULT_CONCURRENCY = 8
+
+# Prazo, em segundos, da reserva de uma tarefa; um worker que morre tem suas
+# tarefas retomadas pelos demais após esse prazo
+DEFAULT_LEASE_SECONDS = 60.0
+
+# Tentativas de cada tarefa antes de marcá-la como failed
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Limites por host ajustados automaticamente (AIMD), por worker
+RATE_LIMIT_INITIAL_CONCURRENCY = 4
+RATE_LIMIT_MAX_CONCURRENCY = DEFAULT_CONCURRENCY
+RATE_LIMIT_INITIAL_RATE = 10.0
+RATE_LIMIT_MAX_RATE = 100.0
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Lê os argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Worker da coleta distribuída: processa as tarefas da fila "
+            "compartilhada e grava os produtos no banco informado em "
+            "--products-db."
+        )
+    )
+    parser.add_argument(
+        "search_queries",
+        nargs="*",
+        metavar="search_query",
+        help="Termos de busca a enfileirar antes de começar.",
+    )
+    parser.add_argument(
+        "--queries-file",
+        metavar="ARQUIVO",
+        help="Arquivo com um termo de busca por linha (# inicia comentários).",
+    )
+    parser.add_argument(
+        "--queue-db",
+        default="crawl_queue.db",
+        metavar="ARQUIVO",
+        help="Banco SQLite da fila, compartilhado pelos workers.",
+    )
+    parser.add_argument(
+        "--products-db",
+        default="products.db",
+        metavar="ARQUIVO",
+        help=(
+            "Banco SQLite onde os produtos são gravados; aponte todos os "
+            "workers para o mesmo arquivo para reunir os resultados."
+        ),
+    )
+    parser.add_argument(
+        "--worker-id",
+        default=f"{socket.gethostname()}-{os.getpid()}",
+        help="Identificador do worker (padrão: máquina e PID).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        metavar="N",
+        help="Tarefas processadas simultaneamente.",
+    )
+    parser.add_argument(
+        "--lease",
+        type=float,
+        default=DEFAULT_LEASE_SECONDS,
+        metavar="SEGUNDOS",
+        help="Prazo da reserva de uma tarefa, renovado enquanto é processada.",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=DEFAULT_MAX_ATTEMPTS,
+        metavar="N",
+        help="Tentativas de cada tarefa antes de desistir dela.",
+    )
+    parser.add_argument(
+        "--new-crawl",
+        action="store_true",
+        help=(
+            "Inicia uma nova coleta com os termos informados, abandonando as "
+            "tarefas restantes da atual (por padrão, uma nova coleta só é "
+            "iniciada quando a atual termina)."
+        ),
+    )
+    parser.add_argument(
+        "--no-wal",
+        action="store_true",
+        help=(
+            "Não usa journal em WAL na fila nem no banco de produtos "
+            "(necessário em volumes de rede)."
+        ),
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Enfileira os termos informados e processa a fila até esvaziá-la."""
+    arguments: argparse.Namespace = parse_arguments()
+    try:
+        search_queries: list[str] = read_queries(arguments)
+    except OSError as error:
+        print(f"{VERMELHO}Erro ao ler o arquivo de termos: {error}{RESET}")
+        return
+
+    try:
+        with (
+            RequestsHttpClient(
+                pool_size=2 * arguments.concurrency,
+                retry_status_codes=(500, 502, 504),
+            ) as requests_client,
+            SqliteWorkQueue(
+                arguments.queue_db,
+                max_attempts=arguments.max_attempts,
+                wal=not arguments.no_wal,
+            ) as queue,
+            SqliteProductRepository(
+                arguments.products_db, wal=not arguments.no_wal
+            ) as repository,
+        ):
+            http_client: IHttpClient = CircuitBreakerHttpClient(
+                HedgedHttpClient(
+                    RateLimitedHttpClient(
+                        requests_client,
+                        initial_concurrency=RATE_LIMIT_INITIAL_CONCURRENCY,
+                        max_concurrency=max(
+                            RATE_LIMIT_MAX_CONCURRENCY, arguments.concurrency
+                        ),
+                        initial_rate=RATE_LIMIT_INITIAL_RATE,
+                        max_rate=RATE_LIMIT_MAX_RATE,
+                    ),
+                    hedge_percentile=HEDGE_PERCENTILE,
+                    max_hedge_ratio=HEDGE_MAX_RATIO,
+                    deadline_by_class=HTTP_DEADLINES,
+                    url_classifier=LojaMaetoScraper.classify_url,
+                    max_workers=2 * arguments.concurrency,
+                ),
+                failure_threshold=CIRCUIT_BREAKER_FAILURES,
+                reset_timeout=CIRCUIT_BREAKER_RESET,
+                max_reset_timeout=CIRCUIT_BREAKER_MAX_RESET,
+                max_wait=CIRCUIT_BREAKER_MAX_WAIT,
+            )
+            scraper: IWebScraper = LojaMaetoScraper(http_client, max_workers=1)
+            worker: ICrawlWorker = CrawlWorkerService(
+                queue,
+                scraper,
+                repository,
+                worker_id=arguments.worker_id,
+                concurrency=arguments.concurrency,
+                lease=timedelta(seconds=arguments.lease),
+            )
+
+            if search_queries:
+                added: int = worker.seed(search_queries, new_crawl=arguments.new_crawl)
+                print(f"{CINZA}   {added} termos enfileirados{RESET}")
+                if added < len(search_queries):
+                    print(
+                        f"{CINZA}   Os demais já estão na coleta em andamento; "
+                        f"use --new-crawl para recomeçá-la{RESET}"
+                    )
+            print(f"{VERDE}Worker {arguments.worker_id} iniciado{RESET}")
+            print("=" * 70)
+            completed: int = worker.run()
+            counts: dict[str, int] = queue.counts()
+
+        print("=" * 70)
+        print(f"{VERDE}Fila concluída: {completed} tarefas por este worker{RESET}")
+        if worker.skipped:
+            print(
+                f"{CINZA}   {worker.skipped} produtos ignorados por falta de SKU "
+                f"ou título no card{RESET}"
+            )
+        if counts["failed"]:
+            print(f"{AMARELO}   {counts['failed']} tarefas falharam{RESET}")
+
+    except KeyboardInterrupt:
+        print(f"\n{AMARELO}  Worker interrompido pelo usuário{RESET}")
+        print(f"{CINZA}   Tarefas não iniciadas foram devolvidas à fila{RESET}")
+
+    except (InfrastructureError, DomainValidationError) as error:
+        print(f"{VERMELHO}Erro no worker: {error}{RESET}")
+
+
+if __name__ == "__main__":
+    main()